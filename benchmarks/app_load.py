@@ -0,0 +1,269 @@
+"""
+Load-test the app in-process: interaction latency, throughput and peak memory as concurrent users rise.
+
+Each simulated user opens sessions of app/streamlit_app.py with the
+fragment-aware AppTest harness from benchmarks.interactions and clicks
+through them the way a visitor does:
+- load the page;
+- step through years;
+- press REWIND;
+- move the events slider.
+Every user follows its own seeded random walk, so runs are repeatable.
+Users run as threads in this process, as sessions do in one Streamlit
+server process, and share its caches.
+
+After one warm-up session, every concurrency level reports:
+- latency percentiles per interaction kind;
+- interactions per second;
+- peak RSS while the level ran.
+Results are written as JSON with the commit they were measured on.
+--baseline compares a run with an earlier results file and exits non-zero
+when the overall p95 latency or the throughput of a level regresses by more
+than --tolerance. Per-kind p95s are printed too, but they rest on few
+samples and are not checked.
+
+    python -m benchmarks.app_load --levels 1,2,4,8 --sessions 3 --steps 12
+    python -m benchmarks.app_load --baseline benchmarks/results/app_load-<commit>.json
+"""
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import sys
+import threading
+import time
+
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.interactions import FragmentAppTest
+from benchmarks.results import RESULTS_DIR, git_commit
+
+QUANTILES = {"p50": 0.50, "p95": 0.95, "p99": 0.99}
+
+
+def _rewind(at: AppTest):
+    return next(b for b in at.button if "REWIND" in b.label).click()
+
+
+def next_interaction(rng: random.Random, at: AppTest) -> Tuple[str, Callable[[AppTest], object]]:
+    """
+    Pick a visitor's next interaction from what the page currently shows.
+
+    Before a reveal, visitors mostly press REWIND and sometimes step to
+    another year first; once the year is revealed, they mostly move the
+    events slider or step on to a neighbouring year.
+
+    Returns:
+        (kind, interaction) where kind is "navigate", "reveal" or "slider".
+    """
+    roll = rng.random()
+    if not at.slider:
+        if roll < 0.6:
+            return "reveal", _rewind
+    elif roll < 0.55:
+        slider = at.slider[0]
+        value = rng.randint(slider.min, slider.max)
+        return "slider", lambda at: at.slider[0].set_value(value)
+    key = "prev" if rng.random() < 0.7 else "next"
+    return "navigate", lambda at: at.button(key=key).click()
+
+
+def user(seed: int, sessions: int, steps: int, samples: List[Tuple[str, float]], errors: List[str]) -> None:
+    """Run one simulated user's sessions, appending (kind, ms) per interaction and any failures."""
+    rng = random.Random(seed)
+    for _ in range(sessions):
+        try:
+            harness = FragmentAppTest(timing=False)
+            samples.append(("load", harness.step()["ms"]))
+            for _ in range(steps):
+                kind, interact = next_interaction(rng, harness.at)
+                samples.append((kind, harness.step(interact)["ms"]))
+            errors.extend(str(exc.message) for exc in harness.at.exception)
+        except Exception as exc:
+            errors.append(f"{type(exc).__name__}: {exc}")
+
+
+class RssSampler:
+    """
+    Highest resident set size of this process while in use, sampled from /proc/self/status.
+
+    Falls back to the process's lifetime peak (getrusage) where /proc is not available.
+
+    Args:
+        interval: Seconds between samples.
+    """
+
+    def __init__(self, interval: float = 0.02) -> None:
+        self.interval = interval
+        self.peak_kb = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def rss_kb() -> Optional[int]:
+        """Return the current VmRSS in kB, None without /proc."""
+        try:
+            with open("/proc/self/status") as status:
+                for line in status:
+                    if line.startswith("VmRSS:"):
+                        return int(line.split()[1])
+        except OSError:
+            pass
+        return None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak_kb = max(self.peak_kb, self.rss_kb() or 0)
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "RssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        if not self.peak_kb:
+            # ru_maxrss is in kB on Linux and bytes on macOS.
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            self.peak_kb = maxrss // 1024 if sys.platform == "darwin" else maxrss
+
+
+def latency_stats(values: List[float]) -> Dict[str, float]:
+    """Return count, p50, p95, p99 and max of latencies in ms (nearest rank, as src.timing does)."""
+    values = sorted(values)
+    stats = {"count": len(values)}
+    for name, q in QUANTILES.items():
+        stats[name] = round(values[min(len(values) - 1, int(q * len(values)))], 2)
+    stats["max"] = round(values[-1], 2)
+    return stats
+
+
+def run_level(users: int, sessions: int, steps: int, seed: int) -> Dict:
+    """Run users concurrent simulated users and summarize latency, throughput and peak RSS."""
+    samples: List[Tuple[str, float]] = []
+    errors: List[str] = []
+    threads = [
+        threading.Thread(target=user, args=(seed + i, sessions, steps, samples, errors), name=f"user-{i}")
+        for i in range(users)
+    ]
+    with RssSampler() as rss:
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        seconds = time.perf_counter() - start
+
+    by_kind: Dict[str, List[float]] = {}
+    for kind, ms in samples:
+        by_kind.setdefault(kind, []).append(ms)
+    latency = {kind: latency_stats(values) for kind, values in sorted(by_kind.items())}
+    if samples:
+        latency["all"] = latency_stats([ms for _, ms in samples])
+    return {
+        "users": users,
+        "interactions": len(samples),
+        "seconds": round(seconds, 3),
+        "throughput": round(len(samples) / seconds, 2),
+        "peak_rss_mb": round(rss.peak_kb / 1024, 1),
+        "errors": errors,
+        "latency_ms": latency,
+    }
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Print p95 latencies and throughput against a baseline run, level by level.
+
+    Args:
+        results: This run's results.
+        baseline: An earlier results file's contents.
+        tolerance: Allowed relative slowdown (0.2 = 20%).
+
+    Returns:
+        Descriptions of the overall p95 and throughput regressions beyond tolerance.
+    """
+    regressions = []
+    old_levels = {level["users"]: level for level in baseline["levels"]}
+    print(f"\nvs {baseline['commit']}{' (dirty)' if baseline.get('dirty') else ''} ({baseline['timestamp']})")
+    print(f"{'users':>5s} {'kind':9s} {'p95 ms':>9s} {'was':>9s} {'change':>7s}")
+    for level in results["levels"]:
+        old = old_levels.get(level["users"])
+        if old is None:
+            continue
+        rows = [(kind, stats["p95"], old["latency_ms"][kind]["p95"])
+                for kind, stats in level["latency_ms"].items() if kind in old["latency_ms"]]
+        rows.append(("req/s", level["throughput"], old["throughput"]))
+        for kind, new, was in rows:
+            change = new / was - 1 if was else 0.0
+            print(f"{level['users']:5d} {kind:9s} {new:9.1f} {was:9.1f} {change:+7.0%}")
+            worse = -change if kind == "req/s" else change
+            if kind in ("all", "req/s") and worse > tolerance:
+                regressions.append(f"{level['users']} users {kind}: {was:.1f} -> {new:.1f}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", default="1,2,4,8", help="Comma-separated concurrent user counts.")
+    parser.add_argument("--sessions", type=int, default=3, help="Page loads per user.")
+    parser.add_argument("--steps", type=int, default=12, help="Interactions per session after the load.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Results file (default: benchmarks/results/app_load-<commit>.json).")
+    parser.add_argument("--baseline", type=Path, help="Earlier results file to compare with.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p95/throughput regression vs --baseline.")
+    args = parser.parse_args()
+    levels = [int(n) for n in args.levels.split(",")]
+
+    warm_up: List[Tuple[str, float]] = []
+    warm_errors: List[str] = []
+    user(args.seed, 1, args.steps, warm_up, warm_errors)
+    if warm_errors:
+        raise SystemExit(f"Warm-up session failed: {warm_errors[0]}")
+    print(f"warm-up: first load {warm_up[0][1]:.0f} ms (builds the app's caches)")
+
+    commit, dirty = git_commit()
+    results = {
+        "commit": commit,
+        "dirty": dirty,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "cpus": os.cpu_count(),
+        "sessions": args.sessions,
+        "steps": args.steps,
+        "seed": args.seed,
+        "cold_load_ms": round(warm_up[0][1], 2),
+        "levels": [],
+    }
+
+    print(f"{'users':>5s} {'req/s':>7s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} {'peak RSS MB':>12s} {'errors':>7s}  p95 by kind")
+    for users in levels:
+        level = run_level(users, args.sessions, args.steps, args.seed + 1000 * users)
+        results["levels"].append(level)
+        stats = level["latency_ms"]["all"]
+        kinds = ", ".join(f"{kind} {s['p95']:.0f}" for kind, s in level["latency_ms"].items() if kind != "all")
+        print(
+            f"{users:5d} {level['throughput']:7.1f} {stats['p50']:8.1f} {stats['p95']:8.1f} {stats['p99']:8.1f} "
+            f"{level['peak_rss_mb']:12.1f} {len(level['errors']):7d}  {kinds}"
+        )
+
+    output = args.output or RESULTS_DIR / f"app_load-{commit}{'-dirty' if dirty else ''}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + "\n")
+    print(f"results: {output}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        if regressions:
+            raise SystemExit("Regressed beyond tolerance:\n" + "\n".join(regressions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Measure the box office chart's payload: one data copy per frame vs the axis-reveal frames.
+
+Builds the figure both ways for the real year range and for wider synthetic
+ranges (the real yearly totals repeated across the years), and reports the
+JSON size st.plotly_chart sends to each browser, plus build time.
+
+    python -m benchmarks.chart_payload --ranges 1985-2015,1950-2025,1900-2025
+"""
+from typing import Tuple
+import argparse
+import time
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from src.charts import box_office_figure
+from src.snapshot import load_tables
+
+
+def prefix_frames_figure(yearly_stats: pd.DataFrame) -> go.Figure:
+    """The chart as the app built it before: frame i holds a copy of the first i + 1 years."""
+    df_yearly_stats = yearly_stats.sort_values("year")
+    frames_data = []
+    for i in range(2, len(df_yearly_stats) + 1):
+        temp_df = df_yearly_stats.iloc[:i].copy()
+        temp_df['frame'] = i - 1
+        frames_data.append(temp_df)
+    df_animated = pd.concat(frames_data, ignore_index=True)
+    fig = px.line(
+        df_animated,
+        x='year',
+        y='total_box_office',
+        animation_frame='frame',
+        range_x=[df_yearly_stats['year'].min(), df_yearly_stats['year'].max()],
+        range_y=[0, df_yearly_stats['total_box_office'].max() * 1.1]
+    )
+    fig.update_traces(line=dict(color='#00FFFF', width=3), marker=dict(size=8, color='#00FFFF'))
+    fig.update_layout(height=320, paper_bgcolor='rgba(0,0,0,0.45)', plot_bgcolor='rgba(0,0,0,0)', showlegend=False)
+    fig.layout.updatemenus[0].buttons[0].args[1]['frame']['duration'] = 150
+    fig.layout.updatemenus[0].buttons[0].args[1]['transition']['duration'] = 100
+    return fig
+
+
+def stats_for(yearly_stats: pd.DataFrame, first: int, last: int) -> pd.DataFrame:
+    """Yearly totals for first..last, cycling through the real totals."""
+    totals = yearly_stats.sort_values("year")["total_box_office"].to_numpy()
+    years = range(first, last + 1)
+    return pd.DataFrame({"year": list(years), "total_box_office": [totals[i % len(totals)] for i in range(len(years))]})
+
+
+def measure(build, stats: pd.DataFrame) -> Tuple[int, int, float]:
+    """Return (JSON bytes, frames, build + serialize ms)."""
+    start = time.perf_counter()
+    fig = build(stats)
+    payload = fig.to_json()
+    return len(payload.encode("utf-8")), len(fig.frames), (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ranges", default="1985-2015,1950-2025,1900-2025")
+    args = parser.parse_args()
+
+    yearly_stats = load_tables()["analytics_yearly_stats"]
+    print(f"{'years':>10s} {'n':>4s} {'frames':>7s} {'copies KB':>10s} {'reveal KB':>10s} {'ratio':>6s} {'copies ms':>10s} {'reveal ms':>10s}")
+    for span in args.ranges.split(","):
+        first, last = (int(year) for year in span.split("-"))
+        stats = stats_for(yearly_stats, first, last)
+        copies_bytes, frames, copies_ms = measure(prefix_frames_figure, stats)
+        reveal_bytes, _, reveal_ms = measure(box_office_figure, stats)
+        print(
+            f"{span:>10s} {len(stats):4d} {frames:7d} {copies_bytes / 1e3:10.1f} {reveal_bytes / 1e3:10.1f} "
+            f"{copies_bytes / reveal_bytes:6.1f} {copies_ms:10.1f} {reveal_ms:10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
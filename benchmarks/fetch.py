@@ -0,0 +1,63 @@
+"""
+Compare sequential and concurrent page downloads against a local stand-in server.
+
+Serves the cached pages in data/html (populate them by running
+scripts/download_data.py with HTML_CACHE_ENABLED = True) and adds a fixed
+per-request delay to mimic the round trip to Wikipedia.
+
+    python -m benchmarks.fetch --latency 0.3
+"""
+from pathlib import Path
+import argparse
+import time
+
+import requests
+
+from benchmarks.fixture_server import serve_directory
+from config import FETCH_BURST_PER_HOST, FETCH_MAX_PER_HOST, FETCH_MAX_WORKERS, FETCH_RATE_PER_HOST, HTML_DIR
+from src.fetch import HostLimiter, fetch_concurrently
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--html-dir", type=Path, default=HTML_DIR)
+    parser.add_argument("--latency", type=float, default=0.3, help="Simulated seconds per request.")
+    parser.add_argument("--workers", type=int, default=FETCH_MAX_WORKERS)
+    parser.add_argument("--per-host", type=int, default=FETCH_MAX_PER_HOST)
+    parser.add_argument("--rate", type=float, default=FETCH_RATE_PER_HOST)
+    parser.add_argument("--burst", type=int, default=FETCH_BURST_PER_HOST)
+    args = parser.parse_args()
+
+    pages = sorted({p.name.removesuffix(".gz") for p in args.html_dir.glob("*.html*")})
+    if not pages:
+        raise SystemExit(f"No cached pages in {args.html_dir}; run the download with HTML_CACHE_ENABLED = True first.")
+
+    with serve_directory(args.html_dir, args.latency) as base_url:
+        urls = [f"{base_url}/{name}" for name in pages]
+
+        start = time.perf_counter()
+        for url in urls:
+            requests.get(url, timeout=15).raise_for_status()
+        sequential = time.perf_counter() - start
+
+        limiter = HostLimiter(args.per_host, args.rate, args.burst)
+
+        def fetch(url: str) -> str:
+            with limiter.slot(url):
+                resp = requests.get(url, timeout=15)
+            resp.raise_for_status()
+            return resp.text
+
+        start = time.perf_counter()
+        for _ in fetch_concurrently(urls, fetch, args.workers):
+            pass
+        concurrent = time.perf_counter() - start
+
+    print(f"pages:      {len(urls)}")
+    print(f"sequential: {sequential:.2f}s")
+    print(f"concurrent: {concurrent:.2f}s (workers={args.workers}, per_host={args.per_host}, rate={args.rate}/s, burst={args.burst})")
+    print(f"speedup:    {sequential / concurrent:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
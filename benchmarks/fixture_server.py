@@ -0,0 +1,378 @@
+from contextlib import contextmanager
+from email.utils import formatdate, parsedate_to_datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import gzip
+import hashlib
+import json
+import re
+import threading
+import time
+
+
+@contextmanager
+def _serve(handler_cls: type, **attrs) -> Iterator[Tuple[str, type]]:
+    """
+    Run a threaded HTTP server on a free localhost port for the duration of the block.
+
+    Args:
+        handler_cls: Request handler class; a subclass with attrs set is served,
+            so per-server state (scripts, recorded traffic) is not shared.
+        **attrs: Class attributes of the subclass.
+
+    Returns:
+        (base URL without trailing slash, handler subclass).
+    """
+    handler = type("Handler", (handler_cls,), attrs)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", handler
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    """
+    Serve files from a fixture directory after an artificial delay.
+
+    A request for page.html is answered from page.html.gz when only the
+    compressed copy exists (the layout written by the HTML cache). Those
+    pages carry an ETag (hash of the stored file) and Last-Modified (its
+    mtime), each switchable off, and conditional requests get 304s:
+    If-None-Match is checked first and, when sent, decides alone, as in
+    RFC 9110. Each such reply is kept in replies as (status, request headers).
+    """
+
+    root = "."
+    latency = 0.0
+    etags = True
+    last_modified = True
+    replies: List[Tuple[int, Dict[str, str]]] = []
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, directory=self.root, **kwargs)
+
+    def do_GET(self) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        path = Path(self.translate_path(self.path))
+        gz = path.with_name(path.name + ".gz")
+        if path.exists() or not gz.exists():
+            super().do_GET()
+            return
+
+        stored = gz.read_bytes()
+        mtime = int(gz.stat().st_mtime)
+        etag = f'"{hashlib.sha256(stored).hexdigest()[:16]}"'
+        match = self.headers.get("If-None-Match")
+        since = self.headers.get("If-Modified-Since")
+        if self.etags and match is not None:
+            not_modified = etag in (tag.strip() for tag in match.split(",")) or match.strip() == "*"
+        elif self.last_modified and since:
+            try:
+                not_modified = parsedate_to_datetime(since).timestamp() >= mtime
+            except (TypeError, ValueError):
+                not_modified = False
+        else:
+            not_modified = False
+
+        status = HTTPStatus.NOT_MODIFIED if not_modified else HTTPStatus.OK
+        self.replies.append((status, dict(self.headers)))
+        body = b"" if not_modified else gzip.decompress(stored)
+        self.send_response(status)
+        if self.etags:
+            self.send_header("ETag", etag)
+        if self.last_modified:
+            self.send_header("Last-Modified", formatdate(mtime, usegmt=True))
+        if status == HTTPStatus.OK:
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@contextmanager
+def serve_directory(directory: Path, latency: float = 0.0) -> Iterator[str]:
+    """
+    Serve a directory over HTTP on localhost for the duration of the block.
+
+    Args:
+        directory: Directory whose files are served at the server root.
+        latency: Seconds to wait before answering each request (simulated RTT).
+
+    Returns:
+        Base URL of the server, without trailing slash.
+    """
+    with serve_cached_pages(directory, latency) as (base_url, _):
+        yield base_url
+
+
+@contextmanager
+def serve_cached_pages(
+    directory: Path, latency: float = 0.0, etags: bool = True, last_modified: bool = True,
+) -> Iterator[Tuple[str, type]]:
+    """
+    Serve a directory laid out as the HTML cache, with switchable validators.
+
+    Args:
+        directory: Directory whose files are served at the server root.
+        latency: Seconds to wait before answering each request (simulated RTT).
+        etags: Send ETags and honour If-None-Match.
+        last_modified: Send Last-Modified and honour If-Modified-Since.
+
+    Returns:
+        (base URL, handler class); the handler's replies record each cached-layout answer.
+    """
+    with _serve(
+        FixtureHandler, root=str(directory), latency=latency, etags=etags, last_modified=last_modified, replies=[],
+    ) as served:
+        yield served
+
+
+# Scripted reply: (status, extra headers), or "drop" to close the connection without answering.
+Fault = Tuple[int, dict] | str
+
+
+class FaultHandler(BaseHTTPRequestHandler):
+    """
+    Answer every GET with the next scripted fault, then 200 OK once the script is used up.
+
+    Speaks HTTP/1.1 with keep-alive, and records each request's client port so
+    callers can check that connections are reused.
+    """
+
+    protocol_version = "HTTP/1.1"
+    script: List[Fault] = []
+    ports: Set[int] = set()
+    hits: List[str] = []
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:
+        with self.lock:
+            self.hits.append(self.path)
+            self.ports.add(self.client_address[1])
+            fault = self.script.pop(0) if self.script else (HTTPStatus.OK, {})
+        if fault == "drop":
+            self.close_connection = True
+            self.connection.shutdown(2)
+            return
+        status, headers = fault
+        body = f"{int(status)} {self.path}".encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@contextmanager
+def serve_faults(script: Sequence[Fault] = ()) -> Iterator[Tuple[str, type]]:
+    """
+    Run a local server that replays scripted failures before answering normally.
+
+    Args:
+        script: Replies for the first requests, in order, e.g.
+            [(503, {}), (429, {"Retry-After": "1"}), "drop"].
+
+    Returns:
+        (base URL, handler class); the handler's hits and ports record the traffic.
+    """
+    with _serve(FaultHandler, script=list(script), ports=set(), hits=[], lock=threading.Lock()) as served:
+        yield served
+
+
+# Canned wiki page: {} for an article, {"redirect": title} or {"disambiguation": True}.
+WikiPage = Dict[str, object]
+
+
+class WikiApiHandler(BaseHTTPRequestHandler):
+    """
+    Answer MediaWiki action=query requests (formatversion=2) from canned pages.
+
+    Titles are normalized as the API does (underscores to spaces, first letter
+    upper-cased), redirects are followed once, disambiguation pages carry the
+    disambiguation page property and unknown titles come back missing. As on
+    Wikipedia, only the first 50 titles of a request are answered. Each
+    request's titles are kept in calls.
+    """
+
+    protocol_version = "HTTP/1.1"
+    pages: Dict[str, WikiPage] = {}
+    calls: List[List[str]] = []
+    lock = threading.Lock()
+    max_titles = 50
+
+    def do_GET(self) -> None:
+        params = dict(parse_qsl(urlsplit(self.path).query, keep_blank_values=True))
+        titles = params.get("titles", "").split("|")
+        with self.lock:
+            self.calls.append(titles)
+        query: Dict[str, list] = {"normalized": [], "redirects": [], "pages": []}
+        reply: Dict[str, object] = {"batchcomplete": True, "query": query}
+        if len(titles) > self.max_titles:
+            reply["warnings"] = {"query": {"warnings": f"Too many values supplied for parameter \"titles\". "
+                                                       f"The limit is {self.max_titles}."}}
+            titles = titles[:self.max_titles]
+        seen = set()
+        for title in titles:
+            name = title.replace("_", " ").strip()
+            name = name[:1].upper() + name[1:]
+            if name != title:
+                query["normalized"].append({"fromencoded": False, "from": title, "to": name})
+            page = self.pages.get(name)
+            if page is not None and "redirect" in page:
+                query["redirects"].append({"from": name, "to": page["redirect"]})
+                name = page["redirect"]
+                page = self.pages.get(name)
+            if name in seen:
+                continue
+            seen.add(name)
+            if page is None:
+                query["pages"].append({"ns": 0, "title": name, "missing": True})
+            elif page.get("disambiguation"):
+                query["pages"].append({"pageid": len(seen), "ns": 0, "title": name, "pageprops": {"disambiguation": ""}})
+            else:
+                query["pages"].append({"pageid": len(seen), "ns": 0, "title": name})
+
+        body = json.dumps(reply).encode("utf-8")
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@contextmanager
+def serve_wiki_api(pages: Dict[str, WikiPage]) -> Iterator[Tuple[str, type]]:
+    """
+    Run a stand-in MediaWiki query API on localhost for the duration of the block.
+
+    Args:
+        pages: Title (with spaces) -> canned page.
+
+    Returns:
+        (base URL, handler class); the handler's calls lists the titles of each request.
+    """
+    with _serve(WikiApiHandler, pages=dict(pages), calls=[], lock=threading.Lock()) as served:
+        yield served
+
+
+def request_key(target: str) -> str:
+    """Return the replay key of a URL or request target: its path and its query pairs in sorted order."""
+    parts = urlsplit(target)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return parts.path + (f"?{query}" if query else "")
+
+
+class Recording:
+    """
+    HTTP responses recorded to a directory: gzip bodies plus manifest.json keyed by request_key().
+
+    Args:
+        directory: Recording directory; an existing manifest is loaded.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.responses: Dict[str, Dict] = {}
+        self.meta: Dict = {}
+        self._lock = threading.Lock()
+        manifest = directory / "manifest.json"
+        if manifest.exists():
+            data = json.loads(manifest.read_text(encoding="utf-8"))
+            self.responses = data["responses"]
+            self.meta = {k: v for k, v in data.items() if k != "responses"}
+
+    def add(self, url: str, status: int, content_type: str, body: bytes) -> None:
+        """Store one response under the key of the URL it was requested with."""
+        key = request_key(url)
+        slug = re.sub(r"[^A-Za-z0-9._-]+", "_", urlsplit(url).path.rsplit("/", 1)[-1])[:80]
+        name = f"{slug}-{hashlib.sha256(key.encode('utf-8')).hexdigest()[:12]}.gz"
+        (self.directory / "responses").mkdir(parents=True, exist_ok=True)
+        (self.directory / "responses" / name).write_bytes(gzip.compress(body, compresslevel=6))
+        with self._lock:
+            self.responses[key] = {"url": url, "status": status, "content_type": content_type, "file": name}
+
+    def body_path(self, key: str) -> Optional[Path]:
+        """Return the gzip body file recorded for a key, None when the request was not recorded."""
+        entry = self.responses.get(key)
+        return self.directory / "responses" / entry["file"] if entry else None
+
+    def save(self, **meta) -> None:
+        """Write the manifest, with extra top-level fields (e.g. when it was recorded)."""
+        self.meta.update(meta)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        data = dict(self.meta, responses=dict(sorted(self.responses.items())))
+        (self.directory / "manifest.json").write_text(json.dumps(data, indent=1) + "\n", encoding="utf-8")
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """
+    Answer every GET with the recorded response for its path and query, 404 when none was recorded.
+
+    Bodies are sent gzip-encoded as stored, so serving costs no compression;
+    clients decode them as they would a real server's. Requests that miss the
+    recording are kept in misses.
+    """
+
+    protocol_version = "HTTP/1.1"
+    recording: Recording
+    latency = 0.0
+    misses: List[str] = []
+
+    def do_GET(self) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        key = request_key(self.path)
+        path = self.recording.body_path(key)
+        if path is None:
+            self.misses.append(self.path)
+            body = b"not recorded"
+            self.send_response(HTTPStatus.NOT_FOUND)
+            self.send_header("Content-Type", "text/plain")
+        else:
+            entry = self.recording.responses[key]
+            body = path.read_bytes()
+            self.send_response(entry["status"])
+            self.send_header("Content-Type", entry["content_type"])
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@contextmanager
+def serve_recording(directory: Path, latency: float = 0.0) -> Iterator[Tuple[str, type]]:
+    """
+    Replay a recording made with Recording on localhost for the duration of the block.
+
+    Args:
+        directory: Recording directory (manifest.json and responses/).
+        latency: Seconds to wait before answering each request (simulated RTT).
+
+    Returns:
+        (base URL, handler class); the handler's misses lists requests that were not recorded.
+    """
+    with _serve(ReplayHandler, recording=Recording(directory), latency=latency, misses=[]) as served:
+        yield served
@@ -0,0 +1,121 @@
+"""
+Time the incremental analytics against a full recompute.
+
+On random cleaned tables of --years years x --rows hits rows per year (box
+office, hits, Billboard and best-of-year albums; many ties and missing
+values), reports a full recompute, a cold incremental build, and an
+incremental rebuild after one year is re-scraped. tests/test_incremental.py
+checks that the incremental tables equal the full recompute.
+
+    python -m benchmarks.incremental --years 31 --rows 20000
+"""
+from pathlib import Path
+from typing import Dict
+import argparse
+import random
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from src import analytics
+from src.incremental import AnalyticsPartials
+
+ARTISTS = ["Madonna", "Prince", "Usher", "Santana", "Wham!", "Boyz II Men", "Mariah Carey", "Beyoncé"]
+
+
+def random_year(year: int, rows: int, rng: random.Random) -> Dict[str, pd.DataFrame]:
+    """Return one year's rows of the four cleaned tables, drawn from small pools so counts tie often."""
+    artists = ARTISTS[:rng.randint(2, len(ARTISTS))] + [f"Act {i}" for i in range(rows // 20)]
+
+    def credit() -> tuple:
+        if rng.random() < 0.03:
+            return np.nan, np.nan
+        name = rng.choice(artists)
+        return name.lower(), rng.choice([name, name.upper(), name.title()])
+
+    credits = [credit() for _ in range(rows)]
+    return {
+        "gross": pd.DataFrame({
+            "year": year,
+            "gross": [np.nan if rng.random() < 0.05 else rng.randint(1, 50) * 1e6 for _ in range(max(1, rows // 4))],
+        }),
+        # Column dtypes as the cleaners give them, whatever a small year happens to hold.
+        "hits": pd.DataFrame({
+            "year": year,
+            "title": pd.Series([np.nan if rng.random() < 0.05 else f"Song {rng.randint(0, rows // 2)}" for _ in range(rows)], dtype="str"),
+            "main_artist": pd.Series([key for key, _ in credits], dtype=object),
+            "display_artist": pd.Series([display for _, display in credits], dtype=object),
+        }),
+        "albums_us": pd.DataFrame({
+            "year": year,
+            "album": pd.Series([f"Album {i}" for i in range(max(1, rows // 10))], dtype="str"),
+            "artist": pd.Series([rng.choice(artists) for _ in range(max(1, rows // 10))], dtype="str"),
+            "weeks_at_one": [rng.randint(1, 6) for _ in range(max(1, rows // 10))],
+        }),
+        "albums_global": pd.DataFrame({
+            "year": year,
+            "artist": pd.Series([rng.choice(artists) for _ in range(max(1, rows // 10))], dtype="str"),
+        }),
+    }
+
+
+def assemble(years: Dict[int, Dict[str, pd.DataFrame]]) -> Dict[str, pd.DataFrame]:
+    """Concatenate per-year rows into tables in year order, as the cleaners return them."""
+    return {
+        name: pd.concat([years[year][name] for year in sorted(years)], ignore_index=True)
+        for name in ("gross", "hits", "albums_us", "albums_global")
+    }
+
+
+def update(partials: AnalyticsPartials, tables: Dict[str, pd.DataFrame]) -> list:
+    return partials.update(tables["gross"], tables["hits"], tables["albums_us"], tables["albums_global"])
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=31, help="Years in the timing tables.")
+    parser.add_argument("--rows", type=int, default=20000, help="Hits rows per year in the timing tables.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    years = {year: random_year(year, args.rows, rng) for year in range(1985, 1985 + args.years)}
+    tables = assemble(years)
+
+    def full() -> None:
+        analytics.generate_yearly_stats(tables["gross"], tables["hits"])
+        analytics.generate_top_artists(tables["hits"])
+        analytics.generate_album_stats(tables["albums_us"], tables["albums_global"])
+
+    def incremental(root: Path) -> None:
+        partials = AnalyticsPartials(root)
+        update(partials, tables)
+        partials.yearly_stats()
+        partials.top_artists()
+        partials.album_stats()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        full_ms = timed(full)
+        cold_ms = timed(lambda: incremental(Path(tmp)))
+        rescraped = 1985 + args.years // 2
+        years[rescraped] = random_year(rescraped, args.rows, rng)
+        tables = assemble(years)
+        one_year_ms = timed(lambda: incremental(Path(tmp)))
+
+    rows = sum(len(df) for df in tables.values())
+    print(f"{args.years} years, {rows} rows")
+    print(f"full recompute:                      {full_ms:9.1f} ms")
+    print(f"incremental, cold (every year):      {cold_ms:9.1f} ms")
+    print(f"incremental, one year re-scraped:    {one_year_ms:9.1f} ms  ({full_ms / one_year_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
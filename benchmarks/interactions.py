@@ -0,0 +1,206 @@
+"""
+Count the work each interaction with the app does: what reruns and how much is sent.
+
+Drives app/streamlit_app.py in-process with Streamlit's AppTest through one
+session (load, REWIND, move the events slider, step back a year, reveal
+again). AppTest on its own reruns the whole script for every widget. Here,
+as in a browser, a widget inside an st.fragment reruns only that fragment:
+its fragment id is queued on the rerun and the fragment's new elements
+replace the old ones in the element tree. For every step, the harness reports:
+- whether the step ran the full script or a fragment;
+- the sections the app's timing mode recorded;
+- the number of elements sent and how many of them were charts or the game iframe;
+- the wall time.
+--full-reruns runs the same session the way AppTest does by default, for comparison.
+
+    python -m benchmarks.interactions
+"""
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import argparse
+import threading
+import time
+
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.runtime.scriptrunner import RerunData
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import app_test
+from streamlit.testing.v1 import local_script_runner
+from streamlit.testing.v1.element_tree import parse_tree_from_messages
+
+from src import timing
+
+APP = Path(__file__).resolve().parent.parent / "app" / "streamlit_app.py"
+HEAVY_ELEMENTS = ("plotly_chart", "arrow_vega_lite_chart", "vega_lite_chart", "iframe")
+
+# AppTest builds its rerun requests and collects messages in the thread driving it,
+# so the hooks keep their state per thread and several harnesses can run at once.
+_local = threading.local()
+_reports: List[Dict[str, float]] = []
+_hooks_lock = threading.Lock()
+_hooks_installed = False
+_runtime: Optional[Runtime] = None
+
+
+def _install_hooks() -> None:
+    """
+    Hook AppTest's runner (queue a fragment, keep the sent messages) and the app's timing log, once.
+
+    AppTest also installs a mock Runtime singleton for each run and clears it
+    when the run ends. The hooked Runtime keeps the last one, so a harness
+    finishing does not pull the runtime from under the others still running,
+    much as sessions of one server share its runtime. Runs share one script
+    cache too, so the script is compiled once, as a server does.
+    """
+    global _hooks_installed
+    with _hooks_lock:
+        if _hooks_installed:
+            return
+
+        def rerun_data(**kwargs) -> RerunData:
+            fragment_id = getattr(_local, "fragment_id", None)
+            if fragment_id:
+                kwargs.setdefault("fragment_id_queue", [fragment_id])
+            return RerunData(**kwargs)
+
+        forward_msgs = local_script_runner.LocalScriptRunner.forward_msgs
+
+        def keep_forward_msgs(runner) -> List[ForwardMsg]:
+            _local.sent = list(forward_msgs(runner))
+            return _local.sent
+
+        record = timing.TimingLog.record
+
+        def keep_report(log, report: Dict[str, float]) -> None:
+            _reports.append(report)
+            record(log, report)
+
+        def shared_instance() -> Runtime:
+            global _runtime
+            if Runtime._instance is not None:
+                _runtime = Runtime._instance
+            if _runtime is None:
+                raise RuntimeError("Runtime hasn't been created!")
+            return _runtime
+
+        script_cache = ScriptCache()
+
+        local_script_runner.RerunData = rerun_data
+        local_script_runner.LocalScriptRunner.forward_msgs = keep_forward_msgs
+        timing.TimingLog.record = keep_report
+        app_test.ScriptCache = local_script_runner.ScriptCache = lambda: script_cache
+        Runtime.instance = staticmethod(shared_instance)
+        Runtime.exists = staticmethod(lambda: Runtime._instance is not None or _runtime is not None)
+        _hooks_installed = True
+
+
+class FragmentAppTest:
+    """
+    AppTest wrapper whose widget interactions rerun only the widget's fragment, as a browser does.
+
+    Args:
+        script: Streamlit script to drive.
+        fragment_reruns: False to rerun the whole script for every interaction (plain AppTest).
+        timing: Open the app with ?timing=1, so steps report the sections that ran.
+    """
+
+    def __init__(self, script: Path = APP, fragment_reruns: bool = True, timing: bool = True) -> None:
+        _install_hooks()
+        self.at = AppTest.from_file(str(script), default_timeout=60)
+        if timing:
+            self.at.query_params["timing"] = "1"
+        self.fragment_reruns = fragment_reruns
+        self.messages: Dict[Tuple[int, ...], ForwardMsg] = {}
+
+    def _fragment_of(self, widget_id: str) -> Optional[str]:
+        """Return the fragment id of the element carrying a widget id, None outside fragments."""
+        for msg in self.messages.values():
+            if msg.delta.HasField("new_element"):
+                element = msg.delta.new_element
+                if getattr(getattr(element, element.WhichOneof("type")), "id", None) == widget_id:
+                    return msg.delta.fragment_id or None
+        return None
+
+    def step(self, interact: Optional[Callable[[AppTest], object]] = None) -> Dict:
+        """
+        Run one interaction and report the work it did.
+
+        Args:
+            interact: Sets a widget value on the AppTest (e.g. lambda at: at.button(key="prev").click())
+                and returns the widget; None for a plain full run (page load).
+
+        Returns:
+            {"run": "full" or "fragment", "ms", "elements", "heavy", "sections"}.
+        """
+        widget = interact(self.at) if interact else None
+        fragment_id = self._fragment_of(widget.id) if widget is not None and self.fragment_reruns else None
+        reports_before = len(_reports)
+
+        _local.fragment_id = fragment_id
+        try:
+            start = time.perf_counter()
+            self.at.run()
+            elapsed = time.perf_counter() - start
+        finally:
+            _local.fragment_id = None
+
+        deltas = [msg for msg in _local.sent if msg.HasField("delta")]
+        if fragment_id and deltas:
+            # The fragment re-sends its container first; everything under it is replaced.
+            root = tuple(deltas[0].metadata.delta_path)
+            self.messages = {path: msg for path, msg in self.messages.items() if path[:len(root)] != root}
+        else:
+            self.messages = {}
+        self.messages.update((tuple(msg.metadata.delta_path), msg) for msg in deltas)
+        tree = parse_tree_from_messages([self.messages[path] for path in sorted(self.messages)])
+        tree._runner = self.at
+        self.at._tree = tree
+
+        heavy = sum(
+            1 for msg in deltas
+            if msg.delta.HasField("new_element") and msg.delta.new_element.WhichOneof("type") in HEAVY_ELEMENTS
+        )
+        sections = sorted({name for report in _reports[reports_before:] for name in report if name != "total"})
+        return {
+            "run": "fragment" if fragment_id else "full",
+            "ms": elapsed * 1000,
+            "elements": len(deltas),
+            "heavy": heavy,
+            "sections": sections,
+        }
+
+
+SESSION: List[Tuple[str, Optional[Callable[[AppTest], object]]]] = [
+    ("load", None),
+    ("REWIND", lambda at: next(b for b in at.button if "REWIND" in b.label).click()),
+    ("events slider -> 8", lambda at: at.slider[0].set_value(8)),
+    ("events slider -> 3", lambda at: at.slider[0].set_value(3)),
+    ("previous year", lambda at: at.button(key="prev").click()),
+    ("REWIND", lambda at: next(b for b in at.button if "REWIND" in b.label).click()),
+    ("next year", lambda at: at.button(key="next").click()),
+]
+
+
+def run_session(fragment_reruns: bool) -> List[Tuple[str, Dict]]:
+    """Run SESSION and return (step, work) pairs."""
+    harness = FragmentAppTest(fragment_reruns=fragment_reruns)
+    return [(name, harness.step(interact)) for name, interact in SESSION]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--full-reruns", action="store_true", help="Rerun the whole script for every interaction.")
+    args = parser.parse_args()
+
+    print(f"{'step':20s} {'run':8s} {'ms':>7s} {'elements':>9s} {'charts/game':>12s}  sections")
+    for name, work in run_session(fragment_reruns=not args.full_reruns):
+        print(
+            f"{name:20s} {work['run']:8s} {work['ms']:7.1f} {work['elements']:9d} {work['heavy']:12d}  "
+            f"{', '.join(work['sections'])}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Time money parsing on a synthetic gross column: the chained replace passes vs src.numeric.parse_numbers.
+
+Builds a column of --rows amounts written the way the scraped tables write
+them ("$154,272,509[1]", "$2,000,000", "686,944"), with --messy of them in
+forms only parse_numbers understands ("US$1.2 billion", "$900 million –
+$1 billion", "~$30 million+") and a few values nothing can parse ("TBA").
+It checks that both give the same values wherever the chained passes
+parse anything, and that parse_numbers flags exactly the unparsable
+values, then reports the time of each.
+
+    python -m benchmarks.numeric --rows 1000000 --messy 0.01
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.numeric import parse_numbers
+
+MESSY = [
+    ("US${a}.{b} billion", lambda a, b: (a + b / 10) * 1e9),
+    ("${a}{b} million – ${a}{c} million", lambda a, b: (a * 10 + b) * 1e6),
+    ("~${a}{b} million+", lambda a, b: (a * 10 + b) * 1e6),
+    ("£{a}.{b}m[{a}]", lambda a, b: (a + b / 10) * 1e6),
+]
+UNPARSABLE = ["TBA", "—", "n/a"]
+
+
+def synthetic_gross(n: int, messy: float, rng: random.Random) -> tuple:
+    """Return n raw gross values and the amounts they stand for (NaN for unparsable values)."""
+    values, expected = [], []
+    for i in range(n):
+        roll = rng.random()
+        if roll < messy * 0.9:
+            template, amount = rng.choice(MESSY)
+            a, b, c = rng.randint(1, 9), rng.randint(0, 9), rng.randint(0, 9)
+            values.append(template.format(a=a, b=b, c=max(b, c)))
+            expected.append(amount(a, b))
+        elif roll < messy:
+            values.append(rng.choice(UNPARSABLE))
+            expected.append(np.nan)
+        else:
+            amount = rng.randint(1_000_000, 3_000_000_000)
+            footnote = f" [{i % 40}]" if rng.random() < 0.7 else ""
+            values.append(f"${amount:,}{footnote}" if rng.random() < 0.9 else f"{amount:,}")
+            expected.append(float(amount))
+    return pd.Series(values, dtype="str"), np.array(expected)
+
+
+def chained_parse(gross: pd.Series) -> pd.Series:
+    """The parsing clean_gross did before: three replace passes, a strip and pd.to_numeric."""
+    return pd.to_numeric(
+        gross.astype(str)
+        .str.replace(r"\[.*?\]", "", regex=True)
+        .str.replace("$", "", regex=False)
+        .str.replace(",", "", regex=False)
+        .str.strip(),
+        errors="coerce",
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--messy", type=float, default=0.01, help="Share of values in forms beyond a plain amount.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    gross, expected = synthetic_gross(args.rows, args.messy, random.Random(args.seed))
+    start = time.perf_counter()
+    old = chained_parse(gross).to_numpy(dtype=float)
+    chained = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = parse_numbers(gross)
+    parsed = time.perf_counter() - start
+
+    parsed_before = ~np.isnan(old)
+    mismatches = int((new.values[parsed_before] != old[parsed_before]).sum())
+    wrong = int((~np.isclose(new.values, expected, rtol=1e-12, equal_nan=True)).sum())
+    flagged_ok = np.array_equal(new.unparsed, np.isnan(expected))
+
+    print(f"{args.rows} rows, {int(np.isnan(old).sum())} left unparsed by the chained passes, "
+          f"{int(new.unparsed.sum())} by parse_numbers")
+    print(f"chained replace passes: {chained * 1000:9.1f} ms")
+    print(f"parse_numbers:          {parsed * 1000:9.1f} ms  ({chained / parsed:.1f}x)")
+    print(f"values differing where both parse: {mismatches}, wrong vs expected: {wrong}, "
+          f"unparsed mask {'matches' if flagged_ok else 'DIFFERS from'} the unparsable values")
+    if mismatches or wrong or not flagged_ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Time the bs4 and lxml parser backends.
+
+Runs every scraper over the cached pages in data/html (populate them by running
+scripts/download_data.py with HTML_CACHE_ENABLED = True) with each backend and
+reports parse and extraction times. tests/test_parse.py checks that both
+backends scrape identical DataFrames.
+
+    python -m benchmarks.parse
+"""
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+import argparse
+import time
+
+import pandas as pd
+
+from config import HTML_DIR, WIKI_ALBUM_YEARS, YEAR_END, YEAR_START
+from scripts import download_data as dd
+from src.documents import DocumentStore, Page
+from src.html_cache import read_cached_page
+
+Job = Tuple[str, int, Page, Callable[[int, DocumentStore], pd.DataFrame]]
+
+
+def collect_jobs(html_dir: Path) -> Tuple[List[Job], Dict[str, str]]:
+    """Return the scraper jobs whose page is cached, plus the cached HTML by URL."""
+    jobs: List[Job] = []
+    for year in range(YEAR_START, YEAR_END + 1):
+        jobs.append(("highest_grossing", year, dd.film_page(year), dd.scrape_highest_grossing))
+        jobs.append(("awards", year, dd.film_page(year), dd.scrape_awards))
+        jobs.append(("top_hits", year, dd.hits_page(year), dd.scrape_top_hits))
+        jobs.append(("albums_billboard", year, dd.billboard_albums_page(year), dd.scrape_billboard_albums))
+    for year in WIKI_ALBUM_YEARS:
+        jobs.append(("albums_wiki", year, dd.music_page(year), dd.scrape_wiki_albums))
+
+    pages: Dict[str, str] = {}
+    for _, _, (url, cache_path), _ in jobs:
+        cached = read_cached_page(html_dir / cache_path.name)
+        if cached:
+            pages[url] = cached.html
+    return [job for job in jobs if job[2][0] in pages], pages
+
+
+def run_backend(backend: str, jobs: List[Job], pages: Dict[str, str]) -> Tuple[float, float]:
+    """Scrape every job with one backend; return parse seconds and extraction seconds."""
+    store = DocumentStore(lambda url, cache_path: pages[url], backend)
+    start = time.perf_counter()
+    for url in pages:
+        store.document(url)
+    parse = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _, year, _, scrape in jobs:
+        scrape(year, store)
+    extract = time.perf_counter() - start
+    return parse, extract
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--html-dir", type=Path, default=HTML_DIR)
+    args = parser.parse_args()
+
+    jobs, pages = collect_jobs(args.html_dir)
+    if not jobs:
+        raise SystemExit(f"No cached pages in {args.html_dir}; run the download with HTML_CACHE_ENABLED = True first.")
+
+    results = {backend: run_backend(backend, jobs, pages) for backend in ("bs4", "lxml")}
+
+    print(f"pages: {len(pages)}, scraper calls: {len(jobs)}")
+    for backend, (parse, extract) in results.items():
+        print(f"{backend:5s} parse {parse:6.2f}s  extract {extract:6.2f}s  total {parse + extract:6.2f}s")
+    bs4_total = sum(results["bs4"])
+    lxml_total = sum(results["lxml"])
+    print(f"speedup: {bs4_total / lxml_total:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
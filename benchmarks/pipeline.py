@@ -0,0 +1,293 @@
+"""
+Record the pipeline's source pages once, then time and profile every stage offline against the recording.
+
+record runs scripts/download_data.py and scripts/build_dataset.py against the
+live sites and stores every response under --fixtures: the ~130 film, music
+and Billboard pages, plus the Wikipedia API lookups that resolve film URLs.
+
+bench replays the recording from a local server (HTTP_ORIGIN points the HTTP
+client at it), runs the download and the build into a scratch data
+directory, and reports calls and time per stage:
+- download: fetch_with_cache, _section_tables, parse_html_table;
+- build: each clean_* and generate_* step.
+Pages are parsed in this process (--workers 1), so the profiles see the parsing.
+Each run writes its own directory under benchmarks/results/ holding:
+- stages.json: stage times, and row counts and hashes of the processed tables;
+- a cProfile dump per phase (download.prof, build.prof) with its top functions as text.
+--baseline compares the stage times with an earlier stages.json and exits
+non-zero when a phase's wall time regresses by more than --tolerance.
+
+Both modes run with the HTML and film URL caches off, so every request
+reaches the server.
+
+data/fixtures ships with a small synthetic recording (generated pages in the
+live sites' layout; see "source" in its manifest.json), so bench runs on a
+fresh checkout. record adds the live pages to it, replacing those it shares.
+
+    python -m benchmarks.pipeline record
+    python -m benchmarks.pipeline bench
+    python -m benchmarks.pipeline bench --baseline benchmarks/results/pipeline-<commit>-<time>/stages.json
+"""
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import argparse
+import cProfile
+import functools
+import hashlib
+import io
+import json
+import logging
+import pstats
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import config
+from benchmarks.fixture_server import Recording, serve_recording
+from benchmarks.results import RESULTS_DIR, git_commit
+
+FIXTURES_DIR = config.DATA_DIR / "fixtures"
+EVENTS_CSV = config.PROCESSED_DIR / "events.csv"
+DOWNLOAD_STAGES = ("fetch_with_cache", "_section_tables", "parse_html_table")
+
+
+def configure(data_dir: Path, origin: Optional[str], throttle: bool = True) -> None:
+    """
+    Point config at a scratch data directory with the HTML and URL caches off.
+
+    Config values are read when the pipeline modules are imported, so this
+    must run before anything imports them.
+
+    Args:
+        data_dir: Scratch directory for raw and processed data.
+        origin: Origin every request is sent to (the replay server), None for the live sites.
+        throttle: Keep the configured per-host request rate; False lifts it.
+    """
+    loaded = [
+        name for name in ("scripts.download_data", "scripts.build_dataset", "src.http_client", "src.incremental")
+        if name in sys.modules
+    ]
+    if loaded:
+        raise RuntimeError(f"configure() must run before the pipeline modules are imported: {', '.join(loaded)}")
+    config.DATA_DIR = data_dir
+    config.RAW_DIR = data_dir / "raw"
+    config.PARTITIONS_DIR = config.RAW_DIR / "partitions"
+    config.PROCESSED_DIR = data_dir / "processed"
+    config.SNAPSHOT_PATH = config.PROCESSED_DIR / "snapshot.arrow"
+    config.HTML_DIR = data_dir / "html"
+    config.CACHE_DIR = data_dir / "cache"
+    config.ANALYTICS_PARTIALS_DIR = config.CACHE_DIR / "analytics"
+    config.HTML_CACHE_ENABLED = False
+    config.URL_CACHE_ENABLED = False
+    config.HTTP_ORIGIN = origin
+    if not throttle:
+        config.FETCH_RATE_PER_HOST = 1e9
+    config.PROCESSED_DIR.mkdir(parents=True)
+    # The events table is hand-curated, not scraped; the build converts it like the other tables.
+    shutil.copy(EVENTS_CSV, config.PROCESSED_DIR / "events.csv")
+
+
+class StageTimes:
+    """
+    Calls and wall time of pipeline functions, wrapped in the module that calls them.
+
+    Safe to update from the download threads; a stage called from several
+    threads at once adds up their times.
+    """
+
+    def __init__(self) -> None:
+        self.calls: Counter = Counter()
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def wrap(self, module, name: str) -> None:
+        """Replace module.name with a version that records its calls and time."""
+        fn: Callable = getattr(module, name)
+
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.calls[name] += 1
+                    self.seconds[name] += elapsed
+
+        setattr(module, name, timed)
+
+    def report(self, names: List[str]) -> Dict[str, Dict[str, float]]:
+        """Return calls and total ms of the given stages."""
+        return {name: {"calls": self.calls[name], "ms": round(self.seconds[name] * 1000, 2)} for name in names}
+
+
+def profiled(run: Callable[[], None], output: Path, phase: str) -> float:
+    """Run one phase under cProfile, save <phase>.prof and its top functions as <phase>.txt, return wall seconds."""
+    profile = cProfile.Profile()
+    start = time.perf_counter()
+    profile.enable()
+    try:
+        run()
+    finally:
+        profile.disable()
+    seconds = time.perf_counter() - start
+    profile.dump_stats(output / f"{phase}.prof")
+    text = io.StringIO()
+    pstats.Stats(profile, stream=text).sort_stats("cumulative").print_stats(40)
+    (output / f"{phase}.txt").write_text(text.getvalue(), encoding="utf-8")
+    return seconds
+
+
+def table_digests(processed_dir: Path) -> Dict[str, Dict]:
+    """Return rows and sha256 of every processed CSV, so runs can check they built the same tables."""
+    digests = {}
+    for path in sorted(processed_dir.glob("*.csv")):
+        data = path.read_bytes()
+        digests[path.stem] = {"rows": max(0, data.count(b"\n") - 1), "sha256": hashlib.sha256(data).hexdigest()}
+    return digests
+
+
+def record(fixtures: Path) -> None:
+    """Run the pipeline against the live sites and store every response under fixtures."""
+    recording = Recording(fixtures)
+    with tempfile.TemporaryDirectory() as tmp:
+        configure(Path(tmp), config.HTTP_ORIGIN)
+        import requests
+        from scripts import build_dataset, download_data
+        from src.http_client import HttpClient
+
+        get = HttpClient.get
+
+        def recording_get(client: HttpClient, url: str, **kwargs) -> requests.Response:
+            resp = get(client, url, **kwargs)
+            requested = requests.Request("GET", url, params=kwargs.get("params")).prepare().url
+            recording.add(requested, resp.status_code, resp.headers.get("Content-Type", "text/html"), resp.content)
+            return resp
+
+        HttpClient.get = recording_get
+        download_data.main(["--workers", "1"])
+        build_dataset.main()
+        commit, _ = git_commit()
+        recording.save(recorded_at=time.strftime("%Y-%m-%dT%H:%M:%S%z"), commit=commit, source="live sites")
+        tables = table_digests(config.PROCESSED_DIR)
+
+    size = sum(p.stat().st_size for p in (fixtures / "responses").iterdir())
+    print(f"recorded {len(recording.responses)} responses ({size / 1e6:.1f} MB gzip) to {fixtures}")
+    print(f"built {len(tables)} tables: " + ", ".join(f"{name} {t['rows']}" for name, t in tables.items()))
+
+
+def bench(fixtures: Path, latency: float, throttle: bool, output: Optional[Path]) -> Dict:
+    """Replay the recording through download and build, timing and profiling every stage."""
+    if not (fixtures / "manifest.json").exists():
+        raise SystemExit(f"No recording in {fixtures}; run `python -m benchmarks.pipeline record` first.")
+    commit, dirty = git_commit()
+    stamp = time.strftime("%Y%m%dT%H%M%S")
+    output = output or RESULTS_DIR / f"pipeline-{commit}{'-dirty' if dirty else ''}-{stamp}"
+    output.mkdir(parents=True, exist_ok=True)
+
+    with serve_recording(fixtures, latency) as (base_url, handler), tempfile.TemporaryDirectory() as tmp:
+        configure(Path(tmp), base_url, throttle)
+        from scripts import build_dataset, download_data
+
+        times = StageTimes()
+        for name in DOWNLOAD_STAGES:
+            times.wrap(download_data, name)
+        build_stages = sorted(name for name in vars(build_dataset) if name.startswith(("clean_", "generate_")))
+        for name in build_stages:
+            times.wrap(build_dataset, name)
+
+        phases = {
+            "download": profiled(lambda: download_data.main(["--workers", "1"]), output, "download"),
+            "build": profiled(build_dataset.main, output, "build"),
+        }
+        misses = list(handler.misses)
+        tables = table_digests(config.PROCESSED_DIR)
+
+    results = {
+        "commit": commit,
+        "dirty": dirty,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "recording": Recording(fixtures).meta,
+        "latency": latency,
+        "throttle": throttle,
+        "phases_ms": {phase: round(seconds * 1000, 2) for phase, seconds in phases.items()},
+        "stages": {"download": times.report(list(DOWNLOAD_STAGES)), "build": times.report(build_stages)},
+        "misses": misses,
+        "tables": tables,
+    }
+    (output / "stages.json").write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    print(f"{'phase':9s} {'stage':28s} {'calls':>6s} {'ms':>10s}")
+    for phase, stages in results["stages"].items():
+        print(f"{phase:9s} {'(wall)':28s} {'':6s} {results['phases_ms'][phase]:10.1f}")
+        for name, stage in stages.items():
+            print(f"{'':9s} {name:28s} {stage['calls']:6d} {stage['ms']:10.1f}")
+    print(f"tables: {len(tables)}, {sum(t['rows'] for t in tables.values())} rows")
+    print(f"results: {output}")
+    if misses:
+        raise SystemExit(f"{len(misses)} requests were not in the recording (first: {misses[0]}); re-record the fixtures.")
+    return results
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Print phase and stage times against a baseline run.
+
+    Args:
+        results: This run's stages.json contents.
+        baseline: An earlier stages.json's contents.
+        tolerance: Allowed relative slowdown of a phase's wall time (0.2 = 20%).
+
+    Returns:
+        Descriptions of the phase regressions beyond tolerance.
+    """
+    print(f"\nvs {baseline['commit']}{' (dirty)' if baseline.get('dirty') else ''} ({baseline['timestamp']})")
+    print(f"{'stage':28s} {'ms':>10s} {'was':>10s} {'change':>7s}")
+    regressions = []
+    for phase, ms in results["phases_ms"].items():
+        rows = [(f"{phase} (wall)", ms, baseline["phases_ms"].get(phase))]
+        rows += [
+            (name, stage["ms"], baseline["stages"].get(phase, {}).get(name, {}).get("ms"))
+            for name, stage in results["stages"][phase].items()
+        ]
+        for name, new, was in rows:
+            if not was:
+                continue
+            change = new / was - 1
+            print(f"{name:28s} {new:10.1f} {was:10.1f} {change:+7.0%}")
+            if name.endswith("(wall)") and change > tolerance:
+                regressions.append(f"{name}: {was:.0f} -> {new:.0f} ms")
+    changed = sorted(name for name, table in results["tables"].items() if baseline["tables"].get(name) != table)
+    if changed:
+        print(f"tables that differ from the baseline: {', '.join(changed)}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("mode", choices=("record", "bench"))
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR, help=f"Recording directory (default {FIXTURES_DIR}).")
+    parser.add_argument("--latency", type=float, default=0.0, help="bench: simulated seconds per request.")
+    parser.add_argument("--throttle", action="store_true", help="bench: keep the configured per-host request rate.")
+    parser.add_argument("--output", type=Path, help="bench: results directory (default: a new one under benchmarks/results/).")
+    parser.add_argument("--baseline", type=Path, help="bench: earlier stages.json to compare with.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="bench: allowed phase wall-time regression vs --baseline.")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+
+    if args.mode == "record":
+        record(args.fixtures)
+        return
+    results = bench(args.fixtures, args.latency, args.throttle, args.output)
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+        if regressions:
+            raise SystemExit("Regressed beyond tolerance:\n" + "\n".join(regressions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compare load time and memory of the processed tables as CSV and as typed Parquet.
+
+Reads every table in data/processed (run scripts/build_dataset.py first) both
+ways, best of --repeat runs, and reports in-memory size with deep=True.
+--scale N repeats each table's rows N times in a temporary copy to
+approximate a larger dataset.
+
+    python -m benchmarks.processed_load --scale 100
+"""
+from pathlib import Path
+from typing import Callable
+import argparse
+import tempfile
+import time
+
+import pandas as pd
+
+from config import PROCESSED_DIR
+from src.columnar import SCHEMAS, apply_schema, csv_path, parquet_path, read_processed, write_processed
+
+
+def best_of(repeat: int, load: Callable[[], pd.DataFrame]) -> float:
+    """Return the fastest of several timed loads, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processed-dir", type=Path, default=PROCESSED_DIR)
+    parser.add_argument("--scale", type=int, default=1, help="Repeat each table's rows this many times.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    names = [name for name in SCHEMAS if csv_path(name, args.processed_dir).exists()]
+    if not names:
+        raise SystemExit(f"No processed CSVs in {args.processed_dir}; run scripts/build_dataset.py first.")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for name in names:
+            df = pd.read_csv(csv_path(name, args.processed_dir))
+            write_processed(pd.concat([df] * args.scale, ignore_index=True), name, directory)
+
+        print(f"{'table':36s} {'rows':>8s} {'csv ms':>8s} {'pq ms':>8s} {'csv MB':>8s} {'pq MB':>8s} {'disk csv/pq KB':>16s}")
+        totals = [0.0, 0.0, 0, 0]
+        for name in names:
+            csv, parquet = csv_path(name, directory), parquet_path(name, directory)
+            csv_df = pd.read_csv(csv)
+            typed_df = read_processed(name, directory)
+            pd.testing.assert_frame_equal(apply_schema(csv_df, name), typed_df, check_dtype=False)
+
+            csv_time = best_of(args.repeat, lambda: pd.read_csv(csv))
+            parquet_time = best_of(args.repeat, lambda: read_processed(name, directory))
+            csv_mem = csv_df.memory_usage(deep=True).sum()
+            parquet_mem = typed_df.memory_usage(deep=True).sum()
+            for i, value in enumerate((csv_time, parquet_time, csv_mem, parquet_mem)):
+                totals[i] += value
+            print(
+                f"{name:36s} {len(csv_df):8d} {csv_time * 1000:8.2f} {parquet_time * 1000:8.2f} "
+                f"{csv_mem / 1e6:8.2f} {parquet_mem / 1e6:8.2f} "
+                f"{csv.stat().st_size / 1e3:8.0f}/{parquet.stat().st_size / 1e3:<7.0f}"
+            )
+
+    csv_time, parquet_time, csv_mem, parquet_mem = totals
+    print(
+        f"{'total':36s} {'':8s} {csv_time * 1000:8.2f} {parquet_time * 1000:8.2f} "
+        f"{csv_mem / 1e6:8.2f} {parquet_mem / 1e6:8.2f}"
+    )
+    print(f"load speedup {csv_time / parquet_time:.1f}x, memory {parquet_mem / csv_mem:.0%} of CSV")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Check year-range analytics queries against recomputing over the range's rows, then time both.
+
+Builds random cleaned tables (those of benchmarks.incremental, with some
+Billboard albums credited to "Soundtrack") and runs --queries random
+queries: top artists (random n and spelling ties), yearly stats and longest
+reigning albums (with and without soundtracks), over random ranges that may
+be open or reach past the data. Each must equal src.analytics (for the
+albums, its longest-reigning sort) run on the rows of the range (row labels
+aside; yearly stats keep the full history's dtypes). It then reports the
+build time and the mean time of a query uncached, cached, and recomputed
+from the rows.
+
+    python -m benchmarks.queries --queries 300 --years 31 --rows 20000
+"""
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from benchmarks.incremental import assemble, random_year
+from src import analytics
+from src.queries import AnalyticsQueries
+
+FIRST_YEAR = 1985
+
+
+def random_tables(years: int, rows: int, rng: random.Random) -> dict:
+    """Return processed-table-like frames (highest_grossing, top_hits, albums_us) for years years."""
+    tables = assemble({year: random_year(year, rows, rng) for year in range(FIRST_YEAR, FIRST_YEAR + years)})
+    albums = tables["albums_us"]
+    soundtracks = [rng.random() < 0.1 for _ in range(len(albums))]
+    albums.loc[soundtracks, "artist"] = "Soundtrack"
+    return {
+        "highest_grossing": tables["gross"],
+        "top_hits": tables["hits"],
+        "albums_us": albums,
+    }
+
+
+def in_range(df: pd.DataFrame, start, end) -> pd.DataFrame:
+    mask = pd.Series(True, index=df.index)
+    if start is not None:
+        mask &= df["year"] >= start
+    if end is not None:
+        mask &= df["year"] <= end
+    return df[mask]
+
+
+def random_query(rng: random.Random, years: int) -> tuple:
+    """Return (query name, keyword arguments) for a random query."""
+    start = rng.choice([None, FIRST_YEAR - 2, *range(FIRST_YEAR, FIRST_YEAR + years), FIRST_YEAR + years + 1])
+    end = rng.choice([None, FIRST_YEAR + years + 2, *range(start or FIRST_YEAR, FIRST_YEAR + years)])
+    query = rng.choice(("top_artists", "yearly_stats", "longest_reigning"))
+    params = {"start_year": start, "end_year": end}
+    if query == "top_artists":
+        params.update(n=rng.choice((1, 5, 20, 100, 10**6)), ties=rng.choice(("alphabetical", "first_seen")))
+    elif query == "longest_reigning":
+        params.update(n=rng.choice((1, 10, 20, 10**6)), exclude_soundtracks=rng.random() < 0.5)
+    return query, params
+
+
+def recompute(tables: dict, query: str, params: dict) -> pd.DataFrame:
+    """Run the query the slow way: filter every table to the range and rerun src.analytics."""
+    start, end = params["start_year"], params["end_year"]
+    if query == "top_artists":
+        return analytics.generate_top_artists(in_range(tables["top_hits"], start, end), params["n"], params["ties"])
+    if query == "yearly_stats":
+        return analytics.generate_yearly_stats(
+            in_range(tables["highest_grossing"], start, end), in_range(tables["top_hits"], start, end)
+        )
+    albums = in_range(tables["albums_us"], start, end)
+    if params["exclude_soundtracks"]:
+        albums = albums[albums["artist"] != "Soundtrack"]
+    # generate_album_stats' longest reigning albums, for any n.
+    return albums.sort_values("weeks_at_one", ascending=False, kind="stable").head(params["n"])[
+        ["year", "album", "artist", "weeks_at_one"]
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--years", type=int, default=31)
+    parser.add_argument("--rows", type=int, default=20000, help="Hits rows per year.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    tables = random_tables(args.years, args.rows, rng)
+    start = time.perf_counter()
+    queries = AnalyticsQueries(tables)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    uncached = cached = recomputed = 0.0
+    misses = 0
+    for _ in range(args.queries):
+        query, params = random_query(rng, args.years)
+        start = time.perf_counter()
+        result = getattr(queries, query)(**params)
+        first = time.perf_counter() - start
+        # A query drawn twice is already cached; only runs that missed the cache count as uncached.
+        if queries.cache_info().misses > misses:
+            misses = queries.cache_info().misses
+            uncached += first
+        start = time.perf_counter()
+        again = getattr(queries, query)(**params)
+        cached += time.perf_counter() - start
+        start = time.perf_counter()
+        expected = recompute(tables, query, params).reset_index(drop=True)
+        recomputed += time.perf_counter() - start
+
+        pd.testing.assert_frame_equal(result, expected, check_dtype=query != "yearly_stats", obj=f"{query}({params})")
+        pd.testing.assert_frame_equal(again, result)
+
+    rows = sum(len(df) for df in tables.values())
+    info = queries.cache_info()
+    print(f"{args.queries} random queries: results equal recomputing over the range's rows")
+    print(f"{args.years} years, {rows} rows; cache {info.currsize} entries, {info.hits} hits")
+    print(f"build:                    {build_ms:9.1f} ms")
+    print(f"query, uncached:          {uncached / misses * 1000:9.2f} ms")
+    print(f"query, cached:            {cached / args.queries * 1000:9.2f} ms")
+    print(f"recompute over the rows:  {recomputed / args.queries * 1000:9.2f} ms  "
+          f"({recomputed / args.queries / (uncached / misses):.0f}x uncached)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Time rendering each year's rewind markup: inline per-row rendering vs the cached fragments.
+
+For every year in the data, renders the movies and hits tables, award and
+album cards and event lines the way the app did before fragments (iterrows,
+per-row pd.to_numeric and URL quoting), checks that render_year() produces
+the same strings and progress values, then reports per-year latency of the
+inline render, a cold render_year() and a cached fragment lookup.
+
+    python -m benchmarks.render --repeat 20
+"""
+from typing import Dict, List
+import argparse
+import statistics
+import time
+import urllib.parse
+
+import pandas as pd
+
+from src.fragments import YearFragments, render_year
+from src.snapshot import load_tables
+from src.year_index import YearIndex
+
+
+def inline_render(year: int, year_index: YearIndex) -> YearFragments:
+    """The app's per-rerun rendering before fragments, collected instead of emitted."""
+    year_data = year_index[year]
+
+    movies = None
+    year_movies = year_data.movies.head(5)
+    if not year_movies.empty:
+        movies = '<div class="retro-table-container"><table class="retro-table">'
+        movies += '<thead><tr><th>Rank</th><th>Title</th><th>Distributor</th><th>Box Office</th></tr></thead>'
+        movies += '<tbody>'
+        for _, row in year_movies.iterrows():
+            title = row['title']
+            gross = row['gross']
+            gross_str = f"$ {pd.to_numeric(gross, errors='coerce'):,.0f}" if pd.notnull(
+                pd.to_numeric(gross, errors="coerce")) else ""
+            url = row["url"] if "url" in row else None
+            if pd.isna(url) or not url:
+                url = f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
+            movies += f'<tr><td>{row["rank"]}</td><td><a href="{url}" target="_blank">{title}</a></td><td>{row["distributor"]}</td><td>{gross_str}</td></tr>'
+        movies += '</tbody></table></div>'
+
+    hits = None
+    year_music = year_data.hits.head(5)
+    if not year_music.empty:
+        hits = '<div class="retro-table-container"><table class="retro-table">'
+        hits += '<thead><tr><th>Rank</th><th>Song</th><th>Artist</th></tr></thead>'
+        hits += '<tbody>'
+        for _, row in year_music.iterrows():
+            title, artist = row['title'], row['display_artist']
+            url = f"https://www.youtube.com/results?search_query={urllib.parse.quote_plus(f'{artist} {title}')}"
+            hits += f'<tr><td>{row["rank"]}</td><td><a href="{url}" target="_blank">{title}</a></td><td>{artist}</td></tr>'
+        hits += '</tbody></table></div>'
+
+    best_film = None
+    best_row = year_data.best_film
+    if best_row is not None:
+        url = best_row["url"] if "url" in best_row.index else None
+        if pd.isna(url) or not url:
+            url = f"https://en.wikipedia.org/wiki/{best_row['winner'].replace(' ', '_')}"
+        best_film = f"""
+                <div class="award-card">
+                  <div class="award-badge">🏆 Academy Awards Winner</div>
+                  <div class="award-title"><a href="{url}" target="_blank">{best_row["winner"]}</a></div>
+                </div>
+                """
+
+    top_us_album = None
+    winner = year_data.top_us_album
+    if winner is not None:
+        album_title, album_artist = winner["album"], winner["artist"]
+        url = f"https://www.youtube.com/results?search_query={urllib.parse.quote_plus(f'{album_artist} {album_title} full album')}"
+        top_us_album = f"""
+                <div class="award-card">
+                <div class="award-badge">🎵 Album of the Year (US)</div>
+                <div class="award-title"><a href="{url}" target="_blank">{album_title}</a></div>
+                <div class="award-sub">{album_artist} • {int(winner["weeks_at_one"])} week(s) at #1</div>
+                </div>
+                """
+
+    global_album = None
+    top_album = year_data.global_album
+    if top_album is not None:
+        album_title, album_artist = top_album["album"], top_album["artist"]
+        url = f"https://www.youtube.com/results?search_query={urllib.parse.quote_plus(f'{album_artist} {album_title} full album')}"
+        global_album = f"""
+                    <div class="award-card">
+                    <div class="award-badge">🌍 Best Album Worldwide</div>
+                    <div class="award-title"><a href="{url}" target="_blank">{album_title}</a></div>
+                    <div class="award-sub">{album_artist}</div>
+                    </div>
+                    """
+
+    events = []
+    for _, r in year_data.events.iterrows():
+        event_text = r['event']
+        url = f"https://www.google.com/search?q={urllib.parse.quote_plus(f'{event_text} {year}')}"
+        events.append((f"**[{r['category'].title()}]** [{event_text}]({url})", r["importance"] / year_index.max_importance))
+
+    return YearFragments(movies, hits, best_film, top_us_album, global_album, events)
+
+
+def per_year_ms(years: List[int], repeat: int, render) -> List[float]:
+    """Return each year's fastest render time over repeat runs, in ms."""
+    times = []
+    for year in years:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            render(year)
+            best = min(best, time.perf_counter() - start)
+        times.append(best * 1000)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    tables = load_tables()
+    year_index = YearIndex(tables)
+    years = sorted({int(y) for name in ("highest_grossing", "events") for y in tables[name]["year"]})
+    for year in years:
+        assert inline_render(year, year_index) == render_year(year, year_index[year], year_index.max_importance), year
+
+    cache: Dict[int, YearFragments] = {}
+
+    def cached(year: int) -> YearFragments:
+        if year not in cache:
+            cache[year] = render_year(year, year_index[year], year_index.max_importance)
+        return cache[year]
+
+    for year in years:
+        cached(year)
+    results = {
+        "inline": per_year_ms(years, args.repeat, lambda year: inline_render(year, year_index)),
+        "render_year": per_year_ms(years, args.repeat, lambda year: render_year(year, year_index[year], year_index.max_importance)),
+        "cached": per_year_ms(years, args.repeat, cached),
+    }
+
+    print(f"{len(years)} years, identical output")
+    print(f"{'render':12s} {'median ms':>10s} {'max ms':>8s} {'all years ms':>13s}")
+    for name, times in results.items():
+        print(f"{name:12s} {statistics.median(times):10.4f} {max(times):8.4f} {sum(times):13.3f}")
+
+
+if __name__ == "__main__":
+    main()
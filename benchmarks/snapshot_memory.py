@@ -0,0 +1,119 @@
+"""
+Measure how memory grows with the number of app processes for CSV tables vs the mapped Arrow snapshot.
+
+Starts N replica processes that each load every processed table (like one
+Streamlit server process would) and read all of their values, then reports
+the summed PSS growth (proportional set size: shared pages are split between
+the processes mapping them) and private heap growth. With CSV every replica holds a private copy; with
+the snapshot the table data is shared page cache. Linux only (reads
+/proc/self/smaps_rollup).
+
+    python -m benchmarks.snapshot_memory --scale 200 --replicas 1,2,4,8
+"""
+from pathlib import Path
+from typing import Dict, List
+import argparse
+import multiprocessing as mp
+import tempfile
+import time
+
+import pandas as pd
+# Imported up front so each replica's baseline already includes the library code, in both modes.
+import pyarrow.compute  # noqa: F401
+import pyarrow.ipc  # noqa: F401
+
+from config import PROCESSED_DIR
+from src.columnar import SCHEMAS, csv_path, write_processed
+from src.snapshot import build_snapshot, read_snapshot
+
+
+def memory_kb() -> Dict[str, int]:
+    """Return this process's Pss and Anonymous (private heap) sizes in kB."""
+    sizes = {}
+    for line in Path("/proc/self/smaps_rollup").read_text().splitlines():
+        key, _, value = line.partition(":")
+        if key in ("Pss", "Anonymous"):
+            sizes[key] = int(value.split()[0])
+    return sizes
+
+
+def load_csv(directory: Path) -> Dict[str, pd.DataFrame]:
+    """Load the tables the way the app used to: one read_csv per table."""
+    return {name: pd.read_csv(csv_path(name, directory)) for name in SCHEMAS if csv_path(name, directory).exists()}
+
+
+def touch(tables: Dict[str, pd.DataFrame]) -> int:
+    """Read every value once so mapped pages are actually faulted in."""
+    total = 0
+    for df in tables.values():
+        for col in df.columns:
+            s = df[col]
+            if isinstance(s.dtype, pd.CategoricalDtype):
+                total += int(s.cat.codes.sum())
+            elif pd.api.types.is_numeric_dtype(s.dtype):
+                total += int(s.sum() != 0)
+            else:
+                total += int(s.str.len().sum())
+    return total
+
+
+def replica(mode: str, directory: str, barrier, results) -> None:
+    """Load and touch the tables, wait for every replica, then report memory growth."""
+    before = memory_kb()
+    start = time.perf_counter()
+    tables = load_csv(Path(directory)) if mode == "csv" else read_snapshot(Path(directory) / "snapshot.arrow")
+    load_seconds = time.perf_counter() - start
+    touch(tables)
+    barrier.wait()
+    # PSS splits shared pages between mappers, so read it while every replica still holds its tables.
+    after = memory_kb()
+    results.put((after["Pss"] - before["Pss"], after["Anonymous"] - before["Anonymous"], load_seconds))
+    barrier.wait()
+
+
+def run(mode: str, directory: Path, replicas: int) -> List:
+    """Start replica processes and collect (PSS growth kB, private growth kB, load seconds) from each."""
+    ctx = mp.get_context("spawn")
+    barrier, results = ctx.Barrier(replicas), ctx.Queue()
+    procs = [ctx.Process(target=replica, args=(mode, str(directory), barrier, results)) for _ in range(replicas)]
+    for p in procs:
+        p.start()
+    collected = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return collected
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processed-dir", type=Path, default=PROCESSED_DIR)
+    parser.add_argument("--scale", type=int, default=1, help="Repeat each table's rows this many times.")
+    parser.add_argument("--replicas", default="1,2,4", help="Comma-separated replica counts.")
+    args = parser.parse_args()
+    counts = [int(n) for n in args.replicas.split(",")]
+
+    if not Path("/proc/self/smaps_rollup").exists():
+        raise SystemExit("This benchmark reads /proc/self/smaps_rollup and only runs on Linux.")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for name in SCHEMAS:
+            if csv_path(name, args.processed_dir).exists():
+                df = pd.read_csv(csv_path(name, args.processed_dir))
+                write_processed(pd.concat([df] * args.scale, ignore_index=True), name, directory)
+        build_snapshot(directory / "snapshot.arrow")
+        size = (directory / "snapshot.arrow").stat().st_size
+
+        print(f"snapshot file: {size / 1e6:.1f} MB")
+        print(f"{'mode':9s} {'replicas':>8s} {'total PSS MB':>13s} {'private MB':>11s} {'per replica MB':>15s} {'load ms':>8s}")
+        for mode in ("csv", "snapshot"):
+            for n in counts:
+                collected = run(mode, directory, n)
+                pss = sum(kb for kb, _, _ in collected) / 1024
+                private = sum(kb for _, kb, _ in collected) / 1024
+                load = max(seconds for _, _, seconds in collected) * 1000
+                print(f"{mode:9s} {n:8d} {pss:13.1f} {private:11.1f} {pss / n:15.1f} {load:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Time the all-time top artists on a synthetic hits table: a mode per artist group vs counted credit pairs.
+
+Builds a hits table of --rows rows over --artists artists, each credited
+under a few spellings ("Boyz II Men", "BOYZ II MEN", "Boyz II Men ") whose
+counts tie often, with some missing titles and credits. It checks that
+generate_top_artists() gives the same table as the per-group mode lambda it
+used before for each --n, that ties="first_seen" picks the first credited of
+the most frequent spellings (at the largest --n), and reports the time of
+each at the first --n.
+
+    python -m benchmarks.top_artists --rows 1000000 --artists 20000 --n 20,200,20000
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.analytics import generate_top_artists
+
+
+def synthetic_hits(rows: int, artists: int, rng: random.Random) -> pd.DataFrame:
+    """Return a hits table with title, main_artist and display_artist columns, as clean_top_hits gives them."""
+    spellings = []
+    for i in range(artists):
+        name = f"Act {i}"
+        spellings.append([name, name.upper(), name.lower(), f"{name} "][:rng.randint(1, 4)])
+    # A few artists chart far more often than the rest, so the cut is not decided by ties alone.
+    weights = [1 / (i + 1) ** 0.5 for i in range(artists)]
+    picks = rng.choices(range(artists), weights=weights, k=rows)
+    main, display = [], []
+    for i in picks:
+        if rng.random() < 0.01:
+            main.append(np.nan)
+            display.append(np.nan)
+        else:
+            main.append(f"act {i}")
+            display.append(rng.choice(spellings[i]))
+    return pd.DataFrame({
+        "title": pd.Series([np.nan if rng.random() < 0.02 else f"Song {rng.randint(0, rows)}" for _ in range(rows)], dtype="str"),
+        "main_artist": pd.Series(main, dtype=object),
+        "display_artist": pd.Series(display, dtype=object),
+    })
+
+
+def mode_top_artists(df_music: pd.DataFrame, n: int) -> pd.DataFrame:
+    """What generate_top_artists did before: the mode of every artist's spellings, computed twice per group."""
+    display_map = (
+        df_music.groupby("main_artist")["display_artist"]
+        .agg(lambda x: x.mode().iat[0] if not x.mode().empty else x.iloc[0])
+    )
+    top = (
+        df_music.groupby("main_artist")
+        .agg(total_hits=("title", "count"))
+        .sort_values("total_hits", ascending=False)
+        .head(n)
+        .reset_index()
+    )
+    top["display_artist"] = top["main_artist"].map(display_map)
+    return top
+
+
+def first_seen_displays(df_music: pd.DataFrame) -> dict:
+    """Each artist's first credited of its most frequent spellings, counted row by row."""
+    counts = {}
+    for artist, display in zip(df_music["main_artist"], df_music["display_artist"]):
+        if isinstance(display, str):
+            spellings = counts.setdefault(artist, {})
+            spellings[display] = spellings.get(display, 0) + 1
+    # max() keeps the first of equal counts, and dicts keep insertion order.
+    return {artist: max(spellings, key=spellings.get) for artist, spellings in counts.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--artists", type=int, default=20000)
+    parser.add_argument("--n", default="20,200,20000", help="Comma-separated numbers of top artists to check.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    sizes = [int(n) for n in args.n.split(",")]
+
+    hits = synthetic_hits(args.rows, args.artists, random.Random(args.seed))
+    timings = {}
+    for n in sizes:
+        start = time.perf_counter()
+        expected = mode_top_artists(hits, n)
+        mode_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        top = generate_top_artists(hits, n)
+        counted_ms = (time.perf_counter() - start) * 1000
+        timings.setdefault("mode", mode_ms)
+        timings.setdefault("counted", counted_ms)
+        pd.testing.assert_frame_equal(top, expected)
+        print(f"n={n}: same table as the per-group mode ({counted_ms:.1f} vs {mode_ms:.1f} ms)")
+
+    n = max(sizes)
+    first_seen = generate_top_artists(hits, n, ties="first_seen")
+    reference = first_seen_displays(hits)
+    wrong = int((first_seen["display_artist"] != first_seen["main_artist"].map(reference)).sum())
+    print(f'ties="first_seen": {wrong} of {n} display names differ from a row-by-row count')
+
+    print(f"{args.rows} rows, {hits['main_artist'].nunique()} artists, top {sizes[0]}")
+    print(f"mode per artist group: {timings['mode']:9.1f} ms")
+    print(f"counted credit pairs:  {timings['counted']:9.1f} ms  ({timings['mode'] / timings['counted']:.1f}x)")
+    if wrong:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Time one year's rewind lookups with full-table filters vs the precomputed YearIndex.
+
+Tables are grown by appending shifted copies (more years, same rows per year)
+to show how each approach scales with table size. Lookups cycle through 31
+years, so the index time includes each year's first (unmemoized) lookup.
+
+    python -m benchmarks.year_lookup --scales 1,10,100
+"""
+from typing import Dict
+import argparse
+import time
+
+import pandas as pd
+
+from src.snapshot import load_tables
+from src.year_index import YearIndex
+
+
+def grow(tables: Dict[str, pd.DataFrame], scale: int) -> Dict[str, pd.DataFrame]:
+    """Append scale - 1 copies of each table with their years shifted past the original range."""
+    grown = {}
+    for name, df in tables.items():
+        if "year" not in df.columns or scale == 1:
+            grown[name] = df
+            continue
+        span = int(df["year"].max()) - int(df["year"].min()) + 1
+        copies = [df.assign(year=df["year"].astype("int64") + span * i) for i in range(scale)]
+        grown[name] = pd.concat(copies, ignore_index=True)
+    return grown
+
+
+def filter_lookup(tables: Dict[str, pd.DataFrame], year: int) -> None:
+    """The per-click filters the app used before the index."""
+    movies, hits, awards = tables["highest_grossing"], tables["top_hits"], tables["awards"]
+    albums_us, albums_global, events = tables["albums_us"], tables["albums_global"], tables["events"]
+    movies[movies["year"] == year].head(5)
+    hits[hits["year"] == year].head(5)
+    awards[(awards["category"].str.lower() == "best film") & (awards["year"] == year)]
+    year_albums = albums_us[albums_us["year"] == year]
+    year_albums.sort_values(["weeks_at_one", "rank"], ascending=[False, True]).head(1)
+    year_global = albums_global[albums_global["year"] == year]
+    year_global[year_global["rank"] == 1].head(1)
+    events[events["year"] == year].sort_values("importance", ascending=False)
+    events["importance"].max()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default="1,10,100")
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+
+    base = load_tables()
+    first_year = int(base["highest_grossing"]["year"].min())
+    years = [first_year + i % 31 for i in range(args.lookups)]
+    print(f"{'scale':>6s} {'movie rows':>10s} {'filter ms':>10s} {'index ms':>9s} {'index build ms':>15s}")
+    for scale in (int(s) for s in args.scales.split(",")):
+        tables = grow(base, scale)
+
+        start = time.perf_counter()
+        for year in years:
+            filter_lookup(tables, year)
+        filtered = (time.perf_counter() - start) / args.lookups
+
+        start = time.perf_counter()
+        index = YearIndex(tables)
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        for year in years:
+            index[year].movies.head(5)
+        indexed = (time.perf_counter() - start) / args.lookups
+
+        print(
+            f"{scale:6d} {len(tables['highest_grossing']):10d} {filtered * 1000:10.3f} "
+            f"{indexed * 1000:9.3f} {build * 1000:15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
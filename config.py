@@ -1,14 +1,65 @@
 from pathlib import Path
+import os
 
 BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
 RAW_DIR = DATA_DIR / "raw"
+PARTITIONS_DIR = RAW_DIR / "partitions"
 PROCESSED_DIR = DATA_DIR / "processed"
 HTML_DIR = DATA_DIR / "html"
+CACHE_DIR = DATA_DIR / "cache"
+# All processed tables in one memory-mapped Arrow file, written by build_dataset.py.
+SNAPSHOT_PATH = PROCESSED_DIR / "snapshot.arrow"
 
-HTML_CACHE_ENABLED = False
+# Keep downloaded pages and their validators in HTML_DIR. A rerun then revalidates each page with a
+# conditional GET and an unchanged page (304) is not downloaded again; with the cache off, every run
+# downloads every page to hash it against the partition manifest.
+HTML_CACHE_ENABLED = True
+HTML_CACHE_REVALIDATE = True
+
+# "bs4" (BeautifulSoup + html.parser) or "lxml"; both give the same raw CSVs.
+HTML_PARSER_BACKEND = "bs4"
 
 YEAR_START = 1985
 YEAR_END = 2015
 
 WIKI_ALBUM_YEARS = [1990, 1991, 1992, 1993, 1994, 1995, 2003, 2007, 2009]
+
+FETCH_MAX_WORKERS = 8
+FETCH_MAX_PER_HOST = 4
+FETCH_RATE_PER_HOST = 5.0
+FETCH_BURST_PER_HOST = 5
+
+HTTP_TIMEOUT = 15
+HTTP_MAX_RETRIES = 4
+HTTP_BACKOFF_BASE = 0.5
+HTTP_BACKOFF_MAX = 30.0
+# Send every HTTP request to this origin instead of the URL's own scheme and host, e.g. the
+# local replay server of benchmarks/pipeline.py; None talks to the real sites.
+HTTP_ORIGIN = None
+
+# Processes parsing downloaded pages; 1 parses in the main process. Overridden by --workers.
+PARSE_WORKERS = os.cpu_count() or 1
+
+# App timing mode: per-section times of every rerun, logged and shown at the bottom of the page.
+# Also switched on for one session by opening the app with ?timing=1.
+APP_TIMING_ENABLED = False
+APP_TIMING_BUDGET_MS = 250.0
+APP_TIMING_WINDOW = 500
+
+WIKI_API_URL = "https://en.wikipedia.org/w/api.php"
+RESOLVE_BATCH_SIZE = 50
+
+URL_CACHE_ENABLED = True
+URL_CACHE_PATH = CACHE_DIR / "film_urls.sqlite"
+URL_CACHE_TTL_DAYS = 30
+URL_CACHE_NEGATIVE_TTL_DAYS = 7
+URL_CACHE_MAX_ENTRIES = 20000
+
+# Keep per-year partial aggregates between builds and recompute only the years whose rows changed;
+# False recomputes the analytics tables over the full history.
+ANALYTICS_INCREMENTAL = True
+ANALYTICS_PARTIALS_DIR = CACHE_DIR / "analytics"
+
+# Results kept by each analytics query object (src/queries.py), least recently used dropped first.
+QUERY_CACHE_SIZE = 256
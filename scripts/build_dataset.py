@@ -3,10 +3,13 @@ import os
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from config import PROCESSED_DIR, RAW_DIR
+from config import ANALYTICS_INCREMENTAL, RAW_DIR
 
+from src.columnar import convert_csv, write_processed
+from src.snapshot import build_snapshot
 from src.preprocess import clean_awards, clean_gross, clean_top_hits, clean_albums_us, clean_albums_global
 from src.analytics import generate_yearly_stats, generate_top_artists, generate_best_picture_list, generate_album_stats
+from src.incremental import AnalyticsPartials
 
 
 def main() -> None:
@@ -14,36 +17,50 @@ def main() -> None:
     # 1. RUN PREPROCESSING
 
     df_awards = clean_awards()
-    df_awards.to_csv(PROCESSED_DIR / "awards.csv", index=False)
+    write_processed(df_awards, "awards")
 
     df_gross = clean_gross()
-    df_gross.to_csv(PROCESSED_DIR / "highest_grossing.csv", index=False)
+    write_processed(df_gross, "highest_grossing")
 
     df_hits = clean_top_hits()
-    df_hits.to_csv(PROCESSED_DIR / "top_hits.csv", index=False)
+    write_processed(df_hits, "top_hits")
 
     df_global = clean_albums_global(RAW_DIR / "albums_wiki.csv")
-    df_global.to_csv(PROCESSED_DIR / "albums_global.csv", index=False)
+    write_processed(df_global, "albums_global")
 
     df_us = clean_albums_us(RAW_DIR / "albums_billboard.csv")
-    df_us.to_csv(PROCESSED_DIR / "albums_us.csv", index=False)
+    write_processed(df_us, "albums_us")
 
-    # 2. RUN ANALYTICS
+    # 2. RUN ANALYTICS (from per-year partials, recomputing only the years that changed)
 
-    stats = generate_yearly_stats(df_gross, df_hits)
-    stats.to_csv(PROCESSED_DIR / "analytics_yearly_stats.csv", index=False)
+    if ANALYTICS_INCREMENTAL:
+        partials = AnalyticsPartials()
+        partials.update(df_gross, df_hits, df_us, df_global)
+        stats = partials.yearly_stats()
+        top_artists = partials.top_artists()
+        top_us_alb, top_us_art, top_glob_art = partials.album_stats()
+    else:
+        stats = generate_yearly_stats(df_gross, df_hits)
+        top_artists = generate_top_artists(df_hits)
+        top_us_alb, top_us_art, top_glob_art = generate_album_stats(df_us, df_global)
 
-    top_artists = generate_top_artists(df_hits)
-    top_artists.to_csv(PROCESSED_DIR / "analytics_top_artists.csv", index=False)
+    write_processed(stats, "analytics_yearly_stats")
+    write_processed(top_artists, "analytics_top_artists")
 
     best_pics = generate_best_picture_list(df_awards)
-    best_pics.to_csv(PROCESSED_DIR / "analytics_best_picture.csv", index=False)
+    write_processed(best_pics, "analytics_best_picture")
 
-    top_us_alb, top_us_art, top_glob_art = generate_album_stats(df_us, df_global)
+    write_processed(top_us_alb, "analytics_longest_reigning_albums")
+    write_processed(top_us_art, "analytics_top_billboard_artists")
+    write_processed(top_glob_art, "analytics_top_critics_artists")
 
-    top_us_alb.to_csv(PROCESSED_DIR / "analytics_longest_reigning_albums.csv", index=False)
-    top_us_art.to_csv(PROCESSED_DIR / "analytics_top_billboard_artists.csv", index=False)
-    top_glob_art.to_csv(PROCESSED_DIR / "analytics_top_critics_artists.csv", index=False)
+    # 3. TYPED COPY OF THE HAND-CURATED EVENTS
+
+    convert_csv("events")
+
+    # 4. SINGLE MEMORY-MAPPED SNAPSHOT FOR THE APP
+
+    build_snapshot()
 
 if __name__ == "__main__":
     main()
@@ -1,19 +1,30 @@
+from collections import Counter
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, List
+from itertools import chain
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import argparse
 import sys
 import re
 
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+import lxml.html
 import logging
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from config import HTML_DIR, RAW_DIR, WIKI_ALBUM_YEARS, YEAR_END, YEAR_START, HTML_CACHE_ENABLED
+from config import (
+    HTML_DIR, RAW_DIR, PARTITIONS_DIR, WIKI_ALBUM_YEARS, YEAR_END, YEAR_START, HTML_CACHE_ENABLED, HTML_CACHE_REVALIDATE,
+    FETCH_MAX_WORKERS, HTML_PARSER_BACKEND, PARSE_WORKERS,
+)
+from src import html_lxml
+from src.documents import DocumentStore, Page
+from src.http_client import default_client
+from src.html_cache import conditional_headers, read_cached_page, write_cached_page, write_validators
 from src.io_utils import ensure_data_dirs
+from src.partitions import PartitionStore, content_hash
 
 log = logging.getLogger(__name__)
 
@@ -21,9 +32,10 @@ FILM_URL = "https://en.wikipedia.org/wiki/{year}_in_film"
 MUSIC_URL = "https://en.wikipedia.org/wiki/{year}_in_music"
 SINGLES_BILLBOARD_URL = "https://en.wikipedia.org/wiki/Billboard_Year-End_Hot_100_singles_of_{year}"
 ALBUMS_BILLBOARD_URL = "https://en.wikipedia.org/wiki/List_of_Billboard_200_number-one_albums_of_{year}"
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-}
+
+YearFrames = Tuple[int, Dict[str, pd.DataFrame]]
+# A page to scrape: its year, (url, cache path) and the datasets (keys of SCRAPERS) read from it.
+PageJob = Tuple[int, Page, List[str]]
 
 
 def cached_film_path(year: int) -> Path:
@@ -48,7 +60,11 @@ def cached_billboard_albums_path(year: int) -> Path:
 
 def fetch_with_cache(url: str, cache_path: Path | None = None) -> str:
     """
-    Fetch a URL with a browser-like user agent and optionally cache the HTML locally.
+    Fetch a URL through the shared HTTP client and optionally cache the HTML locally.
+
+    With HTML_CACHE_REVALIDATE, a cached page is revalidated with a conditional
+    GET (If-None-Match / If-Modified-Since) and reused on 304 Not Modified;
+    otherwise cached pages are served without contacting the server.
 
     Args:
         url: Target URL.
@@ -57,58 +73,119 @@ def fetch_with_cache(url: str, cache_path: Path | None = None) -> str:
     Returns:
         HTML content as text.
     """
-    if HTML_CACHE_ENABLED:
-        HTML_DIR.mkdir(parents=True, exist_ok=True)
-        if cache_path.exists():
-            return cache_path.read_text(encoding="utf-8")
+    cached = read_cached_page(cache_path) if HTML_CACHE_ENABLED and cache_path else None
+    if cached and not HTML_CACHE_REVALIDATE:
+        return cached.html
+
+    headers = conditional_headers(cached) if cached else {}
+    resp = default_client().get(url, headers=headers)
+
+    if cached and resp.status_code == 304:
+        write_validators(cache_path, resp.headers, cached)
+        return cached.html
 
-    resp = requests.get(url, headers=HEADERS, timeout=15)
     resp.raise_for_status()
     html = resp.text
 
-    if HTML_CACHE_ENABLED:
-        cache_path.write_text(html, encoding=resp.encoding or "utf-8")
+    if HTML_CACHE_ENABLED and cache_path:
+        write_cached_page(cache_path, html, resp.headers)
     return html
 
 
+def film_page(year: int) -> Page:
+    """Return (url, cache path) of the film page for a year."""
+    return FILM_URL.format(year=year), cached_film_path(year)
+
+
+def music_page(year: int) -> Page:
+    """Return (url, cache path) of the music page for a year."""
+    return MUSIC_URL.format(year=year), cached_music_path(year)
+
+
+def billboard_singles_page(year: int) -> Page:
+    """Return (url, cache path) of the Billboard Year-End Hot 100 page for a year."""
+    return SINGLES_BILLBOARD_URL.format(year=year), cached_billboard_singles_path(year)
+
+
+def billboard_albums_page(year: int) -> Page:
+    """Return (url, cache path) of the Billboard 200 number-one albums page for a year."""
+    return ALBUMS_BILLBOARD_URL.format(year=year), cached_billboard_albums_path(year)
+
+
+def hits_page(year: int) -> Page:
+    """Return (url, cache path) of the page holding the year's hit singles (music page pre-2001, Billboard after)."""
+    if year <= 2000:
+        return music_page(year)
+    return billboard_singles_page(year)
+
+
 def fetch_film_page(year: int) -> str:
     """Fetch the film page for a year (with caching)."""
-    url = FILM_URL.format(year=year)
-    return fetch_with_cache(url, cached_film_path(year))
+    return fetch_with_cache(*film_page(year))
 
 
 def fetch_music_page(year: int) -> str:
     """Fetch the music page for a year (with caching)."""
-    url = MUSIC_URL.format(year=year)
-    return fetch_with_cache(url, cached_music_path(year))
+    return fetch_with_cache(*music_page(year))
 
 
 def fetch_billboard_singles_page(year: int) -> str:
     """Fetch the Billboard Year-End Hot 100 page for a year (with caching)."""
-    url = SINGLES_BILLBOARD_URL.format(year=year)
-    return fetch_with_cache(url, cached_billboard_singles_path(year))
+    return fetch_with_cache(*billboard_singles_page(year))
 
 
 def fetch_billboard_albums_page(year: int) -> str:
     """Fetch the Billboard 200 number-one albums page for a year (with caching)."""
-    url = ALBUMS_BILLBOARD_URL.format(year=year)
-    return fetch_with_cache(url, cached_billboard_albums_path(year))
+    return fetch_with_cache(*billboard_albums_page(year))
+
+
+def new_document_store() -> DocumentStore:
+    """Create a document store backed by fetch_with_cache, using the configured parser backend."""
+    return DocumentStore(fetch_with_cache, HTML_PARSER_BACKEND)
+
+
+def _is_lxml(node: Any) -> bool:
+    """Return True for nodes parsed by the lxml backend."""
+    return isinstance(node, lxml.html.HtmlElement)
+
+
+def _text(node: Any) -> str:
+    """Return a node's stripped text, space-joined (get_text(" ", strip=True))."""
+    return html_lxml.text(node) if _is_lxml(node) else node.get_text(" ", strip=True)
 
 
-def _section_tables(html: str, keyword: str) -> List[Any]:
+def _find_all(node: Any, names: str | List[str], recursive: bool = True) -> List[Any]:
+    """Return descendant (or child) elements with the given tag name(s)."""
+    if _is_lxml(node):
+        return html_lxml.find_all(node, [names] if isinstance(names, str) else names, recursive)
+    return node.find_all(names, recursive=recursive)
+
+
+def _following(node: Any) -> Iterable[Any]:
+    """Return the elements after a node in document order."""
+    return html_lxml.iter_following(node) if _is_lxml(node) else node.find_all_next()
+
+
+def _tag(node: Any) -> str:
+    """Return a node's tag name."""
+    return node.tag if _is_lxml(node) else node.name
+
+
+def _section_tables(doc: Any, keyword: str) -> List[Any]:
     """
     Return tables under the first heading matching a keyword.
 
     Args:
-        html: Raw HTML.
+        doc: Parsed page (BeautifulSoup or lxml root).
         keyword: Section heading text to match (case-insensitive).
 
     Returns:
         List of table tags following that heading.
     """
-    soup = BeautifulSoup(html, "html.parser")
     needle = keyword.lower()
-    for heading in soup.find_all(["h2", "h3"]):
+    if _is_lxml(doc):
+        return html_lxml.section_elements(doc, [needle], ["table"]) or []
+    for heading in doc.find_all(["h2", "h3"]):
         title = heading.get_text(" ", strip=True).lower()
         if needle in title:
             tables = []
@@ -126,11 +203,14 @@ def parse_html_table(table: Any) -> pd.DataFrame:
     Parse an HTML table into a DataFrame, handling simple rowspan/colspan.
 
     Args:
-        table: BeautifulSoup table element.
+        table: BeautifulSoup or lxml table element.
 
     Returns:
         DataFrame of the parsed table.
     """
+    if _is_lxml(table):
+        return html_lxml.parse_table(table)
+
     rows = table.find_all("tr")
     if not rows:
         return pd.DataFrame()
@@ -182,18 +262,19 @@ def parse_html_table(table: Any) -> pd.DataFrame:
     return pd.DataFrame(data, columns=headers)
 
 
-def scrape_highest_grossing(year: int) -> pd.DataFrame:
+def scrape_highest_grossing(year: int, store: DocumentStore | None = None) -> pd.DataFrame:
     """
     Scrape the highest-grossing films table for a given year.
 
     Args:
         year: Target year.
+        store: Document store shared by the run; a private one is used when omitted.
 
     Returns:
         DataFrame with rank, title, distributor, gross, year.
     """
-    html = fetch_film_page(year)
-    tables = _section_tables(html, "highest-grossing")
+    doc = (store or new_document_store()).document(*film_page(year))
+    tables = _section_tables(doc, "highest-grossing")
     if not tables:
         return pd.DataFrame()
     df = parse_html_table(tables[0]).ffill()
@@ -214,32 +295,32 @@ def scrape_highest_grossing(year: int) -> pd.DataFrame:
     return df
 
 
-def scrape_awards(year: int) -> pd.DataFrame:
+def scrape_awards(year: int, store: DocumentStore | None = None) -> pd.DataFrame:
     """
     Scrape awards tables for a given year, keeping only category/org + Academy Awards columns.
 
     Args:
         year: Target year.
+        store: Document store shared by the run; a private one is used when omitted.
 
     Returns:
         DataFrame with category, winner, year.
     """
-    html = fetch_film_page(year)
-    tables = _section_tables(html, "awards")
-    soup = BeautifulSoup(html, "html.parser")
+    doc = (store or new_document_store()).document(*film_page(year))
+    tables = _section_tables(doc, "awards")
     if not tables:
-        for heading in soup.find_all(["h2", "h3"]):
-            if "awards" in heading.get_text(" ", strip=True).lower():
+        for heading in _find_all(doc, ["h2", "h3"]):
+            if "awards" in _text(heading).lower():
                 rows = []
-                for sib in heading.find_all_next():
-                    if sib.name in ("h2", "h3") and sib is not heading:
+                for sib in _following(heading):
+                    if _tag(sib) in ("h2", "h3") and sib is not heading:
                         break
-                    if sib.name in ("b", "strong", "p"):
-                        txt = sib.get_text(" ", strip=True).lower()
+                    if _tag(sib) in ("b", "strong", "p"):
+                        txt = _text(sib).lower()
                         if rows and any(key in txt for key in ["golden", "palme"]):
                             break
-                    if sib.name == "dd":
-                        text = sib.get_text(" ", strip=True)
+                    if _tag(sib) == "dd":
+                        text = _text(sib)
                         if ":" in text:
                             cat, win = text.split(":", 1)
                             rows.append({"category": cat.strip(), "winner": win.strip(), "year": year})
@@ -277,12 +358,13 @@ def scrape_awards(year: int) -> pd.DataFrame:
     return df
 
 
-def scrape_wiki_albums(year: int) -> pd.DataFrame:
+def scrape_wiki_albums(year: int, store: DocumentStore | None = None) -> pd.DataFrame:
     """
     Scrape top albums from a year-in-music page (only for configured years).
 
     Args:
         year: Target year.
+        store: Document store shared by the run; a private one is used when omitted.
 
     Returns:
         DataFrame with rank, artist, album, year (empty if year unsupported).
@@ -290,8 +372,7 @@ def scrape_wiki_albums(year: int) -> pd.DataFrame:
     if year not in WIKI_ALBUM_YEARS:
         return pd.DataFrame()
 
-    html = fetch_music_page(year)
-    soup = BeautifulSoup(html, "html.parser")
+    doc = (store or new_document_store()).document(*music_page(year))
     keywords = [
         "top ten best albums",
         "top 10 best albums",
@@ -300,8 +381,8 @@ def scrape_wiki_albums(year: int) -> pd.DataFrame:
         "top 5 albums",
     ]
     heading = None
-    for h in soup.find_all(["h2", "h3"]):
-        title = h.get_text(" ", strip=True).lower()
+    for h in _find_all(doc, ["h2", "h3"]):
+        title = _text(h).lower()
         if any(k in title for k in keywords):
             heading = h
             break
@@ -310,12 +391,12 @@ def scrape_wiki_albums(year: int) -> pd.DataFrame:
 
     tables = []
     lists = []
-    for sibling in heading.find_all_next():
-        if sibling.name in ("h2", "h3") and sibling is not heading:
+    for sibling in _following(heading):
+        if _tag(sibling) in ("h2", "h3") and sibling is not heading:
             break
-        if sibling.name == "table":
+        if _tag(sibling) == "table":
             tables.append(sibling)
-        if sibling.name in ("ul", "ol"):
+        if _tag(sibling) in ("ul", "ol"):
             lists.append(sibling)
 
     if tables:
@@ -338,8 +419,8 @@ def scrape_wiki_albums(year: int) -> pd.DataFrame:
     elif lists:
         items = []
         rank = 1
-        for li in lists[0].find_all("li", recursive=False):
-            text = li.get_text(" ", strip=True)
+        for li in _find_all(lists[0], "li", recursive=False):
+            text = _text(li)
             text = re.sub(r"^\d+\.\s*", "", text)
             artist, album = None, None
             for sep in [" – ", " - ", "–", "-"]:
@@ -360,26 +441,26 @@ def scrape_wiki_albums(year: int) -> pd.DataFrame:
     return df[["rank", "artist", "album", "year"]]
 
 
-def scrape_billboard_albums(year: int) -> pd.DataFrame:
+def scrape_billboard_albums(year: int, store: DocumentStore | None = None) -> pd.DataFrame:
     """
     Scrape Billboard 200 number-one albums list for a given year.
 
     Args:
         year: Target year.
+        store: Document store shared by the run; a private one is used when omitted.
 
     Returns:
         DataFrame with issue_date, album, artist, notes, year.
     """
-    html = fetch_billboard_albums_page(year)
-    soup = BeautifulSoup(html, "html.parser")
+    doc = (store or new_document_store()).document(*billboard_albums_page(year))
     tables = (
-        _section_tables(html, "chart history")
-        or _section_tables(html, "number-ones")
-        or soup.find_all("table")
+        _section_tables(doc, "chart history")
+        or _section_tables(doc, "number-ones")
+        or _find_all(doc, "table")
     )
     table = None
     for t in tables:
-        header_text = " ".join(h.get_text(" ", strip=True).lower() for h in t.find_all("th"))
+        header_text = " ".join(_text(h).lower() for h in _find_all(t, "th"))
         if any(key in header_text for key in ["issue", "date", "album", "artist"]):
             table = t
             break
@@ -412,33 +493,33 @@ def scrape_billboard_albums(year: int) -> pd.DataFrame:
     return df
 
 
-def scrape_top_hits(year: int) -> pd.DataFrame:
+def scrape_top_hits(year: int, store: DocumentStore | None = None) -> pd.DataFrame:
     """
     Scrape biggest hit singles for a year (music pages pre-2001, Billboard after).
 
     Args:
         year: Target year.
+        store: Document store shared by the run; a private one is used when omitted.
 
     Returns:
         DataFrame with rank, artist, title, year.
     """
     desired_cols = ["rank", "artist", "title"]
 
+    doc = (store or new_document_store()).document(*hits_page(year))
+
     if year <= 2000:
-        html = fetch_music_page(year)
-        tables = _section_tables(html, "biggest hit singles")
+        tables = _section_tables(doc, "biggest hit singles")
         if not tables:
             return pd.DataFrame()
         df = parse_html_table(tables[0]).iloc[:, :3]
         rename_map = {df.columns[i]: desired_cols[i] for i in range(min(len(df.columns), len(desired_cols)))}
         df = df.rename(columns=rename_map)
     else:
-        html = fetch_billboard_singles_page(year)
-        soup = BeautifulSoup(html, "html.parser")
-        tables = _section_tables(html, "list") or soup.find_all("table")
+        tables = _section_tables(doc, "list") or _find_all(doc, "table")
         table = None
         for t in tables:
-            header_text = " ".join([h.get_text(" ", strip=True).lower() for h in t.find_all("th")])
+            header_text = " ".join([_text(h).lower() for h in _find_all(t, "th")])
             if any(key in header_text for key in ["title", "artist", "no", "№"]):
                 table = t
                 break
@@ -463,118 +544,355 @@ def scrape_top_hits(year: int) -> pd.DataFrame:
     return df
 
 
-def scrape_films_range(year_start: int = 1985, year_end: int = 2015) -> tuple[pd.DataFrame, pd.DataFrame]:
+def _scrape_billboard_albums_partition(year: int, store: DocumentStore) -> pd.DataFrame:
+    """Scrape one Billboard albums year into the fixed raw column layout."""
+    df = scrape_billboard_albums(year, store)
+    if df.empty:
+        return df
+    base_cols = ["date", "album", "artist", "label", "sales", "year"]
+    df = df.loc[:, ~df.columns.duplicated()]
+    return df.reindex(columns=base_cols)
+
+
+# Dataset name -> scraper, as run by the parse stage.
+SCRAPERS: Dict[str, Callable[[int, DocumentStore], pd.DataFrame]] = {
+    "highest_grossing": scrape_highest_grossing,
+    "awards": scrape_awards,
+    "top_hits": scrape_top_hits,
+    "albums_wiki": scrape_wiki_albums,
+    "albums_billboard": _scrape_billboard_albums_partition,
+}
+
+
+def _target_years(all_years: Iterable[int], years: Optional[Collection[int]]) -> List[int]:
+    """Return the years to visit: all of them, or only the selected ones inside the range."""
+    return [year for year in all_years if years is None or year in years]
+
+
+def _page_jobs(reads: Iterable[Tuple[str, int, Page]]) -> Dict[str, PageJob]:
     """
-    Scrape highest-grossing and awards tables across a year range and persist CSVs.
+    Group dataset reads by page, so a page read by several datasets is parsed once for all of them.
 
     Args:
-        year_start: First year inclusive.
-        year_end: Last year inclusive.
+        reads: (dataset name, year, page) for every partition to scrape.
 
     Returns:
-        Tuple of (highest_grossing_df, awards_df).
+        Page URL -> (year, page, dataset names reading it), in year order.
     """
-    hg_frames = []
-    awards_frames = []
+    jobs: Dict[str, PageJob] = {}
+    for dataset, year, page in sorted(reads, key=lambda read: read[1]):
+        jobs.setdefault(page[0], (year, page, []))[2].append(dataset)
+    return jobs
 
-    for year in range(year_start, year_end + 1):
-        hg = scrape_highest_grossing(year)
-        if not hg.empty:
-            hg_frames.append(hg)
 
-        aw = scrape_awards(year)
-        if not aw.empty:
-            awards_frames.append(aw)
+def _parse_year(datasets: Sequence[str], year: int, html: str, backend: str) -> Tuple[Dict[str, pd.DataFrame], Counter]:
+    """
+    Run the scrapers of the given datasets over one downloaded page.
 
-    highest = pd.concat(hg_frames, ignore_index=True) if hg_frames else pd.DataFrame()
-    awards = pd.concat(awards_frames, ignore_index=True) if awards_frames else pd.DataFrame()
+    Module-level so it can run in a worker process: the page HTML is passed in
+    and parsed there, nothing is fetched.
 
-    if not highest.empty:
-        highest.to_csv(RAW_DIR / "highest_grossing.csv", index=False)
-    if not awards.empty:
-        awards.to_csv(RAW_DIR / "awards.csv", index=False)
+    Args:
+        datasets: Dataset names (keys of SCRAPERS) reading this page.
+        year: Page year.
+        html: Page HTML.
+        backend: HTML parser backend.
 
-    return highest, awards
+    Returns:
+        Mapping of dataset name to its frame for the year, and the parses and
+        reused trees counted while scraping (for the run's document store stats).
+    """
+    store = DocumentStore(lambda url, cache_path: html, backend)
+    frames = {dataset: SCRAPERS[dataset](year, store) for dataset in datasets}
+    return frames, Counter({key: store.stats[key] for key in ("parses", "tree_reuses")})
+
+
+def _scrape_partitions(
+    jobs: Dict[str, PageJob],
+    store: DocumentStore,
+    partitions: PartitionStore,
+    force: bool,
+    pool: Executor | None = None,
+) -> Iterator[YearFrames]:
+    """
+    Download each page and rebuild the partitions whose source changed.
+
+    With a pool, pages are handed to it as soon as they are downloaded, so
+    parsing runs in parallel with the remaining downloads. Finished parses are
+    committed in job order as soon as every earlier page is done too, so
+    results are written and yielded in year order whatever order the workers
+    finish in, and only pages waiting on an earlier one are held in memory.
+    The manifest is checkpointed after every page, so an interrupted run
+    resumes with the years it had not finished.
 
+    A page's hash is checked against the manifest only after it is fetched.
+    With HTML_CACHE_ENABLED (the default) and HTML_CACHE_REVALIDATE, an
+    unchanged page comes back as a 304 and its cached copy is hashed, so
+    nothing is downloaded again; with the cache off, every page is downloaded.
 
-def scrape_music_range(year_start: int = 1985, year_end: int = 2015) -> pd.DataFrame:
+    Args:
+        jobs: Page URL -> (year, page, dataset names), as _page_jobs gives them.
+        store: Document store shared by the run.
+        partitions: Partition store to update.
+        force: Rescrape every year even when the page hash matches the manifest.
+        pool: Process pool for the parse stage; parse in this process when omitted.
+
+    Returns:
+        Iterator of (year, {dataset: frame}) for each page scraped, yielded once
+        its partitions and checkpoint are on disk.
     """
-    Scrape top hits across a year range and persist a CSV.
+    def commit(year: int, digest: str, frames: Dict[str, pd.DataFrame]) -> Optional[YearFrames]:
+        for dataset, df in frames.items():
+            partitions.write(dataset, year, df, digest)
+        if frames:
+            partitions.save()
+            return year, frames
+        return None
+
+    # Pool mode: downloaded pages by URL, with (digest, parse future) or None when nothing is stale.
+    order = list(jobs)
+    downloaded: Dict[str, Optional[Tuple[str, Future]]] = {}
+    next_job = 0
+
+    def drain(wait: bool) -> Iterator[YearFrames]:
+        """Commit downloaded pages in job order up to the first one not downloaded (or, unless wait, not parsed)."""
+        nonlocal next_job
+        while next_job < len(order) and order[next_job] in downloaded:
+            url = order[next_job]
+            parse = downloaded[url]
+            if parse is not None:
+                digest, future = parse
+                if not wait and not future.done():
+                    return
+                frames, counts = future.result()
+                store.add_stats(counts)
+                scraped = commit(jobs[url][0], digest, frames)
+                if scraped:
+                    yield scraped
+            del downloaded[url]
+            next_job += 1
+
+    for url in store.prefetch({url: page for url, (_, page, _) in jobs.items()}, FETCH_MAX_WORKERS):
+        year, page, datasets = jobs[url]
+        html = store.html(*page)
+        digest = content_hash(html)
+        stale = [d for d in datasets if force or not partitions.is_current(d, year, digest)]
+        if pool is not None:
+            downloaded[url] = (digest, pool.submit(_parse_year, stale, year, html, store.backend)) if stale else None
+            yield from drain(wait=False)
+        else:
+            scraped = commit(year, digest, {dataset: SCRAPERS[dataset](year, store) for dataset in stale})
+            if scraped:
+                yield scraped
+        store.release(url)
+
+    yield from drain(wait=True)
+
+
+def scrape_films_range(
+    year_start: int = 1985,
+    year_end: int = 2015,
+    store: DocumentStore | None = None,
+    partitions: PartitionStore | None = None,
+    years: Optional[Collection[int]] = None,
+    pool: Executor | None = None,
+) -> Iterator[YearFrames]:
+    """
+    Scrape highest-grossing and awards tables across a year range and persist CSVs.
+
+    Pages are downloaded concurrently; only years whose page changed since the
+    last run (or that have no partition yet) are parsed, and each one is written
+    to disk as soon as it is parsed. Once the range is exhausted the CSVs are
+    rebuilt from the per-year partitions in year order.
 
     Args:
         year_start: First year inclusive.
         year_end: Last year inclusive.
+        store: Document store shared by the run; a private one is used when omitted.
+        partitions: Raw partition store; defaults to PARTITIONS_DIR.
+        years: Years to force-rescrape; other years keep their partitions untouched.
+        pool: Process pool for the parse stage; parse in this process when omitted.
 
     Returns:
-        DataFrame of concatenated hits.
+        Iterator of (year, {"highest_grossing": df, "awards": df}) per scraped year.
     """
-    frames = []
-    for year in range(year_start, year_end + 1):
-        df = scrape_top_hits(year)
-        if not df.empty:
-            frames.append(df)
-    hits = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
-    if not hits.empty:
-        hits.to_csv(RAW_DIR / "top_hits.csv", index=False)
-    return hits
+    store = store or new_document_store()
+    partitions = partitions or PartitionStore(PARTITIONS_DIR)
+    all_years = range(year_start, year_end + 1)
 
+    reads = [
+        (dataset, year, film_page(year))
+        for year in _target_years(all_years, years) for dataset in ("highest_grossing", "awards")
+    ]
+    yield from _scrape_partitions(_page_jobs(reads), store, partitions, years is not None, pool)
+
+    partitions.write_merged("highest_grossing", all_years, RAW_DIR / "highest_grossing.csv")
+    partitions.write_merged("awards", all_years, RAW_DIR / "awards.csv")
+
+
+def scrape_music_range(
+    year_start: int = 1985,
+    year_end: int = 2015,
+    store: DocumentStore | None = None,
+    partitions: PartitionStore | None = None,
+    years: Optional[Collection[int]] = None,
+    pool: Executor | None = None,
+    with_wiki_albums: bool = False,
+) -> Iterator[YearFrames]:
+    """
+    Scrape top hits across a year range and persist a CSV.
+
+    Args:
+        year_start: First year inclusive.
+        year_end: Last year inclusive.
+        store: Document store shared by the run; a private one is used when omitted.
+        partitions: Raw partition store; defaults to PARTITIONS_DIR.
+        years: Years to force-rescrape; other years keep their partitions untouched.
+        pool: Process pool for the parse stage; parse in this process when omitted.
+        with_wiki_albums: Also scrape the wiki album lists, as scrape_wiki_albums_range
+            does; music pages read by both are downloaded and parsed once.
 
-def scrape_wiki_albums_range() -> pd.DataFrame:
+    Returns:
+        Iterator of (year, {"top_hits": df}) per scraped page, with "albums_wiki"
+        for the music pages that hold an album list when with_wiki_albums is set.
+    """
+    store = store or new_document_store()
+    partitions = partitions or PartitionStore(PARTITIONS_DIR)
+    all_years = range(year_start, year_end + 1)
+
+    reads = [("top_hits", year, hits_page(year)) for year in _target_years(all_years, years)]
+    if with_wiki_albums:
+        reads += [("albums_wiki", year, music_page(year)) for year in _target_years(WIKI_ALBUM_YEARS, years)]
+    yield from _scrape_partitions(_page_jobs(reads), store, partitions, years is not None, pool)
+
+    partitions.write_merged("top_hits", all_years, RAW_DIR / "top_hits.csv")
+    if with_wiki_albums:
+        partitions.write_merged("albums_wiki", WIKI_ALBUM_YEARS, RAW_DIR / "albums_wiki.csv")
+
+
+def scrape_wiki_albums_range(
+    store: DocumentStore | None = None,
+    partitions: PartitionStore | None = None,
+    years: Optional[Collection[int]] = None,
+    pool: Executor | None = None,
+) -> Iterator[YearFrames]:
     """
     Scrape available wiki album lists and persist a CSV.
 
+    Args:
+        store: Document store shared by the run; a private one is used when omitted.
+        partitions: Raw partition store; defaults to PARTITIONS_DIR.
+        years: Years to force-rescrape; other years keep their partitions untouched.
+        pool: Process pool for the parse stage; parse in this process when omitted.
+
     Returns:
-        DataFrame of concatenated wiki album entries.
+        Iterator of (year, {"albums_wiki": df}) per scraped year.
     """
-    frames = []
-    for year in WIKI_ALBUM_YEARS:
-        df = scrape_wiki_albums(year)
-        if not df.empty:
-            frames.append(df)
-    albums = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
-    if not albums.empty:
-        albums.to_csv(RAW_DIR / "albums_wiki.csv", index=False)
-    return albums
+    store = store or new_document_store()
+    partitions = partitions or PartitionStore(PARTITIONS_DIR)
+
+    reads = [("albums_wiki", year, music_page(year)) for year in _target_years(WIKI_ALBUM_YEARS, years)]
+    yield from _scrape_partitions(_page_jobs(reads), store, partitions, years is not None, pool)
 
+    partitions.write_merged("albums_wiki", WIKI_ALBUM_YEARS, RAW_DIR / "albums_wiki.csv")
 
-def scrape_billboard_albums_range(year_start: int = 1985, year_end: int = 2015) -> pd.DataFrame:
+
+def scrape_billboard_albums_range(
+    year_start: int = 1985,
+    year_end: int = 2015,
+    store: DocumentStore | None = None,
+    partitions: PartitionStore | None = None,
+    years: Optional[Collection[int]] = None,
+    pool: Executor | None = None,
+) -> Iterator[YearFrames]:
     """
     Scrape Billboard 200 number-one albums across a year range and persist a CSV.
 
     Args:
         year_start: First year inclusive.
         year_end: Last year inclusive.
+        store: Document store shared by the run; a private one is used when omitted.
+        partitions: Raw partition store; defaults to PARTITIONS_DIR.
+        years: Years to force-rescrape; other years keep their partitions untouched.
+        pool: Process pool for the parse stage; parse in this process when omitted.
 
     Returns:
-        DataFrame of concatenated Billboard album entries.
+        Iterator of (year, {"albums_billboard": df}) per scraped year.
     """
-    frames = []
-    for year in range(year_start, year_end + 1):
-        df = scrape_billboard_albums(year)
-        if not df.empty:
-            frames.append(df)
-    if frames:
-        base_cols = ["date", "album", "artist", "label", "sales", "year"]
-        cleaned = []
-        for f in frames:
-            f = f.loc[:, ~f.columns.duplicated()]
-            cleaned.append(f.reindex(columns=base_cols))
-        albums = pd.concat(cleaned, ignore_index=True)
-    else:
-        albums = pd.DataFrame()
-    if not albums.empty:
-        albums.to_csv(RAW_DIR / "albums_billboard.csv", index=False)
-    return albums
+    store = store or new_document_store()
+    partitions = partitions or PartitionStore(PARTITIONS_DIR)
+    all_years = range(year_start, year_end + 1)
+
+    reads = [("albums_billboard", year, billboard_albums_page(year)) for year in _target_years(all_years, years)]
+    yield from _scrape_partitions(_page_jobs(reads), store, partitions, years is not None, pool)
+
+    partitions.write_merged("albums_billboard", all_years, RAW_DIR / "albums_billboard.csv")
 
 
-def main() -> None:
+def parse_years(spec: str) -> List[int]:
+    """
+    Parse a year selector such as "1990,1995-1997".
+
+    Args:
+        spec: Comma-separated years or inclusive ranges.
+
+    Returns:
+        Sorted list of selected years.
+    """
+    years = set()
+    try:
+        for part in spec.split(","):
+            part = part.strip()
+            if "-" in part:
+                start, end = part.split("-", 1)
+                years.update(range(int(start), int(end) + 1))
+            elif part:
+                years.add(int(part))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid year selector: {spec!r}")
+    return sorted(years)
+
+
+def main(argv: List[str] | None = None) -> None:
     """Run all scrape steps and write raw CSVs."""
+    parser = argparse.ArgumentParser(description="Scrape Wikipedia/Billboard pages into raw CSVs.")
+    parser.add_argument(
+        "--years", type=parse_years, default=None,
+        help="Years to force-rescrape, e.g. 1990,1995-1997. Other years keep their partitions.",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=PARSE_WORKERS,
+        help=f"Processes parsing pages (default {PARSE_WORKERS}); 1 parses in the main process.",
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
     ensure_data_dirs()
-    scrape_films_range(YEAR_START, YEAR_END)
-    scrape_music_range(YEAR_START, YEAR_END)
-    scrape_wiki_albums_range()
-    scrape_billboard_albums_range(YEAR_START, YEAR_END)
+    store = new_document_store()
+    partitions = PartitionStore(PARTITIONS_DIR)
+
+    pool = ProcessPoolExecutor(args.workers) if args.workers > 1 else None
+    try:
+        steps = [
+            scrape_films_range(YEAR_START, YEAR_END, store, partitions, args.years, pool),
+            # Music pages up to 2000 feed both the hits and the wiki album scrapers: one job each.
+            scrape_music_range(YEAR_START, YEAR_END, store, partitions, args.years, pool, with_wiki_albums=True),
+            scrape_billboard_albums_range(YEAR_START, YEAR_END, store, partitions, args.years, pool),
+        ]
+        for year, frames in chain.from_iterable(steps):
+            log.info(f"Scraped {year}: " + ", ".join(f"{name} ({len(df)} rows)" for name, df in frames.items()))
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    log.info(
+        "Document store: %d downloads, %d parses, %d reused trees",
+        store.stats["downloads"], store.stats["parses"], store.stats["tree_reuses"],
+    )
+    default_client().log_summary("HTTP")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     main()
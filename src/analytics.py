@@ -1,6 +1,14 @@
 from typing import Tuple
 import pandas as pd
 
+# Rows kept by the all-time rankings.
+TOP_ARTISTS = 20
+TOP_ALBUMS = 20
+TOP_ALBUM_ARTISTS = 10
+# How a tie between equally frequent credit spellings is settled.
+DISPLAY_TIES = ("alphabetical", "first_seen")
+
+
 def generate_yearly_stats(df_gross: pd.DataFrame, df_music: pd.DataFrame) -> pd.DataFrame:
     """
     Merge box office totals and unique song counts by year.
@@ -19,29 +27,59 @@ def generate_yearly_stats(df_gross: pd.DataFrame, df_music: pd.DataFrame) -> pd.
     return stats
 
 
-def generate_top_artists(df_music: pd.DataFrame) -> pd.DataFrame:
+def pick_display_names(credits: pd.DataFrame, ties: str = "alphabetical") -> pd.Series:
     """
-    Calculate top 20 artists of all time.
+    Pick each artist's most frequent credit spelling from counted (main_artist, display_artist) pairs.
 
     Args:
-        df_music: Cleaned top hits data.
+        credits: main_artist, display_artist and rows (how often the pair is
+            credited); for ties="first_seen", in order of first appearance.
+        ties: Which spelling wins a tie: "alphabetical" (the first in sort
+            order, as Series.mode gives) or "first_seen" (the first credited).
 
     Returns:
-        DataFrame with main_artist, display_artist, total_hits (top 20).
+        display_artist indexed by main_artist.
     """
-    display_map = (
-        df_music.groupby("main_artist")["display_artist"]
-        .agg(lambda x: x.mode().iat[0] if not x.mode().empty else x.iloc[0])
-    )
+    if ties not in DISPLAY_TIES:
+        raise ValueError(f"ties must be one of {', '.join(DISPLAY_TIES)}, got {ties!r}")
+    if ties == "alphabetical":
+        order = credits.sort_values(["main_artist", "rows", "display_artist"], ascending=[True, False, True])
+    else:
+        # Multi-column sorts are stable, so equal counts keep appearance order.
+        order = credits.sort_values(["main_artist", "rows"], ascending=[True, False])
+    return order.drop_duplicates("main_artist").set_index("main_artist")["display_artist"]
+
+
+def generate_top_artists(df_music: pd.DataFrame, n: int = TOP_ARTISTS, ties: str = "alphabetical") -> pd.DataFrame:
+    """
+    Calculate the top n artists of all time.
 
+    Display names are resolved only for the n artists kept: their
+    (main_artist, display_artist) pairs are counted and the most frequent
+    spelling of each is taken.
+
+    Args:
+        df_music: Cleaned top hits data.
+        n: Artists to keep.
+        ties: Which spelling wins a tie, see pick_display_names.
+
+    Returns:
+        DataFrame with main_artist, total_hits, display_artist (most frequent credit spelling).
+    """
     top = (
         df_music.groupby("main_artist")
         .agg(total_hits=("title", "count"))
         .sort_values("total_hits", ascending=False)
-        .head(20)
+        .head(n)
         .reset_index()
     )
-    top["display_artist"] = top["main_artist"].map(display_map)
+    credits = (
+        df_music.loc[df_music["main_artist"].isin(top["main_artist"]), ["main_artist", "display_artist"]]
+        .value_counts(sort=False)
+        .reset_index(name="rows")
+    )
+    # An artist credited only with missing spellings has no display name, as before.
+    top["display_artist"] = top["main_artist"].map(pick_display_names(credits, ties))
     return top
 
 
@@ -72,10 +110,10 @@ def generate_album_stats(df_us: pd.DataFrame, df_global: pd.DataFrame) -> Tuple[
         Tuple of (top_us_albums, top_us_artists, top_global_artists).
     """
 
-    # Who spent the most weeks at #1 across all years?
+    # Who spent the most weeks at #1 across all years? Ties keep table (year) order.
     top_us_albums = (
-        df_us.sort_values("weeks_at_one", ascending=False)
-        .head(20)
+        df_us.sort_values("weeks_at_one", ascending=False, kind="stable")
+        .head(TOP_ALBUMS)
         [["year", "album", "artist", "weeks_at_one"]]
     )
 
@@ -84,7 +122,7 @@ def generate_album_stats(df_us: pd.DataFrame, df_global: pd.DataFrame) -> Tuple[
         df_us.groupby("artist")["weeks_at_one"].sum()
         .reset_index()
         .sort_values("weeks_at_one", ascending=False)
-        .head(10)
+        .head(TOP_ALBUM_ARTISTS)
         .rename(columns={"weeks_at_one": "total_weeks_at_one"})
     )
 
@@ -93,6 +131,6 @@ def generate_album_stats(df_us: pd.DataFrame, df_global: pd.DataFrame) -> Tuple[
         df_global["artist"].value_counts()
         .reset_index(name="count")
         .rename(columns={"index": "artist"})
-        .head(10)
+        .head(TOP_ALBUM_ARTISTS)
     )
     return top_us_albums, top_us_artists, top_global_artists
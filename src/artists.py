@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+from functools import lru_cache
+import re
+
+import numpy as np
+import pandas as pd
+
+# Anything from the first of these on is a featured or partner act: "Usher, Lil Jon & Ludacris" -> "Usher".
+SEPARATORS = re.compile(r",|\s*&\s*|\bwith\b|\bfeaturing\b|\band\b|\bor\b")
+# Credits that mark a collaboration without cutting the name.
+FEATURE_MARKERS = re.compile(r":|\bfeat\.?\b|\bft\.?\b")
+
+
+@dataclass(frozen=True)
+class ArtistName:
+    """One artist credit split into the lead act's name, its grouping key and whether others are credited."""
+
+    display: str
+    key: str
+    is_feature: bool
+
+
+@lru_cache(maxsize=65536)
+def split_credit(credit: str, lowered: str) -> ArtistName:
+    """
+    Split one artist credit, scanning it once as written and once lowercased.
+
+    The lead act is everything before the first separator (comma, "&",
+    "with", "featuring", "and", "or" as whole words). The display name is
+    cut from the credit as written, so only lowercase separator words cut
+    it; the key is cut from the lowercased credit.
+
+    Args:
+        credit: Stripped credit, e.g. "Mariah Carey featuring Boyz II Men".
+        lowered: The credit lowercased by the column's string engine (pandas'
+            str.lower, which differs from Python's for a few letters such as "İ").
+
+    Returns:
+        ArtistName("Mariah Carey", "mariah carey", True).
+    """
+    cut = SEPARATORS.search(credit)
+    lowered_cut = SEPARATORS.search(lowered)
+    return ArtistName(
+        display=(credit[:cut.start()] if cut else credit).strip(),
+        key=(lowered[:lowered_cut.start()] if lowered_cut else lowered).strip(),
+        is_feature=lowered_cut is not None or FEATURE_MARKERS.search(lowered) is not None,
+    )
+
+
+def normalize_artists(artists: pd.Series) -> pd.DataFrame:
+    """
+    Normalize a column of artist credits, scanning each distinct credit once.
+
+    Hits tables repeat the same few thousand credits, so the column is
+    factorized and split_credit runs per distinct credit; its results are
+    also kept across calls.
+
+    Args:
+        artists: Artist credits.
+
+    Returns:
+        DataFrame on the same index with display_artist, main_artist (missing
+        where the credit is) and is_feature (bool).
+    """
+    codes, uniques = pd.factorize(artists)
+    credits = pd.Series(uniques, dtype="str").str.strip()
+    names = [split_credit(credit, lowered) for credit, lowered in zip(credits.tolist(), credits.str.lower().tolist())]
+    # Missing credits get code -1, which picks the trailing missing entry.
+    display = np.array([name.display for name in names] + [np.nan], dtype=object)
+    key = np.array([name.key for name in names] + [np.nan], dtype=object)
+    is_feature = np.array([name.is_feature for name in names] + [False], dtype=bool)
+    return pd.DataFrame(
+        {
+            "display_artist": pd.Series(display[codes], index=artists.index, dtype=object),
+            "main_artist": pd.Series(key[codes], index=artists.index, dtype=object),
+            "is_feature": is_feature[codes],
+        },
+        index=artists.index,
+    )
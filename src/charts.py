@@ -0,0 +1,161 @@
+from typing import Dict, List, Optional, Tuple
+
+import altair as alt
+import pandas as pd
+import plotly.graph_objects as go
+
+# Bars in each "Best of the Era" chart.
+ERA_CHART_BARS = 5
+
+
+def _bar_chart(df: pd.DataFrame, x: str, y: str, title: str, color: str) -> alt.Chart:
+    return (
+        alt.Chart(df)
+        .mark_bar(cornerRadiusTopLeft=6, cornerRadiusTopRight=6)
+        .encode(
+            x=alt.X(f"{x}:N", sort="-y", axis=alt.Axis(labelAngle=-30, labelColor="#E0F7FF", title=None)),
+            y=alt.Y(
+                f"{y}:Q",
+                axis=alt.Axis(
+                    title=title,
+                    titleColor="#E0F7FF",
+                    labelColor="#E0F7FF",
+                    grid=True,
+                    gridColor="rgba(255,255,255,0.08)",
+                ),
+            ),
+            color=alt.value(color),
+            tooltip=[f"{x}:N", f"{y}:Q"],
+        )
+        .properties(height=300)
+        .configure(background="rgba(0, 0, 0, 0.45)")
+    )
+
+
+def era_chart_specs(reign_df: pd.DataFrame, top_artist_df: pd.DataFrame) -> Tuple[Dict, Dict]:
+    """
+    Build the two "Best of the Era" bar charts as Vega-Lite specs.
+
+    Specs are rendered without Altair's default theme, as st.altair_chart
+    does, and carry their data inline, so st.vega_lite_chart can show them
+    without rebuilding or re-serializing the charts.
+
+    Args:
+        reign_df: Albums to chart (artist, weeks_at_one), e.g. AnalyticsQueries.longest_reigning.
+        top_artist_df: Artists to chart (display_artist, total_hits), e.g. AnalyticsQueries.top_artists.
+
+    Returns:
+        (longest reign at #1 spec, most total hits spec).
+    """
+    chart_weeks = _bar_chart(reign_df, "artist", "weeks_at_one", "Weeks at #1", "#00FFFF")
+    chart_hits = _bar_chart(top_artist_df, "display_artist", "total_hits", "Total Hits", "#2FE6FF")
+    with alt.theme.enable("none"):
+        return chart_weeks.to_dict(), chart_hits.to_dict()
+
+
+def _reveal_layout(years: List[int], k: int) -> Dict:
+    """Layout of the hidden axis that shows years[0..k]: its domain ends where years[k] sits on the visible axis."""
+    first, last = years[0], years[-1]
+    return {"xaxis2": {"domain": [0, (years[k] - first) / (last - first)], "range": [first, years[k]]}}
+
+
+def _animate_args(frames: Optional[List], duration: int) -> List:
+    """Plotly.animate arguments; redraw applies the axis domain, which cannot be transitioned."""
+    return [
+        frames,
+        {
+            "frame": {"duration": duration, "redraw": True},
+            "mode": "immediate",
+            "fromcurrent": True,
+            "transition": {"duration": 0, "easing": "linear"},
+        },
+    ]
+
+
+def box_office_figure(yearly_stats: pd.DataFrame) -> go.Figure:
+    """
+    Build the animated "Box Office Total" line chart.
+
+    The series is sent once. It is drawn on a hidden x axis whose domain and
+    range grow together, so the line stays aligned with the visible axis and
+    points past the current year are clipped. Frame k reveals the first
+    k + 1 years and carries only that axis's layout. The payload therefore
+    grows linearly with the number of years, not quadratically as with one
+    data copy per frame.
+
+    Args:
+        yearly_stats: analytics_yearly_stats (year, total_box_office).
+
+    Returns:
+        Plotly figure with play/pause buttons and a frame slider.
+    """
+    df_yearly_stats = yearly_stats.sort_values("year")
+    years = [int(year) for year in df_yearly_stats["year"]]
+
+    fig = go.Figure(
+        go.Scatter(
+            x=df_yearly_stats["year"],
+            y=df_yearly_stats["total_box_office"],
+            mode="lines",
+            xaxis="x2",
+            line=dict(color='#00FFFF', width=3),
+            marker=dict(size=8, color='#00FFFF'),
+            hovertemplate="year=%{x}<br>total_box_office=%{y}<extra></extra>",
+            showlegend=False,
+        )
+    )
+    fig.update_layout(
+        height=320,
+        margin=dict(t=60),
+        paper_bgcolor='rgba(0,0,0,0.45)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        xaxis=dict(
+            title=None,
+            range=[years[0], years[-1]] if years else None,
+            tickfont=dict(color='#E0F7FF'),
+            gridcolor='rgba(255,255,255,0.08)'
+        ),
+        xaxis2=dict(anchor="y", visible=False),
+        yaxis=dict(
+            title='Total Box Office',
+            range=[0, df_yearly_stats['total_box_office'].max() * 1.1],
+            title_font=dict(color='#E0F7FF'),
+            tickfont=dict(color='#E0F7FF'),
+            gridcolor='rgba(255,255,255,0.08)'
+        ),
+        showlegend=False,
+    )
+    if len(years) < 2:
+        return fig
+
+    names = [str(k) for k in range(1, len(years))]
+    fig.frames = [go.Frame(name=name, layout=_reveal_layout(years, int(name))) for name in names]
+    fig.update_layout(
+        _reveal_layout(years, 1),
+        updatemenus=[dict(
+            type="buttons",
+            buttons=[
+                dict(label="&#9654;", method="animate", args=_animate_args(None, 150)),
+                dict(label="&#9724;", method="animate", args=_animate_args([None], 0)),
+            ],
+            direction="left",
+            pad={"r": 10, "t": 70},
+            showactive=False,
+            x=0.1,
+            xanchor="right",
+            y=0,
+            yanchor="top",
+        )],
+        sliders=[dict(
+            active=0,
+            currentvalue={"prefix": "frame="},
+            len=0.9,
+            pad={"b": 10, "t": 60},
+            x=0.1,
+            xanchor="left",
+            y=0,
+            yanchor="top",
+            steps=[dict(label=name, method="animate", args=_animate_args([name], 0)) for name in names],
+        )],
+    )
+    return fig
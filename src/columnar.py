@@ -0,0 +1,122 @@
+from pathlib import Path
+from typing import Dict, Optional
+import logging
+
+import pandas as pd
+
+from config import PROCESSED_DIR
+
+log = logging.getLogger(__name__)
+
+# Explicit dtypes of the processed tables; columns not listed keep pandas' defaults.
+# Integer columns fall back to the nullable variant (e.g. Int16) when they hold missing values.
+SCHEMAS: Dict[str, Dict[str, str]] = {
+    "highest_grossing": {"rank": "int16", "distributor": "category", "gross": "float64", "year": "int16"},
+    "top_hits": {"rank": "int16", "main_artist": "category", "display_artist": "category", "year": "int16"},
+    "awards": {"category": "category", "year": "int16"},
+    "albums_us": {"rank": "int16", "artist": "category", "year": "int16", "weeks_at_one": "int16"},
+    "albums_global": {"rank": "int16", "artist": "category", "year": "int16"},
+    "events": {"year": "int16", "category": "category"},
+    "analytics_yearly_stats": {"year": "int16", "total_box_office": "float64", "unique_songs_charted": "int16"},
+    "analytics_top_artists": {"main_artist": "category", "total_hits": "int32", "display_artist": "category"},
+    "analytics_best_picture": {"year": "int16"},
+    "analytics_longest_reigning_albums": {"year": "int16", "artist": "category", "weeks_at_one": "int16"},
+    "analytics_top_billboard_artists": {"artist": "category", "total_weeks_at_one": "int32"},
+    "analytics_top_critics_artists": {"artist": "category", "count": "int32"},
+}
+
+
+def apply_schema(df: pd.DataFrame, name: str) -> pd.DataFrame:
+    """
+    Cast a processed table to its declared dtypes.
+
+    Args:
+        df: Table as built or read from CSV.
+        name: Table name (CSV stem, e.g. "highest_grossing").
+
+    Returns:
+        DataFrame with the SCHEMAS dtypes applied to the columns it has.
+    """
+    casts = {}
+    for col, dtype in SCHEMAS.get(name, {}).items():
+        if col not in df.columns:
+            continue
+        if dtype.startswith("int"):
+            values = pd.to_numeric(df[col], errors="coerce")
+            casts[col] = values.astype(dtype.capitalize() if values.isna().any() else dtype)
+        else:
+            casts[col] = df[col].astype(dtype)
+    return df.assign(**casts) if casts else df
+
+
+def parquet_path(name: str, directory: Path = PROCESSED_DIR) -> Path:
+    """Return the Parquet file of a processed table."""
+    return Path(directory) / f"{name}.parquet"
+
+
+def csv_path(name: str, directory: Path = PROCESSED_DIR) -> Path:
+    """Return the CSV file of a processed table."""
+    return Path(directory) / f"{name}.csv"
+
+
+def write_processed(df: pd.DataFrame, name: str, directory: Path = PROCESSED_DIR) -> None:
+    """
+    Write a processed table as CSV and as typed Parquet.
+
+    The CSV stays the interchange format; the Parquet copy carries the SCHEMAS
+    dtypes so loaders skip parsing and inference. When pyarrow is not installed
+    only the CSV is written.
+
+    Args:
+        df: Table to write.
+        name: Table name (file stem).
+        directory: Output directory.
+    """
+    df.to_csv(csv_path(name, directory), index=False)
+    write_parquet(df, name, directory)
+
+
+def write_parquet(df: pd.DataFrame, name: str, directory: Path = PROCESSED_DIR) -> None:
+    """Write only the typed Parquet copy of a processed table (skipped without pyarrow)."""
+    try:
+        apply_schema(df, name).to_parquet(parquet_path(name, directory), index=False)
+    except ImportError as e:
+        log.warning(f"Skipping {name}.parquet: {e}")
+
+
+def read_processed(name: str, directory: Path = PROCESSED_DIR) -> pd.DataFrame:
+    """
+    Load a processed table, preferring the typed Parquet file.
+
+    A Parquet file older than its CSV (e.g. a hand-edited events.csv) is
+    ignored. Falls back to the CSV, cast to the same dtypes, when the Parquet
+    file is missing, stale or pyarrow is not installed.
+
+    Args:
+        name: Table name (file stem).
+        directory: Directory holding the processed files.
+
+    Returns:
+        DataFrame with the SCHEMAS dtypes.
+    """
+    parquet, csv = parquet_path(name, directory), csv_path(name, directory)
+    if parquet.exists() and (not csv.exists() or parquet.stat().st_mtime >= csv.stat().st_mtime):
+        try:
+            return pd.read_parquet(parquet)
+        except ImportError:
+            pass
+    return apply_schema(pd.read_csv(csv), name)
+
+
+def convert_csv(name: str, directory: Path = PROCESSED_DIR) -> Optional[Path]:
+    """
+    Write the Parquet copy of a processed CSV that is not produced by the build (e.g. events.csv).
+
+    Returns:
+        The Parquet path, or None when the CSV does not exist.
+    """
+    csv = csv_path(name, directory)
+    if not csv.exists():
+        return None
+    write_parquet(pd.read_csv(csv), name, directory)
+    return parquet_path(name, directory)
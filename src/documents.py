@@ -0,0 +1,98 @@
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple, TypeVar
+import threading
+
+from bs4 import BeautifulSoup
+
+from src import html_lxml
+from src.fetch import fetch_concurrently
+
+K = TypeVar("K")
+Page = Tuple[str, Optional[Path]]
+# Per-URL work is serialized on one of this many locks, picked by the URL's hash, so the
+# locks do not grow with the URLs a store sees; two URLs sharing one only wait for each other.
+URL_LOCK_STRIPES = 256
+
+
+class DocumentStore:
+    """
+    Per-run store of fetched pages keyed by URL.
+
+    Each URL is downloaded once and parsed at most once; every scraper reading
+    the same page shares the raw HTML and the parsed tree.
+
+    Args:
+        fetch: Callable taking (url, cache_path) and returning the page HTML.
+        backend: "bs4" for BeautifulSoup trees (html.parser) or "lxml" for lxml trees.
+    """
+
+    def __init__(self, fetch: Callable[[str, Optional[Path]], str], backend: str = "bs4") -> None:
+        if backend not in ("bs4", "lxml"):
+            raise ValueError(f"Unknown HTML parser backend: {backend}")
+        self._fetch = fetch
+        self.backend = backend
+        self._html: Dict[str, str] = {}
+        self._docs: Dict[str, Any] = {}
+        self._url_locks = [threading.Lock() for _ in range(URL_LOCK_STRIPES)]
+        self._lock = threading.Lock()
+        self.stats: Counter = Counter()
+
+    def _url_lock(self, url: str) -> threading.Lock:
+        return self._url_locks[hash(url) % URL_LOCK_STRIPES]
+
+    def _count(self, counter: str) -> None:
+        # Different URLs may hold different stripe locks, so counts go through the store lock.
+        with self._lock:
+            self.stats[counter] += 1
+
+    def add_stats(self, counts: Mapping[str, int]) -> None:
+        """Add counts gathered elsewhere (e.g. parse counts of worker processes) to stats."""
+        with self._lock:
+            self.stats.update(counts)
+
+    def html(self, url: str, cache_path: Optional[Path] = None) -> str:
+        """Return the page HTML, downloading it on first use."""
+        with self._url_lock(url):
+            if url in self._html:
+                self._count("html_reuses")
+                return self._html[url]
+            html = self._fetch(url, cache_path)
+            self._html[url] = html
+            self._count("downloads")
+            return html
+
+    def document(self, url: str, cache_path: Optional[Path] = None) -> Any:
+        """Return the parsed page (BeautifulSoup or lxml root, per backend), parsing it on first use."""
+        html = self.html(url, cache_path)
+        with self._url_lock(url):
+            if url in self._docs:
+                self._count("tree_reuses")
+                return self._docs[url]
+            if self.backend == "lxml":
+                doc = html_lxml.parse_document(html)
+            else:
+                doc = BeautifulSoup(html, "html.parser")
+            self._docs[url] = doc
+            self._count("parses")
+            return doc
+
+    def prefetch(self, pages: Mapping[K, Page], max_workers: int = 8) -> Iterator[K]:
+        """
+        Download pages concurrently and yield their keys as each one is stored.
+
+        Args:
+            pages: Mapping of key (e.g. year) to (url, cache_path).
+            max_workers: Size of the download thread pool.
+
+        Returns:
+            Iterator of keys in completion order.
+        """
+        for key, _ in fetch_concurrently(pages, lambda k: self.html(*pages[k]), max_workers):
+            yield key
+
+    def release(self, url: str) -> None:
+        """Drop a page's HTML and tree once every scraper reading it is done."""
+        with self._lock:
+            self._html.pop(url, None)
+            self._docs.pop(url, None)
@@ -0,0 +1,105 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, Tuple, TypeVar
+from urllib.parse import urlsplit
+import threading
+import time
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled at a fixed rate.
+
+    Args:
+        rate: Tokens added per second.
+        burst: Maximum number of tokens the bucket can hold.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class HostLimiter:
+    """
+    Per-host concurrency cap combined with a per-host token bucket.
+
+    Args:
+        max_per_host: Maximum number of in-flight requests to one host.
+        rate: Requests per second allowed for one host.
+        burst: Requests allowed back-to-back before the rate applies.
+    """
+
+    def __init__(self, max_per_host: int, rate: float, burst: int) -> None:
+        self.max_per_host = max(1, max_per_host)
+        self.rate = rate
+        self.burst = burst
+        self._hosts: Dict[str, Tuple[threading.Semaphore, TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def _host(self, url: str) -> Tuple[threading.Semaphore, TokenBucket]:
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = (
+                    threading.Semaphore(self.max_per_host),
+                    TokenBucket(self.rate, self.burst),
+                )
+            return self._hosts[host]
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """Hold one of the host's request slots for the duration of the block."""
+        semaphore, bucket = self._host(url)
+        with semaphore:
+            bucket.acquire()
+            yield
+
+
+def fetch_concurrently(
+    keys: Iterable[K],
+    fetch: Callable[[K], T],
+    max_workers: int = 8,
+) -> Iterator[Tuple[K, T]]:
+    """
+    Run fetch for every key on a thread pool and yield results as they complete.
+
+    Args:
+        keys: Items to fetch (e.g. years).
+        fetch: Callable taking a key and returning its page.
+        max_workers: Size of the thread pool.
+
+    Returns:
+        Iterator of (key, result) pairs in completion order. The first failure
+        is re-raised and pending fetches are cancelled.
+    """
+    keys = list(keys)
+    if not keys:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(keys)))) as pool:
+        futures = {pool.submit(fetch, key): key for key in keys}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
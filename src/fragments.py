@@ -0,0 +1,193 @@
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+import urllib.parse
+
+import pandas as pd
+
+from src.year_index import YearSlice
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class YearFragments:
+    """
+    Finished markup for one year's rewind section.
+
+    HTML fields are None when the year has no data for them, so the app can
+    show its "no data" notice instead. Events are (markdown line, progress
+    value) pairs in display order; the app shows the first N. A section whose
+    rendering failed is left empty and its error message kept in errors under
+    the field name, so the app can report it without touching the others.
+    """
+
+    movies: Optional[str]
+    hits: Optional[str]
+    best_film: Optional[str]
+    top_us_album: Optional[str]
+    global_album: Optional[str]
+    events: List[Tuple[str, float]] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+def _youtube_url(query: str) -> str:
+    return f"https://www.youtube.com/results?search_query={urllib.parse.quote_plus(query)}"
+
+
+def _wikipedia_url(url, title: str) -> str:
+    """Return the stored article URL, or the title's guessed Wikipedia URL when there is none."""
+    if pd.isna(url) or not url:
+        return f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
+    return url
+
+
+def movies_table(movies: pd.DataFrame) -> Optional[str]:
+    """
+    Render the top movies as the retro HTML table.
+
+    Args:
+        movies: The year's highest-grossing rows (rank, title, distributor, gross, optional url).
+
+    Returns:
+        Table HTML, or None when there are no rows.
+    """
+    if movies.empty:
+        return None
+    gross = pd.to_numeric(movies["gross"], errors="coerce")
+    urls = movies["url"].tolist() if "url" in movies.columns else [None] * len(movies)
+
+    html_table = '<div class="retro-table-container"><table class="retro-table">'
+    html_table += '<thead><tr><th>Rank</th><th>Title</th><th>Distributor</th><th>Box Office</th></tr></thead>'
+    html_table += '<tbody>'
+    for rank, title, distributor, value, url in zip(
+        movies["rank"].tolist(), movies["title"].tolist(), movies["distributor"].tolist(), gross.tolist(), urls
+    ):
+        gross_str = f"$ {value:,.0f}" if pd.notnull(value) else ""
+        url = _wikipedia_url(url, title)
+        html_table += f'<tr><td>{rank}</td><td><a href="{url}" target="_blank">{title}</a></td><td>{distributor}</td><td>{gross_str}</td></tr>'
+    html_table += '</tbody></table></div>'
+    return html_table
+
+
+def hits_table(hits: pd.DataFrame) -> Optional[str]:
+    """
+    Render the top hits as the retro HTML table, each song linked to a YouTube search.
+
+    Args:
+        hits: The year's top-hit rows (rank, title, display_artist).
+
+    Returns:
+        Table HTML, or None when there are no rows.
+    """
+    if hits.empty:
+        return None
+    html_table = '<div class="retro-table-container"><table class="retro-table">'
+    html_table += '<thead><tr><th>Rank</th><th>Song</th><th>Artist</th></tr></thead>'
+    html_table += '<tbody>'
+    for rank, title, artist in zip(hits["rank"].tolist(), hits["title"].tolist(), hits["display_artist"].tolist()):
+        url = _youtube_url(f"{artist} {title}")
+        html_table += f'<tr><td>{rank}</td><td><a href="{url}" target="_blank">{title}</a></td><td>{artist}</td></tr>'
+    html_table += '</tbody></table></div>'
+    return html_table
+
+
+def best_film_card(best_row: Optional[pd.Series]) -> Optional[str]:
+    """Render the Academy Awards card for the year's best film row, or None without one."""
+    if best_row is None:
+        return None
+    best_film = best_row["winner"]
+    url = _wikipedia_url(best_row["url"] if "url" in best_row.index else None, best_film)
+    return f"""
+                <div class="award-card">
+                  <div class="award-badge">🏆 Academy Awards Winner</div>
+                  <div class="award-title"><a href="{url}" target="_blank">{best_film}</a></div>
+                </div>
+                """
+
+
+def us_album_card(album: Optional[pd.Series]) -> Optional[str]:
+    """Render the US album of the year card (album, artist, weeks at #1), or None without one."""
+    if album is None:
+        return None
+    album_title = album["album"]
+    album_artist = album["artist"]
+    weeks = int(album["weeks_at_one"])
+    url = _youtube_url(f"{album_artist} {album_title} full album")
+    return f"""
+                <div class="award-card">
+                <div class="award-badge">🎵 Album of the Year (US)</div>
+                <div class="award-title"><a href="{url}" target="_blank">{album_title}</a></div>
+                <div class="award-sub">{album_artist} • {weeks} week(s) at #1</div>
+                </div>
+                """
+
+
+def global_album_card(album: Optional[pd.Series]) -> Optional[str]:
+    """Render the worldwide best album card, or None without one."""
+    if album is None:
+        return None
+    album_title = album["album"]
+    album_artist = album["artist"]
+    url = _youtube_url(f"{album_artist} {album_title} full album")
+    return f"""
+                    <div class="award-card">
+                    <div class="award-badge">🌍 Best Album Worldwide</div>
+                    <div class="award-title"><a href="{url}" target="_blank">{album_title}</a></div>
+                    <div class="award-sub">{album_artist}</div>
+                    </div>
+                    """
+
+
+def event_lines(events: pd.DataFrame, year: int, max_importance) -> List[Tuple[str, float]]:
+    """
+    Render the year's events as markdown lines linked to a Google search.
+
+    Args:
+        events: The year's events, already in display order.
+        year: Year added to each search query.
+        max_importance: Largest importance over all years; progress values are importance / max_importance.
+
+    Returns:
+        (markdown line, progress value) per event.
+    """
+    lines = []
+    for category, event_text, importance in zip(
+        events["category"].tolist(), events["event"].tolist(), events["importance"].tolist()
+    ):
+        url = f"https://www.google.com/search?q={urllib.parse.quote_plus(f'{event_text} {year}')}"
+        lines.append((f"**[{category.title()}]** [{event_text}]({url})", importance / max_importance))
+    return lines
+
+
+def _section(errors: Dict[str, str], name: str, render: Callable[[], T], empty: T) -> T:
+    """Run one section's render, recording its error under name and returning empty if it raises."""
+    try:
+        return render()
+    except Exception as e:
+        errors[name] = str(e)
+        return empty
+
+
+def render_year(year: int, year_slice: YearSlice, max_importance) -> YearFragments:
+    """
+    Render everything the rewind section shows for one year.
+
+    Args:
+        year: The year.
+        year_slice: Its rows, from YearIndex.
+        max_importance: YearIndex.max_importance.
+
+    Returns:
+        YearFragments with the top 5 movies and hits, the award and album cards and all events;
+        each section is rendered on its own, so one failing leaves the others intact.
+    """
+    errors: Dict[str, str] = {}
+    return YearFragments(
+        movies=_section(errors, "movies", lambda: movies_table(year_slice.movies.head(5)), None),
+        hits=_section(errors, "hits", lambda: hits_table(year_slice.hits.head(5)), None),
+        best_film=_section(errors, "best_film", lambda: best_film_card(year_slice.best_film), None),
+        top_us_album=_section(errors, "top_us_album", lambda: us_album_card(year_slice.top_us_album), None),
+        global_album=_section(errors, "global_album", lambda: global_album_card(year_slice.global_album), None),
+        events=_section(errors, "events", lambda: event_lines(year_slice.events, year, max_importance), []),
+        errors=errors,
+    )
@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Mapping, Optional
+import gzip
+import json
+import os
+import time
+
+
+@dataclass
+class CachedPage:
+    """A cached page body with the validators it was served with."""
+
+    html: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+
+
+def body_path(cache_path: Path) -> Path:
+    """Return the gzip file holding the cached body (e.g. 1985_in_film.html.gz)."""
+    return cache_path.with_name(cache_path.name + ".gz")
+
+
+def meta_path(cache_path: Path) -> Path:
+    """Return the JSON file holding the cached validators (e.g. 1985_in_film.meta.json)."""
+    return cache_path.with_name(cache_path.stem + ".meta.json")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def read_cached_page(cache_path: Path) -> Optional[CachedPage]:
+    """
+    Read a cached page and its validators.
+
+    Args:
+        cache_path: Logical cache path (the .html name; the body lives in .html.gz).
+
+    Returns:
+        CachedPage, or None when nothing is cached. Plain .html files from older
+        runs are read as pages without validators.
+    """
+    gz = body_path(cache_path)
+    if gz.exists():
+        html = gzip.decompress(gz.read_bytes()).decode("utf-8")
+    elif cache_path.exists():
+        return CachedPage(cache_path.read_text(encoding="utf-8"))
+    else:
+        return None
+
+    meta: Dict = {}
+    if meta_path(cache_path).exists():
+        meta = json.loads(meta_path(cache_path).read_text(encoding="utf-8"))
+    return CachedPage(html, meta.get("etag"), meta.get("last_modified"), meta.get("fetched_at", 0.0))
+
+
+def write_cached_page(cache_path: Path, html: str, headers: Mapping[str, str]) -> None:
+    """
+    Store a page body gzip-compressed, with the response's ETag / Last-Modified.
+
+    Args:
+        cache_path: Logical cache path (the .html name).
+        html: Page body.
+        headers: Response headers (case-insensitive mapping).
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(body_path(cache_path), gzip.compress(html.encode("utf-8"), compresslevel=6))
+    write_validators(cache_path, headers)
+    if cache_path.exists():
+        cache_path.unlink()
+
+
+def write_validators(cache_path: Path, headers: Mapping[str, str], previous: Optional[CachedPage] = None) -> None:
+    """
+    Record validators and fetch time for a cached page.
+
+    Args:
+        cache_path: Logical cache path (the .html name).
+        headers: Response headers; a 304 may omit validators, in which case the
+            previous ones are kept.
+        previous: Page the validators are refreshed for, if any.
+    """
+    meta = {
+        "etag": headers.get("ETag") or (previous.etag if previous else None),
+        "last_modified": headers.get("Last-Modified") or (previous.last_modified if previous else None),
+        "fetched_at": time.time(),
+    }
+    _write_atomic(meta_path(cache_path), json.dumps(meta).encode("utf-8"))
+
+
+def conditional_headers(page: CachedPage) -> Dict[str, str]:
+    """Return If-None-Match / If-Modified-Since headers for revalidating a cached page."""
+    headers = {}
+    if page.etag:
+        headers["If-None-Match"] = page.etag
+    if page.last_modified:
+        headers["If-Modified-Since"] = page.last_modified
+    return headers
@@ -0,0 +1,150 @@
+from typing import Iterable, Iterator, List, Optional
+
+import lxml.html
+import pandas as pd
+
+HEADING_TAGS = ("h2", "h3")
+
+# BeautifulSoup leaves script/style/template contents out of get_text(); so does text() below.
+_SKIP_TEXT = frozenset(("script", "style", "template"))
+
+
+def parse_document(html: str) -> lxml.html.HtmlElement:
+    """Parse a full HTML page and return its root element."""
+    return lxml.html.document_fromstring(html)
+
+
+def text(el: lxml.html.HtmlElement) -> str:
+    """Return the element's text like BeautifulSoup's get_text(" ", strip=True)."""
+    parts: List[str] = []
+
+    def walk(node: lxml.html.HtmlElement) -> None:
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            # Comments and processing instructions have a non-string tag; only their tail is text.
+            if isinstance(child.tag, str) and child.tag not in _SKIP_TEXT:
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    walk(el)
+    return " ".join(s for s in (p.strip() for p in parts) if s)
+
+
+def find_all(el: lxml.html.HtmlElement, names: Iterable[str], recursive: bool = True) -> List[lxml.html.HtmlElement]:
+    """Return descendant (or, non-recursively, child) elements with one of the given tag names."""
+    names = tuple(names)
+    if recursive:
+        return list(el.iterdescendants(*names))
+    return [child for child in el if child.tag in names]
+
+
+def iter_following(el: lxml.html.HtmlElement) -> Iterator[lxml.html.HtmlElement]:
+    """
+    Yield every element after el in document order, like BeautifulSoup's find_all_next().
+
+    The walk is lazy: callers that stop at the next heading never touch the
+    rest of the document, where find_all_next() collects all of it first.
+    """
+    for node in el.iterdescendants():
+        if isinstance(node.tag, str):
+            yield node
+    node: Optional[lxml.html.HtmlElement] = el
+    while node is not None:
+        for sibling in node.itersiblings():
+            for child in sibling.iter():
+                if isinstance(child.tag, str):
+                    yield child
+        node = node.getparent()
+
+
+def section_elements(
+    root: lxml.html.HtmlElement, keywords: Iterable[str], names: Iterable[str]
+) -> Optional[List[lxml.html.HtmlElement]]:
+    """
+    Return elements with the given tags under the first heading matching any keyword.
+
+    Args:
+        root: Parsed page.
+        keywords: Lowercase substrings to look for in h2/h3 headings.
+        names: Tag names to collect (e.g. ("table",)).
+
+    Returns:
+        Matching elements up to the next h2/h3, or None when no heading matches.
+    """
+    keywords = tuple(keywords)
+    names = frozenset(names)
+    for heading in root.iter(*HEADING_TAGS):
+        title = text(heading).lower()
+        if any(k in title for k in keywords):
+            found = []
+            for node in iter_following(heading):
+                if node.tag in HEADING_TAGS:
+                    break
+                if node.tag in names:
+                    found.append(node)
+            return found
+    return None
+
+
+def parse_table(table: lxml.html.HtmlElement) -> pd.DataFrame:
+    """
+    Parse a table element into a DataFrame, handling simple rowspan/colspan.
+
+    Same output as parse_html_table for the BeautifulSoup backend; pending
+    rowspans are kept in two flat per-column lists instead of a dict.
+
+    Args:
+        table: lxml table element.
+
+    Returns:
+        DataFrame of the parsed table.
+    """
+    rows = list(table.iter("tr"))
+    if not rows:
+        return pd.DataFrame()
+
+    grid = []
+    span_vals: List[Optional[str]] = []
+    span_left: List[int] = []
+    first_row_has_header = any(True for _ in rows[0].iterdescendants("th"))
+
+    for row in rows:
+        row_vals: List[Optional[str]] = []
+        col = 0
+        while col < len(span_left) and span_left[col]:
+            row_vals.append(span_vals[col])
+            span_left[col] -= 1
+            col += 1
+        for cell in row.iterdescendants("td", "th"):
+            value = text(cell)
+            colspan = int(cell.get("colspan", 1))
+            rowspan = int(cell.get("rowspan", 1))
+            for _ in range(colspan):
+                row_vals.append(value)
+                if rowspan > 1:
+                    if col >= len(span_left):
+                        grow = col + 1 - len(span_left)
+                        span_vals.extend([None] * grow)
+                        span_left.extend([0] * grow)
+                    span_vals[col] = value
+                    span_left[col] = rowspan - 1
+                col += 1
+            while col < len(span_left) and span_left[col]:
+                row_vals.append(span_vals[col])
+                span_left[col] -= 1
+                col += 1
+        grid.append(row_vals)
+
+    max_cols = max(len(r) for r in grid)
+    grid = [r + [None] * (max_cols - len(r)) for r in grid]
+
+    if first_row_has_header:
+        headers = [h or f"col_{i}" for i, h in enumerate(grid[0])]
+        data = grid[1:]
+    else:
+        headers = [f"col_{i}" for i in range(max_cols)]
+        data = grid
+
+    return pd.DataFrame(data, columns=headers)
@@ -0,0 +1,194 @@
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Mapping, Optional
+from urllib.parse import urlsplit, urlunsplit
+import logging
+import random
+import statistics
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import (
+    FETCH_MAX_WORKERS, FETCH_MAX_PER_HOST, FETCH_RATE_PER_HOST, FETCH_BURST_PER_HOST,
+    HTTP_TIMEOUT, HTTP_MAX_RETRIES, HTTP_BACKOFF_BASE, HTTP_BACKOFF_MAX, HTTP_ORIGIN,
+)
+from src.fetch import HostLimiter
+
+log = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+_default_client: Optional["HttpClient"] = None
+_default_lock = threading.Lock()
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date.
+
+    Returns:
+        Seconds to wait (never negative), or None when absent or unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HttpClient:
+    """
+    Shared HTTP client: one keep-alive connection pool, polite per-host limits,
+    bounded retries and per-request timings.
+
+    Connection errors, timeouts and 429/5xx responses are retried up to
+    max_retries times. The wait is the server's Retry-After when it sends one,
+    otherwise exponential backoff with full jitter. A retry that would wait
+    longer than backoff_max is not attempted and the last response (or error)
+    is returned to the caller.
+
+    Args:
+        max_retries: Retries after the first attempt.
+        backoff_base: Backoff ceiling for the first retry, in seconds; doubles per retry.
+        backoff_max: Longest wait before a retry, in seconds.
+        timeout: Per-request timeout in seconds.
+        pool_size: Connections kept alive per host.
+        limiter: Per-host concurrency and rate limiter; a private one when omitted.
+        headers: Headers sent with every request.
+        origin: Scheme and host every request is sent to instead of its URL's own
+            (e.g. http://127.0.0.1:8000 to replay recorded pages); None keeps URLs as they are.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff_base: float = HTTP_BACKOFF_BASE,
+        backoff_max: float = HTTP_BACKOFF_MAX,
+        timeout: float = HTTP_TIMEOUT,
+        pool_size: int = FETCH_MAX_WORKERS,
+        limiter: Optional[HostLimiter] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        origin: Optional[str] = HTTP_ORIGIN,
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.origin = origin
+        self.limiter = limiter or HostLimiter(FETCH_MAX_PER_HOST, FETCH_RATE_PER_HOST, FETCH_BURST_PER_HOST)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(headers if headers is not None else {"User-Agent": USER_AGENT})
+        self.stats: Counter = Counter()
+        self.timings: List[float] = []
+        self._lock = threading.Lock()
+
+    def _record(self, url: str, outcome: str, elapsed: float, attempt: int) -> None:
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats[outcome] += 1
+            self.timings.append(elapsed)
+        log.debug(f"GET {url} -> {outcome} in {elapsed:.3f}s (attempt {attempt + 1})")
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def _route(self, url: str) -> str:
+        if not self.origin:
+            return url
+        return urlunsplit(urlsplit(self.origin)[:2] + urlsplit(url)[2:])
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        GET a URL through the shared session, retrying transient failures.
+
+        Args:
+            url: Target URL.
+            **kwargs: Passed to requests (params, headers, ...); timeout defaults to the client's.
+
+        Returns:
+            The final response, whatever its status; callers decide whether to
+            raise_for_status(). Raises the last requests exception when every
+            attempt failed without a response.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        url = self._route(url)
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                with self.limiter.slot(url):
+                    resp = self.session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record(url, type(e).__name__, time.perf_counter() - start, attempt)
+                if attempt >= self.max_retries:
+                    with self._lock:
+                        self.stats["failures"] += 1
+                    raise
+                wait = self._backoff(attempt)
+            else:
+                self._record(url, str(resp.status_code), time.perf_counter() - start, attempt)
+                if resp.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    return resp
+                retry_after = retry_after_seconds(resp.headers.get("Retry-After"))
+                wait = retry_after if retry_after is not None else self._backoff(attempt)
+                if wait > self.backoff_max:
+                    log.warning(f"GET {url}: giving up, server asked to retry after {wait:.0f}s")
+                    return resp
+                resp.close()
+
+            attempt += 1
+            with self._lock:
+                self.stats["retries"] += 1
+            log.info(f"Retrying {url} in {wait:.2f}s (attempt {attempt + 1} of {self.max_retries + 1})")
+            time.sleep(wait)
+
+    def summary(self) -> Dict[str, float]:
+        """Return request counts and latency figures (seconds) collected so far."""
+        with self._lock:
+            timings = sorted(self.timings)
+            stats = dict(self.stats)
+        summary = {
+            "requests": stats.get("requests", 0),
+            "retries": stats.get("retries", 0),
+            "failures": stats.get("failures", 0),
+            "total_seconds": sum(timings),
+        }
+        if timings:
+            summary["p50"] = statistics.median(timings)
+            summary["p95"] = timings[min(len(timings) - 1, int(0.95 * len(timings)))]
+            summary["max"] = timings[-1]
+        return summary
+
+    def log_summary(self, label: str) -> None:
+        """Log the request count, retries and latency percentiles."""
+        s = self.summary()
+        if not s["requests"]:
+            return
+        log.info(
+            f"{label}: {s['requests']} requests, {s['retries']} retries, {s['failures']} failures, "
+            f"p50 {s['p50'] * 1000:.0f} ms, p95 {s['p95'] * 1000:.0f} ms, max {s['max'] * 1000:.0f} ms"
+        )
+
+
+def default_client() -> HttpClient:
+    """Return the process-wide client shared by the download and clean steps."""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
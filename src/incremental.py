@@ -0,0 +1,342 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import hashlib
+import json
+import logging
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from config import ANALYTICS_PARTIALS_DIR
+from src.analytics import TOP_ALBUM_ARTISTS, TOP_ALBUMS, TOP_ARTISTS, pick_display_names
+
+log = logging.getLogger(__name__)
+
+# Bump when YearPartials changes, so partials written by older code are recomputed.
+PARTIALS_VERSION = 1
+# Columns each year's partials are computed from; a year is recomputed when its rows in any of them change.
+INPUT_COLUMNS = {
+    "gross": ["year", "gross"],
+    "hits": ["year", "title", "main_artist", "display_artist"],
+    "albums_us": ["year", "album", "artist", "weeks_at_one"],
+    "albums_global": ["year", "artist"],
+}
+
+
+@dataclass
+class YearPartials:
+    """
+    Mergeable aggregates of one year, from which the all-time analytics are rebuilt.
+
+    gross_sum and songs are None when the year has no box office or hits
+    rows, so it is left out of the yearly stats as groupby would leave it.
+    """
+
+    year: int
+    # Kept as the numpy scalar groupby gives, so the table keeps the gross column's dtype.
+    gross_sum: Optional[np.number]
+    # Distinct non-missing song titles.
+    songs: Optional[np.ndarray]
+    # main_artist, display_artist, rows (for the display-name mode), hits (rows with a title).
+    artist_pairs: pd.DataFrame
+    # The year's TOP_ALBUMS longest-reigning albums, longest first, ties in table order.
+    album_candidates: pd.DataFrame
+    # artist -> weeks at #1 in the year.
+    album_artist_weeks: pd.Series
+    # artist -> best-of-year list appearances, in order of first appearance.
+    critics_counts: pd.Series
+
+
+def _year_runs(years: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the start and end positions of each run of one year in a sorted year array."""
+    starts = np.flatnonzero(np.r_[True, years[1:] != years[:-1]]) if len(years) else np.array([], dtype=int)
+    return starts, np.r_[starts[1:], len(years)].astype(int)
+
+
+def _split_by_year(obj, years) -> Dict[int, object]:
+    """Split a frame or series into year -> rows, keeping the row order within each year."""
+    years = np.asarray(years)
+    order = np.argsort(years, kind="stable")
+    years = years[order]
+    obj = obj.iloc[order]
+    starts, ends = _year_runs(years)
+    return {int(years[start]): obj.iloc[start:end] for start, end in zip(starts, ends)}
+
+
+def _array_bytes(pa, chunk) -> Iterator[bytes]:
+    """
+    Yield bytes that identify an Arrow array slice: its null mask and values.
+
+    Only the slice's own range of each buffer is read. A slice shares its
+    parent's buffers, so reading them whole (or writing the slice as IPC,
+    which can copy the parent's validity bits) would let other years' rows
+    change this year's bytes.
+    """
+    if chunk.null_count == len(chunk):
+        # All missing: the same whatever type Arrow inferred for the whole column.
+        yield f"{len(chunk)} missing".encode()
+        return
+    if chunk.null_count:
+        yield np.packbits(chunk.is_null().to_numpy(zero_copy_only=False)).tobytes()
+    buffers, start, end = chunk.buffers(), chunk.offset, chunk.offset + len(chunk)
+    if pa.types.is_string(chunk.type) or pa.types.is_large_string(chunk.type):
+        offsets = np.frombuffer(buffers[1], dtype=np.int64 if pa.types.is_large_string(chunk.type) else np.int32)[start:end + 1]
+        yield (offsets - offsets[0]).tobytes()
+        if buffers[2] is not None:
+            yield memoryview(buffers[2])[offsets[0]:offsets[-1]]
+    elif pa.types.is_integer(chunk.type) or pa.types.is_floating(chunk.type):
+        width = chunk.type.bit_width // 8
+        yield memoryview(buffers[1])[start * width:end * width]
+    else:
+        yield repr(chunk.to_pylist()).encode()
+
+
+def _slice_bytes(df: pd.DataFrame, starts: np.ndarray, ends: np.ndarray) -> Iterator[List[bytes]]:
+    """
+    Yield the bytes that identify each row slice of df, dtypes included.
+
+    df is converted to Arrow once and each slice's buffers are read in
+    place; without pyarrow, the slice's per-row hashes are used.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        rows = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        dtypes = str(df.dtypes.to_dict()).encode()
+        for start, end in zip(starts, ends):
+            yield [dtypes, rows[start:end].tobytes()]
+        return
+    dtypes = str(df.dtypes.to_dict()).encode()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for start, end in zip(starts, ends):
+        rows = table.slice(start, end - start)
+        yield [dtypes] + [data for column in rows.columns for chunk in column.chunks for data in _array_bytes(pa, chunk)]
+
+
+def year_fingerprints(tables: Dict[str, pd.DataFrame]) -> Dict[int, str]:
+    """
+    Return a SHA-256 per year of the year's rows (INPUT_COLUMNS, in table order) across the cleaned tables.
+
+    Rows are hashed with their dtypes, so a column changing dtype (e.g. gross
+    turning float when a missing value appears) recomputes every year.
+
+    Args:
+        tables: Cleaned tables keyed as in INPUT_COLUMNS.
+
+    Returns:
+        year -> hex digest, for every year that has rows in any table.
+    """
+    digests = {}
+    for name, columns in INPUT_COLUMNS.items():
+        df = tables[name][columns]
+        if not df["year"].is_monotonic_increasing:
+            df = df.sort_values("year", kind="stable")
+        years = df["year"].to_numpy()
+        starts, ends = _year_runs(years)
+        for year, parts in zip(years[starts], _slice_bytes(df, starts, ends)):
+            digest = digests.setdefault(int(year), hashlib.sha256(f"v{PARTIALS_VERSION}/{TOP_ALBUMS}".encode()))
+            digest.update(name.encode())
+            for data in parts:
+                digest.update(data)
+    return {year: digest.hexdigest() for year, digest in digests.items()}
+
+
+def compute_partials(tables: Dict[str, pd.DataFrame], years: List[int]) -> Dict[int, YearPartials]:
+    """
+    Compute the partials of the given years, one groupby per aggregate across all of them.
+
+    Args:
+        tables: Cleaned tables keyed as in INPUT_COLUMNS, each in year order.
+        years: Years to compute.
+
+    Returns:
+        year -> YearPartials.
+    """
+    subset = {name: df[df["year"].isin(years)] for name, df in tables.items()}
+    gross, hits, us, wiki = subset["gross"], subset["hits"], subset["albums_us"], subset["albums_global"]
+
+    gross_sums = gross.groupby("year")["gross"].sum()
+    songs = hits.dropna(subset=["title"]).groupby("year")["title"].unique()
+    hit_years = set(hits["year"].unique().tolist())
+    pairs = (
+        hits.groupby(["year", "main_artist", "display_artist"])
+        .agg(rows=("title", "size"), hits=("title", "count"))
+        .reset_index(level=[1, 2])
+    )
+    candidates = (
+        us.sort_values("weeks_at_one", ascending=False, kind="stable")
+        .groupby("year").head(TOP_ALBUMS)[["year", "album", "artist", "weeks_at_one"]]
+    )
+    album_weeks = us.groupby(["year", "artist"])["weeks_at_one"].sum()
+    critics = wiki.groupby(["year", "artist"], sort=False).size()
+
+    pairs_by_year = _split_by_year(pairs, pairs.index)
+    candidates_by_year = _split_by_year(candidates, candidates["year"])
+    weeks_by_year = _split_by_year(album_weeks, album_weeks.index.get_level_values("year"))
+    critics_by_year = _split_by_year(critics, critics.index.get_level_values("year"))
+    partials = {}
+    for year in years:
+        partials[year] = YearPartials(
+            year=year,
+            gross_sum=gross_sums[year] if year in gross_sums.index else None,
+            songs=songs.get(year, np.array([], dtype=object)) if year in hit_years else None,
+            artist_pairs=pairs_by_year.get(year, pairs.iloc[:0]).reset_index(drop=True),
+            album_candidates=candidates_by_year.get(year, candidates.iloc[:0]),
+            album_artist_weeks=weeks_by_year.get(year, album_weeks.iloc[:0]).droplevel("year"),
+            critics_counts=critics_by_year.get(year, critics.iloc[:0]).droplevel("year"),
+        )
+    return partials
+
+
+class AnalyticsPartials:
+    """
+    Per-year partial aggregates of the analytics tables, kept on disk between builds.
+
+    Layout: <root>/<year>.pkl plus <root>/manifest.json mapping year -> the
+    fingerprint of the rows its partials were computed from. update() only
+    recomputes the years whose rows were added, changed or removed; the
+    all-time tables are then rebuilt from the merged partials and match
+    src.analytics' full recompute, row labels aside.
+
+    Args:
+        root: Directory holding the partials and manifest.
+    """
+
+    def __init__(self, root: Path = ANALYTICS_PARTIALS_DIR) -> None:
+        self.root = Path(root)
+        self.manifest_path = self.root / "manifest.json"
+        self.manifest: Dict[str, str] = {}
+        if self.manifest_path.exists():
+            self.manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        self.partials: Dict[int, YearPartials] = {}
+
+    def path(self, year: int) -> Path:
+        """Return the partials file of a year."""
+        return self.root / f"{year}.pkl"
+
+    def update(self, df_gross: pd.DataFrame, df_hits: pd.DataFrame, df_us: pd.DataFrame, df_global: pd.DataFrame) -> List[int]:
+        """
+        Bring the partials in line with the cleaned tables, recomputing only the years that changed.
+
+        Args:
+            df_gross: Cleaned box office data.
+            df_hits: Cleaned top hits data.
+            df_us: Billboard albums data (cleaned).
+            df_global: Wiki global albums data (cleaned).
+
+        Returns:
+            The recomputed years.
+        """
+        tables = {"gross": df_gross, "hits": df_hits, "albums_us": df_us, "albums_global": df_global}
+        fingerprints = year_fingerprints(tables)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        removed = [int(y) for y in self.manifest if int(y) not in fingerprints]
+        for year in removed:
+            self.path(year).unlink(missing_ok=True)
+            del self.manifest[str(year)]
+            self.partials.pop(year, None)
+
+        stale = []
+        for year, fingerprint in sorted(fingerprints.items()):
+            if self.manifest.get(str(year)) == fingerprint and self._load(year):
+                continue
+            stale.append(year)
+
+        if stale:
+            for year, partials in compute_partials(tables, stale).items():
+                tmp = self.path(year).with_name(f"{year}.pkl.tmp")
+                tmp.write_bytes(pickle.dumps(partials, protocol=pickle.HIGHEST_PROTOCOL))
+                os.replace(tmp, self.path(year))
+                self.partials[year] = partials
+                self.manifest[str(year)] = fingerprints[year]
+        if stale or removed:
+            self.save()
+        log.info(f"Analytics partials: {len(stale)} of {len(fingerprints)} years recomputed")
+        return stale
+
+    def _load(self, year: int) -> bool:
+        """Load a year's partials from disk unless already loaded; False when its file is missing or unreadable."""
+        if year in self.partials:
+            return True
+        try:
+            self.partials[year] = pickle.loads(self.path(year).read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as exc:
+            log.warning(f"Recomputing analytics partials of {year}: {exc}")
+            return False
+        return True
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        tmp = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        tmp.write_text(json.dumps(self.manifest, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.manifest_path)
+
+    def _years(self) -> List[YearPartials]:
+        return [self.partials[year] for year in sorted(self.partials)]
+
+    def yearly_stats(self) -> pd.DataFrame:
+        """Return generate_yearly_stats' table from the partials."""
+        years = self._years()
+        yearly_gross = pd.Series(
+            [p.gross_sum for p in years if p.gross_sum is not None],
+            index=pd.Index([p.year for p in years if p.gross_sum is not None], name="year"),
+        ).reset_index(name="total_box_office")
+        yearly_songs = pd.Series(
+            [len(p.songs) for p in years if p.songs is not None],
+            index=pd.Index([p.year for p in years if p.songs is not None], name="year"),
+            dtype="int64",
+        ).reset_index(name="unique_songs_charted")
+        return pd.merge(yearly_gross, yearly_songs, on="year", how="outer")
+
+    def top_artists(self, n: int = TOP_ARTISTS) -> pd.DataFrame:
+        """
+        Return generate_top_artists' table from the merged per-year artist counts.
+
+        Spelling ties are settled alphabetically; the partials do not keep the
+        order in which spellings first appear.
+        """
+        pairs = (
+            pd.concat([p.artist_pairs for p in self._years()], ignore_index=True)
+            .groupby(["main_artist", "display_artist"])[["rows", "hits"]].sum()
+            .reset_index()
+        )
+        top = (
+            pairs.groupby("main_artist")
+            .agg(total_hits=("hits", "sum"))
+            .sort_values("total_hits", ascending=False)
+            .head(n)
+            .reset_index()
+        )
+        display = pick_display_names(pairs[pairs["main_artist"].isin(top["main_artist"])])
+        top["display_artist"] = top["main_artist"].map(display)
+        return top
+
+    def album_stats(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """Return generate_album_stats' three tables from the partials."""
+        years = self._years()
+        top_us_albums = (
+            pd.concat([p.album_candidates for p in years])
+            .sort_values("weeks_at_one", ascending=False, kind="stable")
+            .head(TOP_ALBUMS)
+        )
+        top_us_artists = (
+            pd.concat([p.album_artist_weeks for p in years])
+            .groupby(level="artist").sum()
+            .reset_index()
+            .sort_values("weeks_at_one", ascending=False)
+            .head(TOP_ALBUM_ARTISTS)
+            .rename(columns={"weeks_at_one": "total_weeks_at_one"})
+        )
+        top_global_artists = (
+            pd.concat([p.critics_counts for p in years])
+            .groupby(level="artist", sort=False).sum()
+            # value_counts' order: most frequent first, ties in order of first appearance.
+            .sort_values(ascending=False, kind="stable")
+            .reset_index(name="count")
+            .head(TOP_ALBUM_ARTISTS)
+        )
+        return top_us_albums, top_us_artists, top_global_artists
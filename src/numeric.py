@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+import re
+
+import numpy as np
+import pandas as pd
+
+SCALES = {"k": 1e3, "thousand": 1e3, "m": 1e6, "mn": 1e6, "million": 1e6, "b": 1e9, "bn": 1e9, "billion": 1e9}
+RANGES = ("low", "high", "mid")
+
+FOOTNOTE = r"\[[^\]]*\]"
+# What is left of most amounts once footnotes, "$", thousands separators and outer spaces are removed.
+PLAIN_NUMBER = r"\d+(?:\.\d*)?|\.\d+"
+_NUMBER = r"\d[\d,]*(?:\.\d*)?|\.\d+"
+_SCALE = "|".join(sorted(SCALES, key=len, reverse=True))
+_CURRENCY = r"(?:[a-z]{0,3}[$€£¥₹₩]|(?:usd|eur|gbp)\s?)?"
+# Any amount or range the tables write, e.g. "US$1.2 billion[4]", "$900 million – $1 billion", "~1.1–1.2 bn".
+AMOUNT = re.compile(
+    rf"""^(?:\s*{FOOTNOTE})*\s*
+    (?:~|≈|c\.|ca\.|est\.|approx\.?)?\s*
+    {_CURRENCY}\s*(?P<low>{_NUMBER})\s*(?P<low_scale>{_SCALE})?\.?(?:\s*{FOOTNOTE})*
+    (?:\s*(?:-|–|—|to)\s*{_CURRENCY}\s*(?P<high>{_NUMBER})\s*(?P<high_scale>{_SCALE})?\.?(?:\s*{FOOTNOTE})*)?
+    \s*(?:usd|eur|gbp)?\+?(?:\s*{FOOTNOTE})*\s*$""",
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+@dataclass(frozen=True)
+class ParsedNumbers:
+    """
+    Values parsed from a text column, aligned with its rows.
+
+    values is int64 when every value is a whole number and none is missing,
+    float64 (NaN for missing and unparsed values) otherwise. unparsed flags
+    values that were present but not understood.
+    """
+
+    values: np.ndarray
+    unparsed: np.ndarray
+
+
+def _amounts(numbers: pd.Series, scales: pd.Series) -> np.ndarray:
+    """Return number captures ("1,234.5") times their scale captures ("million"), NaN where there is no number."""
+    amounts = pd.to_numeric(numbers.str.replace(",", "", regex=False), errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    factors = scales.str.lower().map(SCALES).to_numpy(dtype=float, na_value=np.nan)
+    return np.where(np.isnan(factors), amounts, amounts * factors)
+
+
+def parse_amounts(text: pd.Series, ranges: str = "low") -> np.ndarray:
+    """
+    Parse amounts with the full AMOUNT grammar, one regex match per value.
+
+    Args:
+        text: Text values.
+        ranges: Which value a range gives: "low", "high" or "mid" (their mean).
+
+    Returns:
+        float64 values, NaN where a value does not match.
+    """
+    parts = text.str.extract(AMOUNT)
+    # A scale written only after the second number ("1.1–1.2 billion") applies to both.
+    low = _amounts(parts["low"], parts["low_scale"].fillna(parts["high_scale"]))
+    high = _amounts(parts["high"], parts["high_scale"])
+    if ranges == "low":
+        return np.fmin(low, high)
+    if ranges == "high":
+        return np.fmax(low, high)
+    return np.where(np.isnan(high), low, (low + high) / 2)
+
+
+def parse_numbers(column: pd.Series, ranges: str = "low") -> ParsedNumbers:
+    """
+    Parse a money or count column such as "$1,234,567[3]", "US$1.2 billion" or "$1.1–1.2 billion".
+
+    Footnote markers, currency symbols or codes, thousands separators,
+    thousand/million/billion suffixes (also k, m, mn, b, bn) and ranges are
+    handled. Most values are a plain number once footnotes, "$" and commas
+    are gone, so the whole column goes through those vectorized string
+    passes and one cast; only the values left over are matched against the
+    full AMOUNT grammar. Missing, blank and footnote-only values stay
+    missing and are not counted as unparsed.
+
+    Args:
+        column: Text column; numeric columns are returned as they are.
+        ranges: Which value a range gives: "low", "high" or "mid" (their mean).
+
+    Returns:
+        ParsedNumbers aligned with column.
+    """
+    if ranges not in RANGES:
+        raise ValueError(f"ranges must be one of {', '.join(RANGES)}, got {ranges!r}")
+    if pd.api.types.is_numeric_dtype(column.dtype):
+        values = column.to_numpy()
+        return ParsedNumbers(values, np.zeros(len(values), dtype=bool))
+
+    text = column.astype("str")
+    plain = (
+        text.str.replace(FOOTNOTE, "", regex=True)
+        .str.replace("$", "", regex=False)
+        .str.replace(",", "", regex=False)
+        .str.strip()
+    )
+    is_plain = plain.str.fullmatch(PLAIN_NUMBER).fillna(False).to_numpy(dtype=bool)
+    blank = (plain.isna() | plain.eq("")).to_numpy(dtype=bool)
+
+    values = np.full(len(text), np.nan)
+    values[is_plain] = plain[is_plain].astype("float64").to_numpy()
+    rest = ~is_plain & ~blank
+    if rest.any():
+        values[rest] = parse_amounts(text[rest], ranges)
+
+    unparsed = np.isnan(values) & ~blank
+    if not np.isnan(values).any() and np.array_equal(values, np.trunc(values)):
+        values = values.astype(np.int64)
+    return ParsedNumbers(values, unparsed)
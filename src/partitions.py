@@ -0,0 +1,119 @@
+from pathlib import Path
+from typing import Dict, Iterable, List
+import csv
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+
+def content_hash(html: str) -> str:
+    """Return the SHA-256 hex digest of a page's HTML."""
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+class PartitionStore:
+    """
+    Per-year raw CSV partitions with a manifest of the source page hashes.
+
+    Layout: <root>/<dataset>/<year>.csv plus <root>/manifest.json mapping
+    dataset -> year -> {"source": sha256, "rows": n}. Years that scraped to
+    no rows are recorded in the manifest without a partition file.
+
+    Args:
+        root: Directory holding the partitions and manifest.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.manifest_path = self.root / "manifest.json"
+        self.manifest: Dict[str, Dict[str, Dict]] = {}
+        if self.manifest_path.exists():
+            self.manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+
+    def path(self, dataset: str, year: int) -> Path:
+        """Return the partition file for a dataset year."""
+        return self.root / dataset / f"{year}.csv"
+
+    def is_current(self, dataset: str, year: int, source_hash: str) -> bool:
+        """Return True when the year was scraped from a page with this hash and its partition is on disk."""
+        entry = self.manifest.get(dataset, {}).get(str(year))
+        if entry is None or entry["source"] != source_hash:
+            return False
+        return entry["rows"] == 0 or self.path(dataset, year).exists()
+
+    def write(self, dataset: str, year: int, df: pd.DataFrame, source_hash: str) -> None:
+        """Replace a year's partition and record its source hash."""
+        path = self.path(dataset, year)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if df.empty:
+            path.unlink(missing_ok=True)
+        else:
+            tmp = path.with_name(path.name + ".tmp")
+            df.to_csv(tmp, index=False)
+            os.replace(tmp, path)
+        self.manifest.setdefault(dataset, {})[str(year)] = {"source": source_hash, "rows": len(df)}
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        tmp.write_text(json.dumps(self.manifest, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.manifest_path)
+
+    def write_merged(self, dataset: str, years: Iterable[int], out_path: Path) -> int:
+        """
+        Stream a dataset's partitions, in year order, into one CSV.
+
+        Rows are copied as text one partition at a time, so memory stays flat
+        and the output matches what the scrapers wrote. Partitions whose header
+        differs are aligned by column name, as pd.concat would. The previous CSV
+        is only replaced once the new one is complete, and kept when there is
+        no partition at all.
+
+        Args:
+            dataset: Dataset name (e.g. "highest_grossing").
+            years: Years to include; years without a partition are skipped.
+            out_path: Combined CSV to write.
+
+        Returns:
+            Number of data rows written.
+        """
+        paths = [self.path(dataset, year) for year in sorted(years) if self.path(dataset, year).exists()]
+        if not paths:
+            return 0
+
+        headers = [_read_header(path) for path in paths]
+        columns = list(headers[0])
+        for header in headers[1:]:
+            columns.extend(c for c in header if c not in columns)
+
+        rows = 0
+        tmp = out_path.with_name(out_path.name + ".tmp")
+        with open(tmp, "w", newline="", encoding="utf-8") as out:
+            writer = csv.writer(out, lineterminator=os.linesep)
+            writer.writerow(columns)
+            for path, header in zip(paths, headers):
+                with open(path, newline="", encoding="utf-8") as f:
+                    reader = csv.reader(f)
+                    next(reader)
+                    if header == columns:
+                        for row in reader:
+                            writer.writerow(row)
+                            rows += 1
+                        continue
+                    if len(set(header)) != len(header):
+                        raise ValueError(f"Cannot align duplicate columns of {path} with {columns}")
+                    index = [header.index(c) if c in header else None for c in columns]
+                    for row in reader:
+                        writer.writerow(["" if i is None else row[i] for i in index])
+                        rows += 1
+        os.replace(tmp, out_path)
+        return rows
+
+
+def _read_header(path: Path) -> List[str]:
+    """Return the header row of a partition."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f))
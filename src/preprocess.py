@@ -1,47 +1,42 @@
 from pathlib import Path
 from typing import Optional
+import logging
+
+import numpy as np
 import pandas as pd
-import requests
 
 from config import RAW_DIR
+from src.artists import normalize_artists
+from src.numeric import parse_numbers
+from src.wiki_links import resolve_film_wiki_urls
 
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-}
+log = logging.getLogger(__name__)
 
 
 def resolve_film_wiki_url(title: str, year: int) -> str:
     """
-    Try film-specific Wikipedia URLs in order, falling back to the generic title.
-    Accepts the first non-missing page.
+    Resolve the Wikipedia URL of a single film.
+    Prefer resolve_film_wiki_urls when resolving many films at once.
+    """
+    return resolve_film_wiki_urls([(title, year)])[(str(title), int(year))]
+
+
+def parse_numeric_column(values: pd.Series, name: str) -> np.ndarray:
+    """
+    Parse a scraped money or count column, logging the values that could not be parsed.
+
+    Args:
+        values: Raw column, e.g. "$1,234,567[3]".
+        name: Column name for the log message.
+
+    Returns:
+        Parsed values (see src.numeric.parse_numbers); unparsed values are NaN.
     """
-    base_title = title.replace(" ", "_")
-    candidates = [
-        f"https://en.wikipedia.org/wiki/{base_title}_({year}_Disney_film)",
-        f"https://en.wikipedia.org/wiki/{base_title}_({year}_film)",
-        f"https://en.wikipedia.org/wiki/{base_title}_(film)",
-        f"https://en.wikipedia.org/wiki/{base_title}",
-    ]
-    for url in candidates:
-        try:
-            resp = requests.get(url, timeout=5, allow_redirects=True, headers=HEADERS)
-            if resp.status_code == 403:
-                return url
-            if resp.status_code != 200:
-                continue
-            html = resp.text
-            final = resp.url.lower()
-            if "wikipedia does not have an article with this exact name" in html:
-                continue
-            if "may also refer to" in html.lower():
-                continue
-            if f"({year}_film)" in final or "_(film)" in final:
-                return resp.url
-            if resp.url.rstrip("/") == url.rstrip("/"):
-                return resp.url
-        except Exception:
-            continue
-    return candidates[-1]
+    parsed = parse_numbers(values)
+    if parsed.unparsed.any():
+        examples = ", ".join(repr(value) for value in values[parsed.unparsed].unique()[:3])
+        log.warning(f"{parsed.unparsed.sum()} {name} values could not be parsed and are left missing (e.g. {examples})")
+    return parsed.values
 
 
 def clean_awards(input_path: Optional[str | Path] = None) -> pd.DataFrame:
@@ -79,9 +74,9 @@ def clean_awards(input_path: Optional[str | Path] = None) -> pd.DataFrame:
 
     df["url"] = None
     mask_best_film = df["category"] == "best film"
-    df.loc[mask_best_film, "url"] = df.loc[mask_best_film].apply(
-        lambda r: resolve_film_wiki_url(str(r["winner"]), int(r["year"])), axis=1
-    )
+    films = list(zip(df.loc[mask_best_film, "winner"].astype(str), df.loc[mask_best_film, "year"].astype(int)))
+    urls = resolve_film_wiki_urls(films)
+    df.loc[mask_best_film, "url"] = [urls[film] for film in films]
 
     return df
 
@@ -99,20 +94,15 @@ def clean_gross(input_path: Optional[str | Path] = None) -> pd.DataFrame:
     gross_path = Path(input_path) if input_path else (RAW_DIR / "highest_grossing.csv")
     df = pd.read_csv(gross_path)
 
-    df["gross"] = (df["gross"]
-                   .astype(str)
-                   .str.replace(r"\[.*?\]", "", regex=True)
-                   .str.replace("$", "", regex=False)
-                   .str.replace(",", "", regex=False)
-                   .str.strip())
-
-    df["gross"] = pd.to_numeric(df["gross"], errors='coerce')
+    df["gross"] = parse_numeric_column(df["gross"], "gross")
 
     keep_col = ['rank', 'title', 'distributor', 'gross', 'year']
 
     df = df[keep_col].sort_values(by=["year", "rank"]).reset_index(drop=True)
 
-    df["url"] = df.apply(lambda r: resolve_film_wiki_url(r["title"], int(r["year"])), axis=1)
+    films = list(zip(df["title"].astype(str), df["year"].astype(int)))
+    urls = resolve_film_wiki_urls(films)
+    df["url"] = [urls[film] for film in films]
 
     return df
 
@@ -132,31 +122,9 @@ def clean_top_hits(input_path: Optional[str | Path] = None) -> pd.DataFrame:
 
     df["title"] = (df["title"].str.replace('"', '', regex=False))
 
-    df["artist"] = df["artist"].astype(str).str.strip()
-    df["display_artist"] = (
-        df["artist"]
-        .str.split(r",", n=1).str[0]
-        .str.split(r"\s*&\s*", n=1).str[0]
-        .str.split(r"\bwith\b", n=1).str[0]
-        .str.split(r"\bfeaturing\b", n=1).str[0]
-        .str.split(r"\band\b", n=1).str[0]
-        .str.split(r"\bor\b", n=1).str[0]
-        .str.strip()
-    )
-
-    df['artist'] = df['artist'].str.lower()
-    df['is_feature'] = df['artist'].str.contains(r"(?:\:|&|,|\band\b|\bor\b|\bwith\b|\bfeaturing\b|\bfeat\.?\b|\bft\.?\b)").astype(int)
-
-    df["main_artist"] = (
-        df["artist"]
-        .str.split(r",", n=1).str[0]
-        .str.split(r"\s*&\s*", n=1).str[0]
-        .str.split(r"\bwith\b", n=1).str[0]
-        .str.split(r"\bfeaturing\b", n=1).str[0]
-        .str.split(r"\band\b", n=1).str[0]
-        .str.split(r"\bor\b", n=1).str[0]
-        .str.strip()
-    )
+    names = normalize_artists(df["artist"])
+    df["display_artist"] = names["display_artist"]
+    df["main_artist"] = names["main_artist"]
 
     keep_col = ['rank', 'title', 'main_artist', 'display_artist', 'year']
 
@@ -200,12 +168,8 @@ def clean_albums_us(input_path: str = "data/raw/albums_billboard.csv") -> pd.Dat
     """
     df = pd.read_csv(input_path)
 
-    df["sales"] = (
-        df["sales"].astype(str)
-        .str.replace(",", "", regex=False)
-        .replace("nan", "0")
-    )
-    df["sales"] = pd.to_numeric(df["sales"], errors="coerce")
+    # Weeks without reported sales count as 0.
+    df["sales"] = np.where(df["sales"].isna(), 0, parse_numeric_column(df["sales"], "sales"))
 
     df["is_best_performing"] = df["album"].str.contains("†", na=False)
 
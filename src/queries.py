@@ -0,0 +1,214 @@
+from collections import OrderedDict, namedtuple
+from typing import Mapping, Optional, Tuple
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from config import QUERY_CACHE_SIZE
+from src.analytics import DISPLAY_TIES, TOP_ALBUMS, TOP_ARTISTS, generate_yearly_stats, pick_display_names
+
+# How the Billboard tables credit soundtracks and cast recordings.
+SOUNDTRACK_ARTISTS = re.compile(r"\bsoundtrack\b|\bvarious artists\b|\bcast\b", re.IGNORECASE)
+SOUNDTRACK_ALBUMS = re.compile(r"\bsoundtrack\b|\bmotion picture\b|\boriginal score\b|\bcast recording\b", re.IGNORECASE)
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+def _prefix(counts: np.ndarray) -> np.ndarray:
+    """Return running totals over the year axis (last), with a leading zero: prefix[..., e] - prefix[..., s]."""
+    zeros = np.zeros(counts.shape[:-1] + (1,), dtype=np.int64)
+    return np.concatenate([zeros, np.cumsum(counts, axis=-1, dtype=np.int64)], axis=-1)
+
+
+class AnalyticsQueries:
+    """
+    Year-range queries over the processed tables, answered from per-year running totals.
+
+    Building counts each artist's hits and each (artist, spelling) pair's
+    rows per year and keeps their running totals, so a range's counts are
+    one subtraction per artist and pair, whatever the number of rows. The
+    Billboard table is kept in year order with each year's first row, so a
+    range is one slice. Every query returns what recomputing the analytics
+    over the range's rows gives (row labels and, for yearly_stats, dtypes
+    aside); results are memoized in an LRU keyed by the query and its
+    parameters. An instance answers for the tables it was built from, so
+    callers keep one per data version (the app caches it on data_version()).
+
+    Args:
+        tables: Table name -> DataFrame, as returned by load_tables(); uses
+            highest_grossing, top_hits and albums_us.
+        cache_size: Results kept, least recently used dropped first.
+    """
+
+    def __init__(self, tables: Mapping[str, pd.DataFrame], cache_size: int = QUERY_CACHE_SIZE) -> None:
+        hits = tables["top_hits"]
+        albums = tables["albums_us"]
+        hit_years = hits["year"].to_numpy(dtype=np.int64)
+        self.years = np.union1d(np.unique(hit_years), np.unique(albums["year"].to_numpy(dtype=np.int64)))
+
+        stats = generate_yearly_stats(tables["highest_grossing"], hits)
+        self._stats = stats.sort_values("year", kind="stable").reset_index(drop=True)
+        self._stats_years = self._stats["year"].to_numpy(dtype=np.int64)
+
+        # Hits and rows (for the spelling counts) per artist and year; artists in sort order, as groupby gives them.
+        artist_codes, artists = pd.factorize(hits["main_artist"].astype("str"), sort=True)
+        self._artists = pd.Index(np.asarray(artists, dtype=object), dtype=object, name="main_artist")
+        credited = artist_codes >= 0
+        year_codes = np.searchsorted(self.years, hit_years)
+        shape = (len(self._artists), len(self.years))
+        cells = artist_codes[credited] * shape[1] + year_codes[credited]
+        titled = hits["title"].notna().to_numpy(dtype=bool)[credited]
+        self._artist_rows = _prefix(np.bincount(cells, minlength=shape[0] * shape[1]).reshape(shape))
+        self._artist_hits = _prefix(np.bincount(cells[titled], minlength=shape[0] * shape[1]).reshape(shape))
+
+        # Rows per (artist, spelling) pair and year, pairs in order of first appearance, with each
+        # pair's first row per year so "first_seen" ties can be settled within any range.
+        display_codes, displays = pd.factorize(hits["display_artist"].astype("str"))
+        spelled = credited & (display_codes >= 0)
+        width = max(len(displays), 1)
+        pair_codes, pair_keys = pd.factorize(artist_codes[spelled] * width + display_codes[spelled])
+        self._pair_artist = pair_keys // width
+        self._pairs = pd.MultiIndex.from_arrays(
+            [self._artists[self._pair_artist], np.asarray(displays, dtype=object)[pair_keys % width]],
+            names=["main_artist", "display_artist"],
+        )
+        pair_shape = (len(self._pairs), len(self.years))
+        pair_cells = pair_codes * pair_shape[1] + year_codes[spelled]
+        self._pair_rows = _prefix(np.bincount(pair_cells, minlength=pair_shape[0] * pair_shape[1]).reshape(pair_shape))
+        first = np.full(pair_shape[0] * pair_shape[1], len(hits), dtype=np.int64)
+        np.minimum.at(first, pair_cells, np.flatnonzero(spelled))
+        self._pair_first = first.reshape(pair_shape)
+
+        # Billboard albums in year order, each year's rows starting at _album_starts.
+        columns = ["year", "album", "artist", "weeks_at_one"]
+        self._albums = albums.sort_values("year", kind="stable")[columns].reset_index(drop=True)
+        self._album_starts = np.searchsorted(self._albums["year"].to_numpy(dtype=np.int64), self.years)
+        self._soundtrack = (
+            self._albums["artist"].astype("str").str.contains(SOUNDTRACK_ARTISTS, na=False).to_numpy(dtype=bool)
+            | self._albums["album"].astype("str").str.contains(SOUNDTRACK_ALBUMS, na=False).to_numpy(dtype=bool)
+        )
+
+        # Results hold DataFrames only, never the instance, so dropping the instance frees them.
+        self._cache_size = cache_size
+        self._results: OrderedDict = OrderedDict()
+        self._hits = self._misses = 0
+        self._lock = threading.Lock()
+
+    def _span(self, start_year: Optional[int], end_year: Optional[int]) -> Tuple[int, int]:
+        """Return the year-axis positions [s, e) covering start_year..end_year (inclusive; None for open)."""
+        if start_year is not None and end_year is not None and start_year > end_year:
+            raise ValueError(f"start_year {start_year} is after end_year {end_year}")
+        s = 0 if start_year is None else int(np.searchsorted(self.years, start_year, side="left"))
+        e = len(self.years) if end_year is None else int(np.searchsorted(self.years, end_year, side="right"))
+        return s, max(s, e)
+
+    def _run(self, query: str, *params):
+        """Return a query's result from the LRU, running it on a miss."""
+        key = (query, *params)
+        with self._lock:
+            if key in self._results:
+                self._hits += 1
+                self._results.move_to_end(key)
+                return self._results[key]
+        result = getattr(self, f"_{query}")(*params)
+        with self._lock:
+            self._misses += 1
+            self._results[key] = result
+            while len(self._results) > self._cache_size:
+                self._results.popitem(last=False)
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """Return the LRU's hits, misses, maxsize and currsize."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._cache_size, len(self._results))
+
+    def top_artists(self, start_year: Optional[int] = None, end_year: Optional[int] = None,
+                    n: int = TOP_ARTISTS, ties: str = "alphabetical") -> pd.DataFrame:
+        """
+        Return the top n artists by hits charted from start_year to end_year.
+
+        Args:
+            start_year: First year (inclusive); None for the first year with data.
+            end_year: Last year (inclusive); None for the last year with data.
+            n: Artists to keep.
+            ties: Which spelling wins a tie, see pick_display_names.
+
+        Returns:
+            DataFrame with main_artist, total_hits, display_artist, as
+            generate_top_artists gives over the range's hits.
+        """
+        if ties not in DISPLAY_TIES:
+            raise ValueError(f"ties must be one of {', '.join(DISPLAY_TIES)}, got {ties!r}")
+        return self._run("top_artists", *self._span(start_year, end_year), n, ties).copy()
+
+    def _top_artists(self, s: int, e: int, n: int, ties: str) -> pd.DataFrame:
+        rows = self._artist_rows[:, e] - self._artist_rows[:, s]
+        present = rows > 0
+        # Same values in the same (sorted) order as groupby gives, so equal totals fall the same way.
+        totals = pd.Series(
+            self._artist_hits[present, e] - self._artist_hits[present, s],
+            index=self._artists[present],
+            name="total_hits",
+        )
+        top = totals.sort_values(ascending=False).head(n).reset_index()
+
+        keep = np.isin(self._pair_artist, self._artists.get_indexer(top["main_artist"]))
+        pair_rows = self._pair_rows[keep, e] - self._pair_rows[keep, s]
+        credits = self._pairs[keep].to_frame(index=False)
+        credits["rows"] = pair_rows
+        credits = credits[pair_rows > 0]
+        if ties == "first_seen":
+            first = self._pair_first[keep][pair_rows > 0, s:e].min(axis=1, initial=np.iinfo(np.int64).max)
+            credits = credits.iloc[np.argsort(first, kind="stable")]
+        top["display_artist"] = top["main_artist"].map(pick_display_names(credits, ties))
+        return top
+
+    def yearly_stats(self, start_year: Optional[int] = None, end_year: Optional[int] = None) -> pd.DataFrame:
+        """
+        Return the box office totals and unique songs of each year from start_year to end_year.
+
+        Args:
+            start_year: First year (inclusive); None for the first year with data.
+            end_year: Last year (inclusive); None for the last year with data.
+
+        Returns:
+            DataFrame with year, total_box_office, unique_songs_charted (dtypes
+            as over the full history).
+        """
+        if start_year is not None and end_year is not None and start_year > end_year:
+            raise ValueError(f"start_year {start_year} is after end_year {end_year}")
+        return self._run("yearly_stats", start_year, end_year).copy()
+
+    def _yearly_stats(self, start_year: Optional[int], end_year: Optional[int]) -> pd.DataFrame:
+        lo = 0 if start_year is None else np.searchsorted(self._stats_years, start_year, side="left")
+        hi = len(self._stats_years) if end_year is None else np.searchsorted(self._stats_years, end_year, side="right")
+        return self._stats.iloc[lo:hi].reset_index(drop=True)
+
+    def longest_reigning(self, start_year: Optional[int] = None, end_year: Optional[int] = None,
+                         n: int = TOP_ALBUMS, exclude_soundtracks: bool = False) -> pd.DataFrame:
+        """
+        Return the n albums with the most weeks at #1 from start_year to end_year.
+
+        Args:
+            start_year: First year (inclusive); None for the first year with data.
+            end_year: Last year (inclusive); None for the last year with data.
+            n: Albums to keep.
+            exclude_soundtracks: Leave out soundtracks and cast recordings
+                (SOUNDTRACK_ARTISTS, SOUNDTRACK_ALBUMS).
+
+        Returns:
+            DataFrame with year, album, artist, weeks_at_one, most weeks
+            first; ties keep year order, as generate_album_stats gives them.
+        """
+        return self._run("longest_reigning", *self._span(start_year, end_year), n, exclude_soundtracks).copy()
+
+    def _longest_reigning(self, s: int, e: int, n: int, exclude_soundtracks: bool) -> pd.DataFrame:
+        lo = self._album_starts[s] if s < len(self.years) else len(self._albums)
+        hi = self._album_starts[e] if e < len(self.years) else len(self._albums)
+        albums = self._albums.iloc[lo:hi]
+        if exclude_soundtracks:
+            albums = albums[~self._soundtrack[lo:hi]]
+        return albums.sort_values("weeks_at_one", ascending=False, kind="stable").head(n).reset_index(drop=True)
@@ -0,0 +1,161 @@
+from pathlib import Path
+from typing import Dict, Mapping, Optional
+import hashlib
+import json
+import os
+import logging
+import struct
+
+import pandas as pd
+
+from config import SNAPSHOT_PATH
+from src.columnar import SCHEMAS, csv_path, read_processed
+
+log = logging.getLogger(__name__)
+
+MAGIC = b"NRSNAP01"
+ALIGNMENT = 64
+_TRAILER = struct.Struct("<Q8s")
+
+
+def _arrow():
+    """Import pyarrow lazily; the snapshot is optional and the app falls back to per-table files."""
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401
+    return pa
+
+
+def write_snapshot(tables: Mapping[str, pd.DataFrame], path: Path = SNAPSHOT_PATH) -> str:
+    """
+    Write all processed tables into one memory-mappable Arrow IPC file.
+
+    Layout: one Arrow IPC file segment per table, each starting on a 64-byte
+    boundary, then a JSON index of {"version", "tables": {name: [offset, length]}}
+    and a fixed trailer (index length, magic). Every segment is a complete
+    Arrow IPC file, so readers can map the file once and open each table
+    zero-copy from its slice.
+
+    Args:
+        tables: Table name -> DataFrame (dtypes as in SCHEMAS).
+        path: Snapshot file to write (replaced atomically).
+
+    Returns:
+        The snapshot version: a hash of the table contents.
+    """
+    pa = _arrow()
+    index: Dict[str, list] = {}
+    digest = hashlib.sha256()
+    tmp = Path(path).with_name(Path(path).name + ".tmp")
+    with open(tmp, "wb") as f:
+        for name, df in tables.items():
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            data = sink.getvalue()
+            f.write(b"\0" * (-f.tell() % ALIGNMENT))
+            index[name] = [f.tell(), data.size]
+            f.write(data)
+            digest.update(name.encode("utf-8"))
+            digest.update(data)
+        version = digest.hexdigest()[:16]
+        footer = json.dumps({"version": version, "tables": index}).encode("utf-8")
+        f.write(footer)
+        f.write(_TRAILER.pack(len(footer), MAGIC))
+    os.replace(tmp, path)
+    return version
+
+
+def _read_index(path: Path) -> Dict:
+    """Read a snapshot's JSON index from the end of the file."""
+    with open(path, "rb") as f:
+        f.seek(-_TRAILER.size, os.SEEK_END)
+        length, magic = _TRAILER.unpack(f.read(_TRAILER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a processed-data snapshot")
+        f.seek(-_TRAILER.size - length, os.SEEK_END)
+        return json.loads(f.read(length))
+
+
+def data_version(path: Path = SNAPSHOT_PATH) -> Optional[str]:
+    """Return the version stored in the snapshot, or None when there is no snapshot."""
+    try:
+        return _read_index(path)["version"]
+    except (OSError, ValueError):
+        return None
+
+
+def read_snapshot(path: Path = SNAPSHOT_PATH) -> Dict[str, pd.DataFrame]:
+    """
+    Memory-map a snapshot and return its tables without copying column data.
+
+    String columns become pyarrow-backed pandas columns and numeric columns
+    without gaps become NumPy arrays over the same memory, both pointing into
+    the mapped file, so processes reading the same snapshot share its pages
+    through the OS page cache. Dictionary (categorical) columns are converted
+    to pandas categoricals, which copies only their small codes.
+
+    Args:
+        path: Snapshot file.
+
+    Returns:
+        Table name -> DataFrame.
+    """
+    pa = _arrow()
+    index = _read_index(path)
+    source = pa.memory_map(str(path), "r")
+    mapped = source.read_buffer()
+
+    def mapper(arrow_type):
+        if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+            return pd.ArrowDtype(arrow_type)
+        return None
+
+    tables = {}
+    for name, (offset, length) in index["tables"].items():
+        table = pa.ipc.open_file(mapped.slice(offset, length)).read_all()
+        tables[name] = table.to_pandas(types_mapper=mapper, split_blocks=True)
+    return tables
+
+
+def build_snapshot(path: Path = SNAPSHOT_PATH) -> Optional[str]:
+    """
+    Pack every processed table next to the snapshot file into it.
+
+    Args:
+        path: Snapshot file, in the processed data directory.
+
+    Returns:
+        The snapshot version, or None when pyarrow is not installed.
+    """
+    directory = Path(path).parent
+    tables = {name: read_processed(name, directory) for name in SCHEMAS if csv_path(name, directory).exists()}
+    try:
+        return write_snapshot(tables, path)
+    except ImportError as e:
+        log.warning(f"Skipping {Path(path).name}: {e}")
+        return None
+
+
+def load_tables(path: Path = SNAPSHOT_PATH) -> Dict[str, pd.DataFrame]:
+    """
+    Return all processed tables, from the snapshot when it is current.
+
+    The snapshot is skipped when it is missing, pyarrow is unavailable, or a
+    processed CSV is newer than it (e.g. events.csv edited after the build);
+    tables are then read one by one with read_processed().
+
+    Args:
+        path: Snapshot file.
+
+    Returns:
+        Table name -> DataFrame.
+    """
+    path = Path(path)
+    names = [name for name in SCHEMAS if csv_path(name, path.parent).exists()]
+    if path.exists() and all(csv_path(name, path.parent).stat().st_mtime <= path.stat().st_mtime for name in names):
+        try:
+            return read_snapshot(path)
+        except ImportError:
+            pass
+    return {name: read_processed(name, path.parent) for name in names}
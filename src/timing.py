@@ -0,0 +1,112 @@
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, Optional
+import logging
+import statistics
+import threading
+import time
+
+from config import APP_TIMING_BUDGET_MS, APP_TIMING_WINDOW
+
+log = logging.getLogger(__name__)
+
+
+class SectionTimer:
+    """
+    Wall-clock time of each named section of one app rerun.
+
+    A rerun is either a full script run or a fragment rerunning on its own.
+    Fragments time their sections with for_rerun() of the enclosing run's
+    timer, which is that timer while the enclosing run is in progress and a
+    new one once it has stopped.
+
+    Args:
+        enabled: When False, section() records nothing.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.sections: Dict[str, float] = {}
+        self.stopped = False
+        self._start = time.perf_counter()
+
+    def for_rerun(self) -> "SectionTimer":
+        """Return this timer while its run is in progress, else a new timer for a fragment-only rerun."""
+        return SectionTimer(enabled=self.enabled) if self.stopped else self
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        """Time the enclosed block under name; repeated sections add up."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sections[name] = self.sections.get(name, 0.0) + time.perf_counter() - start
+
+    def report(self) -> Dict[str, float]:
+        """Return each section's time and the rerun's total so far ("total"), in ms."""
+        report = {name: seconds * 1000 for name, seconds in self.sections.items()}
+        report["total"] = (time.perf_counter() - self._start) * 1000
+        return report
+
+    def stop(self) -> Dict[str, float]:
+        """End the rerun and return its report."""
+        self.stopped = True
+        return self.report()
+
+
+class TimingLog:
+    """
+    Recent rerun reports of one app process (all sessions), with per-section
+    percentiles and a p95 budget for the whole rerun.
+
+    Args:
+        window: Number of most recent reruns kept.
+        budget_ms: p95 budget for a rerun's total time, in ms.
+    """
+
+    def __init__(self, window: int = APP_TIMING_WINDOW, budget_ms: float = APP_TIMING_BUDGET_MS) -> None:
+        self.budget_ms = budget_ms
+        self._reports: Deque[Dict[str, float]] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, report: Dict[str, float]) -> None:
+        """Add one rerun's report (from SectionTimer.report()) and log it with the running p95."""
+        with self._lock:
+            self._reports.append(report)
+        p95 = self.percentile("total")
+        sections = ", ".join(f"{name} {ms:.1f}" for name, ms in report.items() if name != "total")
+        log.info(f"Rerun {report['total']:.1f} ms ({sections}); p95 {p95:.1f} ms")
+        if not self.within_budget():
+            log.warning(f"Rerun p95 {p95:.1f} ms is over the {self.budget_ms:.0f} ms budget")
+
+    def percentile(self, name: str, q: float = 0.95) -> Optional[float]:
+        """Return the q-th percentile of a section's recorded times in ms, or None before any."""
+        with self._lock:
+            values = sorted(report[name] for report in self._reports if name in report)
+        if not values:
+            return None
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Return reruns, p50, p95 and max (ms) per section, "total" included."""
+        with self._lock:
+            reports = list(self._reports)
+        summary = {}
+        for name in dict.fromkeys(name for report in reports for name in report):
+            values = sorted(report[name] for report in reports if name in report)
+            summary[name] = {
+                "reruns": len(values),
+                "p50": statistics.median(values),
+                "p95": values[min(len(values) - 1, int(0.95 * len(values)))],
+                "max": values[-1],
+            }
+        return summary
+
+    def within_budget(self) -> bool:
+        """Return whether the p95 rerun time is within the budget (True before any rerun)."""
+        p95 = self.percentile("total")
+        return p95 is None or p95 <= self.budget_ms
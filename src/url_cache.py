@@ -0,0 +1,99 @@
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+import sqlite3
+import time
+
+FilmKey = Tuple[str, int]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS film_urls (
+    title TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    url TEXT,
+    fetched_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (title, year)
+)
+"""
+
+
+class ResolvedUrlCache:
+    """
+    SQLite-backed cache of resolved film URLs keyed by (title, year).
+
+    A NULL url records that no article was found ("negative" entry). Entries
+    expire after ttl seconds (negative_ttl for negative entries), and the least
+    recently used rows are evicted once the table exceeds max_entries.
+
+    Args:
+        path: SQLite database file.
+        ttl: Lifetime in seconds of a resolved URL.
+        negative_ttl: Lifetime in seconds of a "no article" result.
+        max_entries: Maximum number of rows kept.
+    """
+
+    def __init__(self, path: Path, ttl: float, negative_ttl: float, max_entries: int) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.stats: Counter = Counter()
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute(SCHEMA)
+        self._conn.commit()
+
+    def get_many(self, keys: Iterable[FilmKey]) -> Dict[FilmKey, Optional[str]]:
+        """
+        Look up fresh entries.
+
+        Args:
+            keys: (title, year) pairs.
+
+        Returns:
+            Mapping of cached keys to their URL (None for negative entries).
+            Missing and expired keys are left out.
+        """
+        now = time.time()
+        found: Dict[FilmKey, Optional[str]] = {}
+        for key in keys:
+            row = self._conn.execute(
+                "SELECT url, fetched_at FROM film_urls WHERE title = ? AND year = ?", key
+            ).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                continue
+            url, fetched_at = row
+            if now - fetched_at > (self.ttl if url is not None else self.negative_ttl):
+                self.stats["expired"] += 1
+                continue
+            self.stats["negative_hits" if url is None else "hits"] += 1
+            found[key] = url
+        if found:
+            self._conn.executemany(
+                "UPDATE film_urls SET last_used = ? WHERE title = ? AND year = ?",
+                [(now, title, year) for title, year in found],
+            )
+            self._conn.commit()
+        return found
+
+    def put_many(self, entries: Mapping[FilmKey, Optional[str]]) -> None:
+        """Store resolved URLs (None for "no article") and evict beyond max_entries."""
+        if not entries:
+            return
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO film_urls (title, year, url, fetched_at, last_used) VALUES (?, ?, ?, ?, ?)",
+            [(title, year, url, now, now) for (title, year), url in entries.items()],
+        )
+        evicted = self._conn.execute(
+            "DELETE FROM film_urls WHERE rowid IN ("
+            " SELECT rowid FROM film_urls ORDER BY last_used DESC, fetched_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        ).rowcount
+        self.stats["evicted"] += max(evicted, 0)
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -0,0 +1,178 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+import re
+
+import requests
+
+from config import (
+    WIKI_API_URL, RESOLVE_BATCH_SIZE, FETCH_MAX_WORKERS,
+    URL_CACHE_ENABLED, URL_CACHE_PATH, URL_CACHE_TTL_DAYS, URL_CACHE_NEGATIVE_TTL_DAYS, URL_CACHE_MAX_ENTRIES,
+)
+from src.fetch import fetch_concurrently
+from src.http_client import default_client
+from src.url_cache import ResolvedUrlCache
+
+log = logging.getLogger(__name__)
+
+WIKI_PAGE_URL = "https://en.wikipedia.org/wiki/{title}"
+# Characters MediaWiki never allows in a page title; "|" would also split the batched titles parameter.
+ILLEGAL_TITLE_CHARS = re.compile(r"[#<>\[\]|{}]")
+FilmKey = Tuple[str, int]
+
+_url_cache: Optional[ResolvedUrlCache] = None
+
+
+def default_url_cache() -> Optional[ResolvedUrlCache]:
+    """Return the on-disk resolved URL cache configured in config.py, or None when disabled."""
+    global _url_cache
+    if URL_CACHE_ENABLED and _url_cache is None:
+        _url_cache = ResolvedUrlCache(
+            URL_CACHE_PATH,
+            ttl=URL_CACHE_TTL_DAYS * 86400,
+            negative_ttl=URL_CACHE_NEGATIVE_TTL_DAYS * 86400,
+            max_entries=URL_CACHE_MAX_ENTRIES,
+        )
+    return _url_cache
+
+
+def film_candidates(title: str, year: int) -> List[str]:
+    """
+    Return candidate page titles for a film, in order of preference.
+
+    Args:
+        title: Film title as scraped.
+        year: Release year.
+
+    Returns:
+        Titles for the Disney film, year film, film and bare title pages.
+    """
+    base_title = title.replace(" ", "_")
+    return [
+        f"{base_title}_({year}_Disney_film)",
+        f"{base_title}_({year}_film)",
+        f"{base_title}_(film)",
+        base_title,
+    ]
+
+
+def _query_titles(titles: List[str]) -> Optional[Dict[str, Optional[Tuple[str, bool]]]]:
+    """
+    Look up a batch of titles through the MediaWiki query API.
+
+    Args:
+        titles: Up to RESOLVE_BATCH_SIZE page titles.
+
+    Returns:
+        Mapping of each requested title to (final page title, whether a redirect
+        was followed), or None when the page is missing or a disambiguation page.
+        Returns None for the whole batch when the API call still fails after
+        the client's retries.
+    """
+    params = {
+        "action": "query",
+        "format": "json",
+        "formatversion": "2",
+        "redirects": "1",
+        "prop": "pageprops",
+        "ppprop": "disambiguation",
+        "titles": "|".join(titles),
+    }
+    try:
+        resp = default_client().get(WIKI_API_URL, params=params)
+        resp.raise_for_status()
+        query = resp.json().get("query", {})
+    except (requests.RequestException, ValueError) as e:
+        log.warning(f"Wikipedia API lookup failed for {len(titles)} titles: {e}")
+        return None
+
+    normalized = {n["from"]: n["to"] for n in query.get("normalized", [])}
+    redirects = {r["from"]: r["to"] for r in query.get("redirects", [])}
+    existing = {
+        page["title"]
+        for page in query.get("pages", [])
+        if not page.get("missing") and not page.get("invalid")
+        and "disambiguation" not in page.get("pageprops", {})
+    }
+
+    found: Dict[str, Optional[Tuple[str, bool]]] = {}
+    for title in titles:
+        name = normalized.get(title, title)
+        final = redirects.get(name, name)
+        found[title] = (final, final != name) if final in existing else None
+    return found
+
+
+def _pick(key: FilmKey, found: Dict[str, Optional[Tuple[str, bool]]]) -> Optional[str]:
+    """Return the URL of the first acceptable candidate for a film, if any."""
+    title, year = key
+    for candidate in film_candidates(title, year):
+        page = found.get(candidate)
+        if page is None:
+            continue
+        final, redirected = page
+        if not redirected:
+            return WIKI_PAGE_URL.format(title=candidate)
+        # A redirect only counts when it lands on a film article.
+        final_path = final.replace(" ", "_")
+        if f"({year}_film)" in final_path.lower() or "_(film)" in final_path.lower():
+            return WIKI_PAGE_URL.format(title=final_path)
+    return None
+
+
+def resolve_film_wiki_urls(
+    films: Iterable[FilmKey], cache: Optional[ResolvedUrlCache] = None
+) -> Dict[FilmKey, str]:
+    """
+    Resolve Wikipedia URLs for many films with batched API lookups.
+
+    Candidates are checked RESOLVE_BATCH_SIZE titles per request; for each film the
+    Disney film, year film, film and bare title pages are preferred in that order.
+    Candidates with characters not allowed in page titles (ILLEGAL_TITLE_CHARS)
+    are not sent. Films with no acceptable page fall back to the bare title URL.
+    Films found in the URL cache (including cached "no article" results) skip
+    the network.
+
+    Args:
+        films: (title, year) pairs; duplicates are resolved once.
+        cache: Resolved URL cache; defaults to default_url_cache().
+
+    Returns:
+        Mapping of (title, year) to article URL.
+    """
+    cache = cache or default_url_cache()
+    keys = list(dict.fromkeys((str(title), int(year)) for title, year in films))
+    picked: Dict[FilmKey, Optional[str]] = cache.get_many(keys) if cache else {}
+    pending = [key for key in keys if key not in picked]
+
+    titles = list(dict.fromkeys(c for key in pending for c in film_candidates(*key)))
+    # Titles that cannot name a page are known misses without asking.
+    found: Dict[str, Optional[Tuple[str, bool]]] = {t: None for t in titles if ILLEGAL_TITLE_CHARS.search(t)}
+    if found:
+        log.warning(f"Skipping {len(found)} candidate titles with characters not allowed in page titles")
+    titles = [t for t in titles if t not in found]
+    batches = [titles[i:i + RESOLVE_BATCH_SIZE] for i in range(0, len(titles), RESOLVE_BATCH_SIZE)]
+
+    for _, batch in fetch_concurrently(range(len(batches)), lambda i: _query_titles(batches[i]), FETCH_MAX_WORKERS):
+        if batch:
+            found.update(batch)
+
+    fresh = {}
+    for key in pending:
+        picked[key] = _pick(key, found)
+        # Only cache films whose candidates were all looked up; failed batches retry next run.
+        if all(c in found for c in film_candidates(*key)):
+            fresh[key] = picked[key]
+    if cache:
+        cache.put_many(fresh)
+        log.info(
+            f"Film URL cache: {cache.stats['hits']} hits, {cache.stats['negative_hits']} negative hits, "
+            f"{cache.stats['misses']} misses, {cache.stats['expired']} expired, {cache.stats['evicted']} evicted"
+        )
+
+    resolved = {}
+    for key in keys:
+        url = picked[key]
+        resolved[key] = url or WIKI_PAGE_URL.format(title=film_candidates(*key)[-1])
+    log.info(f"Resolved {len(keys)} film URLs with {len(batches)} API requests")
+    default_client().log_summary("HTTP")
+    return resolved
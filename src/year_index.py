@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class YearSlice:
+    """Everything the rewind section shows for one year, ready to render."""
+
+    movies: pd.DataFrame
+    hits: pd.DataFrame
+    best_film: Optional[pd.Series]
+    top_us_album: Optional[pd.Series]
+    global_album: Optional[pd.Series]
+    events: pd.DataFrame
+
+
+def _positions_by_year(df: pd.DataFrame) -> Dict[int, np.ndarray]:
+    """Return each year's row positions, in table order."""
+    if df.empty:
+        return {}
+    return {int(year): positions for year, positions in df.groupby("year", sort=False).indices.items()}
+
+
+def _first_position_by_year(df: pd.DataFrame, positions: np.ndarray) -> Dict[int, int]:
+    """Return, for each year, the first of the given row positions (in the order given) that falls in it."""
+    if not len(positions):
+        return {}
+    years = df["year"].to_numpy()[positions]
+    unique, first = np.unique(years, return_index=True)
+    return {int(year): int(positions[i]) for year, i in zip(unique, first)}
+
+
+def _mask_positions(mask: pd.Series) -> np.ndarray:
+    """Return the positions where a boolean (possibly nullable) mask is True."""
+    return np.flatnonzero(mask.to_numpy(dtype=bool, na_value=False))
+
+
+class YearIndex:
+    """
+    Per-year access to the processed tables, built once per process.
+
+    Building groups each table's row positions by year (one pass per table),
+    so a lookup touches only that year's rows, however large the tables get;
+    the resulting YearSlice is memoized. Each lookup returns exactly what
+    filtering the full tables by year gives: rows keep their table order, the
+    best film is the first "best film" row, the top US album is the year's
+    first album by (weeks_at_one desc, rank asc), the global album is the first
+    rank-1 row and events are sorted by importance (descending) within the year.
+
+    Args:
+        tables: Table name -> DataFrame, as returned by load_tables(); uses
+            highest_grossing, top_hits, awards, albums_us, albums_global and events.
+    """
+
+    def __init__(self, tables: Mapping[str, pd.DataFrame]) -> None:
+        empty = pd.DataFrame({"year": pd.Series(dtype="int64")})
+        self._movies = tables.get("highest_grossing", empty).reset_index(drop=True)
+        self._hits = tables.get("top_hits", empty).reset_index(drop=True)
+        self._awards = tables.get("awards", empty).reset_index(drop=True)
+        self._albums_us = tables.get("albums_us", empty).reset_index(drop=True)
+        self._albums_global = tables.get("albums_global", empty).reset_index(drop=True)
+        self._events = tables.get("events", empty).reset_index(drop=True)
+
+        self._movie_rows = _positions_by_year(self._movies)
+        self._hit_rows = _positions_by_year(self._hits)
+        self._event_rows = _positions_by_year(self._events)
+
+        awards, albums_us, albums_global = self._awards, self._albums_us, self._albums_global
+        self._best_film = (
+            _first_position_by_year(awards, _mask_positions(awards["category"].str.lower() == "best film"))
+            if len(awards) else {}
+        )
+        self._top_us_album = (
+            _first_position_by_year(
+                albums_us,
+                albums_us.sort_values(["weeks_at_one", "rank"], ascending=[False, True]).index.to_numpy(),
+            )
+            if len(albums_us) else {}
+        )
+        self._global_album = (
+            _first_position_by_year(albums_global, _mask_positions(albums_global["rank"] == 1))
+            if len(albums_global) else {}
+        )
+
+        self.max_importance = self._events["importance"].max() if len(self._events) else None
+        self._slices: Dict[int, YearSlice] = {}
+
+    def _rows(self, df: pd.DataFrame, rows: Dict[int, np.ndarray], year: int) -> pd.DataFrame:
+        return df.take(rows[year]) if year in rows else df.iloc[0:0]
+
+    def _row(self, df: pd.DataFrame, positions: Dict[int, int], year: int) -> Optional[pd.Series]:
+        return df.iloc[positions[year]] if year in positions else None
+
+    def __getitem__(self, year: int) -> YearSlice:
+        if year not in self._slices:
+            events = self._rows(self._events, self._event_rows, year)
+            if len(events):
+                events = events.sort_values("importance", ascending=False)
+            self._slices[year] = YearSlice(
+                movies=self._rows(self._movies, self._movie_rows, year),
+                hits=self._rows(self._hits, self._hit_rows, year),
+                best_film=self._row(self._awards, self._best_film, year),
+                top_us_album=self._row(self._albums_us, self._top_us_album, year),
+                global_album=self._row(self._albums_global, self._global_album, year),
+                events=events,
+            )
+        return self._slices[year]
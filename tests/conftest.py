@@ -0,0 +1,42 @@
+from contextlib import ExitStack
+
+import pytest
+
+from benchmarks.fixture_server import serve_cached_pages, serve_faults
+from src import http_client
+from src.fetch import HostLimiter
+from src.http_client import HttpClient
+
+
+def fast_client(origin=None, max_retries: int = 3, backoff_max: float = 5.0) -> HttpClient:
+    """Return a client with short backoff and no rate limit, so tests run fast."""
+    return HttpClient(
+        max_retries=max_retries, backoff_base=0.05, backoff_max=backoff_max, timeout=5,
+        pool_size=4, limiter=HostLimiter(4, 1000.0, 1000), origin=origin,
+    )
+
+
+@pytest.fixture
+def fault_server():
+    """Start fault-injecting servers for the test: call with the script of the first replies, get (base URL, handler)."""
+    with ExitStack() as stack:
+        yield lambda script=(): stack.enter_context(serve_faults(script))
+
+
+@pytest.fixture
+def cached_pages_server(tmp_path):
+    """Serve tmp_path/served laid out as the HTML cache; yields (directory, base URL, handler)."""
+    served = tmp_path / "served"
+    served.mkdir()
+    with serve_cached_pages(served) as (base_url, handler):
+        yield served, base_url, handler
+
+
+@pytest.fixture
+def route_default_client(monkeypatch):
+    """Point the process-wide default_client() at a local server for the test: call with its base URL."""
+    def route(base_url: str) -> HttpClient:
+        client = fast_client(origin=base_url)
+        monkeypatch.setattr(http_client, "_default_client", client)
+        return client
+    return route
@@ -0,0 +1,87 @@
+import gzip
+import json
+import os
+
+import pytest
+
+import config
+from benchmarks.fixture_server import Recording, request_key
+from scripts import download_data
+from src.html_cache import body_path, meta_path
+from src.partitions import PartitionStore
+
+REQUEST_VALIDATORS = {"etag": "If-None-Match", "last_modified": "If-Modified-Since"}
+
+
+@pytest.fixture
+def fetch(monkeypatch, cached_pages_server, route_default_client):
+    """fetch_with_cache with the HTML cache and revalidation on, talking to the cached-pages server."""
+    monkeypatch.setattr(download_data, "HTML_CACHE_ENABLED", True)
+    monkeypatch.setattr(download_data, "HTML_CACHE_REVALIDATE", True)
+    route_default_client(cached_pages_server[1])
+    return download_data.fetch_with_cache
+
+
+@pytest.mark.parametrize("etags, last_modified", [
+    pytest.param(True, False, id="ETag"),
+    pytest.param(False, True, id="Last-Modified"),
+    pytest.param(True, True, id="ETag and Last-Modified"),
+])
+def test_revalidation(fetch, cached_pages_server, tmp_path, etags, last_modified):
+    served, _, handler = cached_pages_server
+    handler.etags, handler.last_modified = etags, last_modified
+    page = served / "page.html.gz"
+    cache_path = tmp_path / "cache" / "page.html"
+    url = "https://en.wikipedia.org/page.html"
+
+    def meta() -> dict:
+        return json.loads(meta_path(cache_path).read_text(encoding="utf-8"))
+
+    # Nothing cached: a 200, stored with the validators the server sent.
+    page.write_bytes(gzip.compress(b"<p>first version</p>"))
+    assert fetch(url, cache_path) == "<p>first version</p>"
+    first = meta()
+    assert (bool(first["etag"]), bool(first["last_modified"])) == (etags, last_modified)
+
+    # Unchanged: a 304, answered from the cached body (altered here so reuse shows) with a new fetch time.
+    body_path(cache_path).write_bytes(gzip.compress(b"<p>cached copy</p>"))
+    assert fetch(url, cache_path) == "<p>cached copy</p>"
+    second = meta()
+    assert second["fetched_at"] > first["fetched_at"]
+    assert (second["etag"], second["last_modified"]) == (first["etag"], first["last_modified"])
+
+    # Changed on the server: a 200 whose body and validators replace the cached ones.
+    page.write_bytes(gzip.compress(b"<p>second version</p>"))
+    later = page.stat().st_mtime + 60
+    os.utime(page, (later, later))
+    assert fetch(url, cache_path) == "<p>second version</p>"
+    assert gzip.decompress(body_path(cache_path).read_bytes()) == b"<p>second version</p>"
+    third = meta()
+    assert (third["etag"], third["last_modified"]) != (first["etag"], first["last_modified"])
+
+    assert [int(status) for status, _ in handler.replies] == [200, 304, 200]
+    sent = {header for header in REQUEST_VALIDATORS.values() if header in handler.replies[1][1]}
+    on = {"etag": etags, "last_modified": last_modified}
+    assert sent == {header for name, header in REQUEST_VALIDATORS.items() if on[name]}
+
+
+def test_partition_rerun_revalidates(fetch, cached_pages_server, tmp_path, monkeypatch):
+    """A rerun over unchanged pages gets 304s and scrapes nothing: partitions hash the cached copies."""
+    served, _, handler = cached_pages_server
+    monkeypatch.setattr(download_data, "HTML_DIR", tmp_path / "html")
+    monkeypatch.setattr(download_data, "RAW_DIR", tmp_path)
+    recording = Recording(config.DATA_DIR / "fixtures")
+    (served / "wiki").mkdir()
+    for year in (1985, 1986):
+        url, _ = download_data.film_page(year)
+        (served / "wiki" / f"{year}_in_film.gz").write_bytes(recording.body_path(request_key(url)).read_bytes())
+
+    partitions = PartitionStore(tmp_path / "partitions")
+    runs = []
+    for _ in range(2):
+        handler.replies.clear()
+        store = download_data.new_document_store()
+        years = [year for year, _ in download_data.scrape_films_range(1985, 1986, store=store, partitions=partitions)]
+        runs.append((years, [int(status) for status, _ in handler.replies], store.stats["parses"]))
+
+    assert runs == [([1985, 1986], [200, 200], 2), ([], [304, 304], 0)]
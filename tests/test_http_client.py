@@ -0,0 +1,56 @@
+import time
+
+import pytest
+import requests
+
+from tests.conftest import fast_client
+
+
+def get(client, base_url):
+    """GET base_url/page; return (status or None when it raised, seconds taken)."""
+    start = time.perf_counter()
+    try:
+        status = client.get(f"{base_url}/page").status_code
+    except requests.RequestException:
+        status = None
+    return status, time.perf_counter() - start
+
+
+@pytest.mark.parametrize("script, status, attempts", [
+    pytest.param([(503, {}), (503, {})], 200, 3, id="503, 503 then 200"),
+    pytest.param(["drop"], 200, 2, id="dropped connection then 200"),
+    pytest.param([(500, {})] * 10, 500, 4, id="500 on every attempt gives up"),
+    pytest.param(["drop"] * 10, None, 4, id="dropped on every attempt raises"),
+    pytest.param([(404, {})], 404, 1, id="404 is not retried"),
+    pytest.param([(503, {"Retry-After": "3600"})], 503, 1, id="Retry-After beyond backoff_max is not waited"),
+])
+def test_retries(fault_server, script, status, attempts):
+    base_url, handler = fault_server(script)
+    client = fast_client()
+    got, _ = get(client, base_url)
+    assert got == status
+    assert len(handler.hits) == attempts
+    assert client.summary()["retries"] == attempts - 1
+
+
+def test_retry_after_is_honoured(fault_server):
+    base_url, handler = fault_server([(429, {"Retry-After": "1"})])
+    status, elapsed = get(fast_client(), base_url)
+    assert status == 200
+    assert len(handler.hits) == 2
+    assert elapsed >= 1.0
+
+
+def test_final_failure_is_counted(fault_server):
+    base_url, _ = fault_server(["drop"] * 10)
+    client = fast_client(max_retries=1)
+    get(client, base_url)
+    assert client.summary()["failures"] == 1
+
+
+def test_keep_alive_reuses_one_connection(fault_server):
+    base_url, handler = fault_server()
+    client = fast_client()
+    for i in range(20):
+        client.get(f"{base_url}/page{i}").raise_for_status()
+    assert len(handler.ports) == 1
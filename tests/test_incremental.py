@@ -0,0 +1,59 @@
+import random
+from typing import Dict
+
+import pandas as pd
+import pytest
+
+from benchmarks.incremental import assemble, random_year, update
+from src import analytics
+from src.incremental import AnalyticsPartials
+
+EDITS = 6
+
+
+def assert_matches_full(partials: AnalyticsPartials, tables: Dict[str, pd.DataFrame]) -> None:
+    """Fail unless every incremental table equals the full recompute."""
+    pd.testing.assert_frame_equal(partials.yearly_stats(), analytics.generate_yearly_stats(tables["gross"], tables["hits"]))
+    pd.testing.assert_frame_equal(partials.top_artists(), analytics.generate_top_artists(tables["hits"]))
+    full = analytics.generate_album_stats(tables["albums_us"], tables["albums_global"])
+    for incremental, expected in zip(partials.album_stats(), full):
+        # The longest-reigning albums carry the Billboard table's row labels, which are not written out.
+        pd.testing.assert_frame_equal(incremental.reset_index(drop=True), expected.reset_index(drop=True))
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_random_edits_match_full_recompute(seed, tmp_path):
+    """
+    Random history of edits (add, re-scrape or drop a year, or rebuild unchanged): after each,
+    update() recomputes exactly the edited year and every table equals the full recompute.
+    """
+    rng = random.Random(seed)
+    years = {year: random_year(year, rng.randint(1, 60), rng) for year in range(1985, 1985 + rng.randint(1, 8))}
+    tables = assemble(years)
+    partials = AnalyticsPartials(tmp_path)
+    assert update(partials, tables) == sorted(years)
+    assert_matches_full(partials, tables)
+
+    for _ in range(EDITS):
+        edit = rng.choice(("add", "rescrape", "drop", "none"))
+        if edit == "drop" and len(years) == 1:
+            edit = "none"
+        year = {
+            "add": max(years) + 1,
+            "rescrape": rng.choice(sorted(years)),
+            "drop": rng.choice(sorted(years)),
+            "none": None,
+        }[edit]
+        expected = [year] if edit in ("add", "rescrape") else []
+        if edit == "drop":
+            del years[year]
+        elif year is not None:
+            old = years.get(year)
+            years[year] = random_year(year, rng.randint(1, 60), rng)
+            if old is not None and all(old[name].equals(df) for name, df in years[year].items()):
+                expected = []
+        tables = assemble(years)
+        # A fresh store each time, as a new build process would open it.
+        partials = AnalyticsPartials(tmp_path)
+        assert update(partials, tables) == expected, f"{edit} {year}"
+        assert_matches_full(partials, tables)
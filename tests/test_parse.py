@@ -0,0 +1,44 @@
+import gzip
+
+import pandas as pd
+import pytest
+
+import config
+from benchmarks.fixture_server import Recording, request_key
+from scripts import download_data as dd
+from src.documents import DocumentStore
+
+# The recording shipped for the pipeline benchmark: pages in the layout of the live ones.
+FIXTURES_DIR = config.DATA_DIR / "fixtures"
+SCRAPERS = {
+    "highest_grossing": dd.scrape_highest_grossing,
+    "awards": dd.scrape_awards,
+    "top_hits": dd.scrape_top_hits,
+    "albums_billboard": dd.scrape_billboard_albums,
+    "albums_wiki": dd.scrape_wiki_albums,
+}
+
+
+@pytest.fixture(scope="module")
+def stores():
+    """One document store per backend over the recorded pages."""
+    recording = Recording(FIXTURES_DIR)
+
+    def page(url, cache_path):
+        path = recording.body_path(request_key(url))
+        if path is None:
+            pytest.skip(f"{url} is not in the recording")
+        return gzip.decompress(path.read_bytes()).decode("utf-8")
+
+    return {backend: DocumentStore(page, backend) for backend in ("bs4", "lxml")}
+
+
+@pytest.mark.parametrize("name, scrape", SCRAPERS.items(), ids=list(SCRAPERS))
+def test_backends_scrape_identical_frames(stores, name, scrape):
+    years = config.WIKI_ALBUM_YEARS if name == "albums_wiki" else range(config.YEAR_START, config.YEAR_END + 1)
+    rows = 0
+    for year in years:
+        expected = scrape(year, stores["bs4"])
+        pd.testing.assert_frame_equal(scrape(year, stores["lxml"]), expected, obj=f"{name} {year}")
+        rows += len(expected)
+    assert rows > 0
@@ -0,0 +1,97 @@
+import math
+
+import pytest
+
+from benchmarks.fixture_server import serve_wiki_api
+from src import wiki_links
+from src.url_cache import ResolvedUrlCache
+
+WIKI = "https://en.wikipedia.org/wiki/"
+FILLERS = [(f"Filler {i}", 2001) for i in range(40)]
+PAGES = {
+    "Aladdin (1992 Disney film)": {},
+    "Aladdin (1992 film)": {},
+    "Big (1988 film)": {},
+    "Titanic (1997 film)": {},
+    "Titanic": {"disambiguation": True},
+    "Top Gun (film)": {"redirect": "Top Gun"},
+    "Top Gun": {},
+    "Se7en (1995 film)": {"redirect": "Seven (1995 film)"},
+    "Seven (1995 film)": {},
+    "Rocky (film)": {"redirect": "Rocky (franchise)"},
+    "Rocky (franchise)": {},
+    "Rocky": {"disambiguation": True},
+    "Crash (film)": {"disambiguation": True},
+    "Crash": {"disambiguation": True},
+    "EXistenZ": {},
+    "Off (1997 film)": {},
+    "Face": {},
+    **{f"{title} ({year} film)": {} for title, year in FILLERS},
+}
+# Film -> URL expected, with the reason it is picked.
+EXPECTED = {
+    ("Aladdin", 1992): WIKI + "Aladdin_(1992_Disney_film)",   # Disney film page preferred
+    ("Big", 1988): WIKI + "Big_(1988_film)",                  # year film page
+    ("Titanic", 1997): WIKI + "Titanic_(1997_film)",          # bare title is a disambiguation page
+    ("Top Gun", 1986): WIKI + "Top_Gun",                      # redirect to a non-film page skipped
+    ("Se7en", 1995): WIKI + "Seven_(1995_film)",              # redirect to a film page followed
+    ("Rocky", 1976): WIKI + "Rocky",                          # nothing acceptable: bare title fallback
+    ("Crash", 2004): WIKI + "Crash",                          # disambiguation pages only
+    ("Nowhere Film", 1999): WIKI + "Nowhere_Film",            # missing everywhere
+    ("eXistenZ", 1999): WIKI + "eXistenZ",                    # found once normalized, URL as written
+    ("Face|Off", 1997): WIKI + "Face|Off",                    # never sent: "|" is not allowed in titles
+    **{(title, year): WIKI + f"{title.replace(' ', '_')}_({year}_film)" for title, year in FILLERS},
+}
+NAMED = [film for film in EXPECTED if film not in FILLERS]
+
+
+@pytest.fixture
+def wiki_api(monkeypatch, route_default_client):
+    """Serve PAGES from a stand-in MediaWiki query API that the default client talks to; yields its handler."""
+    monkeypatch.setattr(wiki_links, "URL_CACHE_ENABLED", False)
+    with serve_wiki_api(PAGES) as (base_url, handler):
+        route_default_client(base_url)
+        yield handler
+
+
+def sendable(films):
+    """Candidate titles of the films that may be sent to the API."""
+    return {
+        c for film in films for c in wiki_links.film_candidates(*film) if not wiki_links.ILLEGAL_TITLE_CHARS.search(c)
+    }
+
+
+def check_calls(handler, films, expected_calls=None):
+    """Check the number of API calls, their size, and that only candidate titles were sent, as sent."""
+    titles = sendable(films)
+    if expected_calls is None:
+        expected_calls = math.ceil(len(titles) / wiki_links.RESOLVE_BATCH_SIZE)
+    assert len(handler.calls) == expected_calls
+    assert max((len(call) for call in handler.calls), default=0) <= wiki_links.RESOLVE_BATCH_SIZE
+    assert {title for call in handler.calls for title in call} <= titles
+
+
+@pytest.mark.parametrize("films", [
+    pytest.param(NAMED, id="redirects, disambiguation, missing pages"),
+    pytest.param(list(EXPECTED), id="films split into batches"),
+])
+def test_resolve(wiki_api, films):
+    assert wiki_links.resolve_film_wiki_urls(films, cache=None) == {film: EXPECTED[film] for film in films}
+    check_calls(wiki_api, films)
+
+
+def test_title_with_pipe_is_not_sent(wiki_api):
+    films = [("Face|Off", 1997), ("Big", 1988)]
+    assert wiki_links.resolve_film_wiki_urls(films, cache=None) == {film: EXPECTED[film] for film in films}
+    check_calls(wiki_api, films, expected_calls=1)
+
+
+def test_cached_films_skip_the_api(wiki_api, tmp_path):
+    films = list(EXPECTED)
+    cache = ResolvedUrlCache(tmp_path / "film_urls.sqlite", ttl=3600, negative_ttl=3600, max_entries=1000)
+    assert wiki_links.resolve_film_wiki_urls(films, cache=cache) == EXPECTED
+    check_calls(wiki_api, films)
+
+    wiki_api.calls.clear()
+    assert wiki_links.resolve_film_wiki_urls(films, cache=cache) == EXPECTED
+    assert wiki_api.calls == []